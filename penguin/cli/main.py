@@ -3,14 +3,12 @@ Main CLI entry point for PENGUIN
 Provides commands for data collection, analysis, and management
 """
 
-import asyncio
 import click
 from typing import Optional
 
-from penguin.data.registry import registry
-from penguin.data.storage.database import db
-from penguin.data.storage.store import store
-from penguin.core.config import config
+# Only lightweight imports at module level: each command imports what it uses,
+# so `penguin --help` doesn't pay for SQLAlchemy, database drivers or collectors
+from penguin.core.constants import DataCategory
 
 
 @click.group()
@@ -21,13 +19,23 @@ def cli():
 
 
 @cli.command()
-def init():
+@click.option('--timescale/--no-timescale', 'use_timescale', default=False,
+              help='Convert data_points to a TimescaleDB hypertable with aggregates')
+def init(use_timescale: bool):
     """Initialize database and create tables"""
+    from penguin.data.storage.database import db
+    from penguin.data.storage import timescale
+    # Registers indicator_snapshots with the model metadata before create_tables()
+    from penguin.data.storage import indicators  # noqa: F401
+
     click.echo("Initializing PENGUIN database...")
 
     try:
         db.connect()
         db.create_tables()
+        if use_timescale:
+            click.echo("Setting up TimescaleDB hypertable and continuous aggregates...")
+            timescale.timescale.setup()
         click.echo("Database initialized successfully!")
     except Exception as e:
         click.echo(f"Error initializing database: {e}", err=True)
@@ -43,10 +51,9 @@ def collectors():
 @collectors.command('list')
 def list_collectors():
     """List all available collectors"""
-    click.echo("Discovering collectors...")
-    registry.auto_discover()
+    from penguin.data.manifest import manifest
 
-    collectors_list = registry.list_collectors()
+    collectors_list = manifest.list_collectors()
 
     if not collectors_list:
         click.echo("No collectors found.")
@@ -71,13 +78,13 @@ def list_collectors():
 @click.option('--symbol', '-s', multiple=True, help='Stock symbols to test')
 def test_collector(collector_name: str, symbol: tuple):
     """Test a specific collector"""
-    click.echo(f"Testing collector: {collector_name}")
+    import asyncio
+    from penguin.data.manifest import manifest
 
-    # Discover collectors
-    registry.auto_discover()
+    click.echo(f"Testing collector: {collector_name}")
 
-    # Get the collector
-    collector = registry.get_collector(collector_name)
+    # Get the collector (imports only its module)
+    collector = manifest.get_collector(collector_name)
 
     if not collector:
         click.echo(f"Collector '{collector_name}' not found", err=True)
@@ -124,17 +131,48 @@ def test_collector(collector_name: str, symbol: tuple):
 
 
 @cli.command()
-@click.argument('collector_name')
+@click.argument('collector_name', required=False)
+@click.option('--all', 'all_collectors', is_flag=True, help='Run every enabled collector concurrently')
+@click.option('--category', '-c', type=click.Choice([c.value for c in DataCategory]),
+              help='Run every enabled collector in a category concurrently')
+@click.option('--timeout', '-t', default=None, type=float,
+              help='Per-collector timeout in seconds (fan-out mode)')
 @click.option('--symbol', '-s', multiple=True, help='Stock symbols to collect')
 @click.option('--limit', '-l', default=100, help='Number of items to collect')
 @click.option('--save/--no-save', default=True, help='Save to database')
-def collect(collector_name: str, symbol: tuple, limit: int, save: bool):
-    """Collect data from a specific collector"""
+@click.option('--bulk/--no-bulk', default=True, help='Batched COPY/multi-row insert with dedupe')
+@click.option('--cache/--no-cache', 'use_cache', default=False,
+              help='Reuse results fetched within the source TTL instead of collecting again')
+@click.option('--async-db/--sync-db', default=True,
+              help='Fan-out mode: save each collector\'s results as they arrive on the async engine')
+@click.option('--spool/--no-spool', 'use_spool', default=True,
+              help='Queue results in the local write-ahead spool before writing to the database')
+def collect(collector_name: Optional[str], all_collectors: bool, category: Optional[str],
+            timeout: Optional[float], symbol: tuple, limit: int, save: bool, bulk: bool,
+            use_cache: bool, async_db: bool, use_spool: bool):
+    """Collect data from a collector, or from many with --all/--category"""
+    import asyncio
+    from penguin.core.cache import get_cache
+    from penguin.core.config import config
+    from penguin.data.manifest import manifest
+    from penguin.data.storage.bulk import save_data_points_bulk
+    from penguin.data.storage.database import db
+    from penguin.data.storage.store import store
+
+    if all_collectors or category:
+        if collector_name:
+            raise click.UsageError("Pass a collector name or --all/--category, not both")
+        _collect_many(category, timeout or config.COLLECTOR_TIMEOUT_SECONDS,
+                      list(symbol) if symbol else None, limit, save, bulk, use_cache, async_db,
+                      use_spool)
+        return
+    if not collector_name:
+        raise click.UsageError("Missing collector name (or use --all/--category)")
+
     click.echo(f"Running collector: {collector_name}")
 
-    # Discover and get collector
-    registry.auto_discover()
-    collector = registry.get_collector(collector_name)
+    # Get collector (imports only its module)
+    collector = manifest.get_collector(collector_name)
 
     if not collector:
         click.echo(f"Collector '{collector_name}' not found", err=True)
@@ -144,17 +182,43 @@ def collect(collector_name: str, symbol: tuple, limit: int, save: bool):
     symbols = list(symbol) if symbol else None
 
     try:
-        data = asyncio.run(collector.collect(symbols=symbols, limit=limit))
+        def fetch():
+            return asyncio.run(collector.collect(symbols=symbols, limit=limit))
+
+        if use_cache:
+            cache = get_cache()
+            data = cache.get_or_fetch(
+                collector_name, fetch,
+                symbol=','.join(sorted(symbols)) if symbols else None,
+                ttl=cache.ttl_for(collector_name, getattr(collector, 'frequency', None)),
+                limit=limit,
+            )
+        else:
+            data = fetch()
         click.echo(f"Collected {len(data)} data points")
 
-        if save and data:
+        if save and data and use_spool:
+            from penguin.data.storage.spool import Spool
+
+            # Spooled data survives a database outage; status reflects collection only
+            spool = Spool()
+            spool.append(data)
+            _flush_spool(spool)
+            _record_status(collector_name, success=True)
+        elif save and data:
             # Ensure database is connected
             db.connect()
 
             # Save to database
             click.echo("Saving to database...")
-            saved_count = store.save_data_points(data)
-            click.echo(f"Saved {saved_count} data points to database!")
+            if bulk:
+                saved_count = save_data_points_bulk(data)
+                skipped = len(data) - saved_count
+                click.echo(f"Saved {saved_count} data points to database!"
+                           + (f" ({skipped} duplicates skipped)" if skipped else ""))
+            else:
+                saved_count = store.save_data_points(data)
+                click.echo(f"Saved {saved_count} data points to database!")
 
             # Update collector status
             store.update_collector_status(collector_name, success=True)
@@ -172,23 +236,446 @@ def collect(collector_name: str, symbol: tuple, limit: int, save: bool):
         raise
 
 
+def _flush_spool(spool) -> bool:
+    """Try to drain the spool now; on failure the data stays queued for `penguin spool flush`"""
+    from penguin.data.storage.spool import SpoolFlusher
+
+    click.echo("Saving to database...")
+    try:
+        result = SpoolFlusher(spool).flush()
+    except Exception as e:
+        pending = spool.pending()
+        click.echo(f"Database write failed ({e}); {pending['points']} data points kept in the "
+                   f"spool, run `penguin spool flush` to retry", err=True)
+        return False
+
+    click.echo(f"Saved {result.inserted} data points to database!"
+               + (f" ({result.duplicates} already-ingested batches skipped)" if result.duplicates else ""))
+    return True
+
+
+def _record_status(name: str, success: bool, error: Optional[str] = None):
+    """Collector status update that doesn't fail the command when the database is down"""
+    from penguin.data.storage.store import store
+
+    try:
+        store.update_collector_status(name, success=success, error=error)
+    except Exception as e:
+        click.echo(f"Could not record status for {name}: {e}", err=True)
+
+
+def _collect_many(category: Optional[str], timeout: float, symbols: Optional[list],
+                  limit: int, save: bool, bulk: bool, use_cache: bool, async_db: bool,
+                  use_spool: bool):
+    """Fan out to every enabled (matching) collector in one event loop"""
+    import asyncio
+    import time
+    from penguin.core.cache import get_cache
+    from penguin.data.fanout import collect_concurrently
+    from penguin.data.manifest import manifest
+    from penguin.data.storage.bulk import save_data_points_bulk
+    from penguin.data.storage.database import db
+    from penguin.data.storage.store import store
+
+    collectors_to_run = []
+    for info in manifest.list_collectors():
+        if not info['enabled'] or (category and info['category'] != category):
+            continue
+        collector = manifest.get_collector(info['name'])
+        if collector is not None:
+            collectors_to_run.append(collector)
+
+    if not collectors_to_run:
+        click.echo("No matching collectors.", err=True)
+        return
+
+    click.echo(f"Running {len(collectors_to_run)} collectors concurrently "
+               f"(timeout {timeout:.0f}s each)...")
+
+    # Spooled or async saves overlap with the collectors still running
+    spool = None
+    if save and use_spool:
+        from penguin.data.storage.spool import Spool
+        spool = Spool()
+    write_async = save and async_db and spool is None
+    if write_async:
+        from penguin.data.storage.async_store import async_store
+
+    async def run():
+        data, results, writes = [], [], {}
+        try:
+            async for result in collect_concurrently(
+                    collectors_to_run, timeout, cache=get_cache() if use_cache else None,
+                    symbols=symbols, limit=limit):
+                status = f"{len(result.data)} points" if result.ok else f"FAILED ({result.error})"
+                click.echo(f"  {result.name:24s} {result.seconds:7.2f}s  {status}")
+                data.extend(result.data)
+                results.append(result)
+                if spool is not None and result.data:
+                    spool.append(result.data)
+                elif write_async and result.data:
+                    writes[result.name] = asyncio.create_task(async_store.save_data_points(result.data))
+            # One failed write must not hide the others' counts
+            outcomes = await asyncio.gather(*writes.values(), return_exceptions=True)
+        finally:
+            if write_async:
+                await async_store.database.dispose()
+
+        saved, write_errors = 0, {}
+        for name, outcome in zip(writes, outcomes):
+            if isinstance(outcome, Exception):
+                write_errors[name] = f"save failed: {type(outcome).__name__}: {outcome}"
+            else:
+                saved += outcome
+        return data, results, saved, write_errors
+
+    start = time.perf_counter()
+    data, results, saved_count, write_errors = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r.ok]
+    click.echo(f"\nCollected {len(data)} data points from {len(results) - len(failed)}/"
+               f"{len(results)} collectors in {elapsed:.2f}s "
+               f"(sum of collector times {sum(r.seconds for r in results):.2f}s)")
+
+    if not save:
+        return
+
+    if spool is not None:
+        _flush_spool(spool)
+        for result in results:
+            _record_status(result.name, success=result.ok, error=result.error)
+        return
+
+    db.connect()
+    if write_async:
+        click.echo(f"Saved {saved_count} data points to database!")
+        for name, error in write_errors.items():
+            click.echo(f"  {name}: {error}", err=True)
+    elif data:
+        # One batched write for all collectors
+        click.echo("Saving to database...")
+        saved_count = save_data_points_bulk(data) if bulk else store.save_data_points(data)
+        click.echo(f"Saved {saved_count} data points to database!")
+
+    for result in results:
+        error = result.error or write_errors.get(result.name)
+        store.update_collector_status(result.name, success=error is None, error=error)
+
+
+@cli.command()
+@click.option('--only', '-o', multiple=True, help='Collector names to schedule (default: all enabled)')
+@click.option('--limit', '-l', default=100, help='Number of items per run')
+@click.option('--jitter', default=0.1, help='Random fraction of the interval added to each tick')
+@click.option('--report-interval', default=60, help='Seconds between lag reports')
+@click.option('--async-db/--sync-db', default=True,
+              help='Write batches on the pooled async engine instead of a worker thread')
+@click.option('--spool/--no-spool', 'use_spool', default=False,
+              help='Queue batches in the write-ahead spool and drain it in the background')
+@click.option('--flush-interval', default=10.0, help='Seconds between spool flushes (with --spool)')
+def daemon(only: tuple, limit: int, jitter: float, report_interval: int, async_db: bool,
+           use_spool: bool, flush_interval: float):
+    """Run collectors continuously at their declared frequency"""
+    import asyncio
+    import signal
+    from penguin.data.manifest import manifest
+    from penguin.data.scheduler import CollectionScheduler, format_metrics, interval_for
+    from penguin.data.storage.bulk import save_data_points_bulk
+    from penguin.data.storage.database import db
+    from penguin.data.storage.store import store
+
+    db.connect()
+
+    def on_status(name: str, success: bool, error: Optional[str]):
+        store.update_collector_status(name, success=success, error=error)
+
+    if use_spool:
+        from penguin.data.storage.spool import Spool, SpoolFlusher, spool_data_points
+        spool = Spool()
+        flusher = SpoolFlusher(spool)
+        # Collectors only wait for a local append; the flusher absorbs database latency
+        save = lambda batch: spool_data_points(batch, spool)
+        async_db = False
+    elif async_db:
+        from penguin.data.storage.async_store import async_store
+        save = async_store.save_data_points
+    else:
+        save = save_data_points_bulk
+    fallback = None
+    if not use_spool:
+        from penguin.data.storage.spool import Spool
+        # Batches the database keeps rejecting are kept for `penguin spool flush`
+        fallback = Spool().append
+    scheduler = CollectionScheduler(save, on_status=on_status, jitter=jitter, fallback=fallback)
+
+    for info in manifest.list_collectors():
+        name = info['name']
+        if (only and name not in only) or (not only and not info['enabled']):
+            continue
+        collector = manifest.get_collector(name)
+        if collector is None:
+            continue
+        if scheduler.add(collector, limit=limit):
+            click.echo(f"  {name}: every {interval_for(collector):.0f}s")
+        else:
+            click.echo(f"  {name}: on demand (not scheduled)")
+
+    if not scheduler.jobs:
+        click.echo("No collectors to schedule.", err=True)
+        return
+
+    def report(sched: CollectionScheduler):
+        click.echo("\n" + "\n".join(format_metrics(sched)))
+
+    async def drain():
+        try:
+            result = await asyncio.to_thread(flusher.flush)
+            if result.batches:
+                click.echo(f"Flushed {result.batches} spooled batches ({result.inserted} new points)")
+        except Exception as e:
+            click.echo(f"Spool flush failed, will retry: {e}", err=True)
+
+    async def flush_loop():
+        while True:
+            await asyncio.sleep(flush_interval)
+            await drain()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, scheduler.stop)
+        flushing = asyncio.create_task(flush_loop()) if use_spool else None
+        try:
+            await scheduler.run(report=report, report_interval=report_interval)
+        finally:
+            if flushing is not None:
+                flushing.cancel()
+                await asyncio.gather(flushing, return_exceptions=True)
+                # Final drain; anything left stays spooled for the next run
+                await drain()
+            if async_db:
+                await async_store.database.dispose()
+
+    click.echo(f"\nScheduling {len(scheduler.jobs)} collectors (Ctrl+C to stop)...")
+    asyncio.run(main())
+    report(scheduler)
+
+
+@cli.command()
+@click.argument('output_dir', type=click.Path(file_okay=False))
+@click.option('--format', '-f', 'fmt', type=click.Choice(['parquet', 'arrow']), default='parquet',
+              help='Parquet or Arrow IPC files')
+@click.option('--source', help='Filter by source')
+@click.option('--data-type', help='Filter by data type')
+@click.option('--symbol', '-s', help='Filter by symbol')
+@click.option('--since', type=click.DateTime(), help='Earliest timestamp to export')
+@click.option('--chunk-size', type=int, default=None, help='Rows per cursor fetch / file')
+@click.option('--full', is_flag=True, help='Ignore the saved cursor and export everything again')
+def export(output_dir: str, fmt: str, source: Optional[str], data_type: Optional[str],
+           symbol: Optional[str], since, chunk_size: Optional[int], full: bool):
+    """Export data points to partitioned columnar files (incremental)"""
+    import time
+    try:
+        from penguin.data.storage.export import DataPointExporter
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise click.ClickException("penguin export needs pyarrow: pip install pyarrow")
+
+    exporter = DataPointExporter(output_dir, fmt=fmt, chunk_size=chunk_size)
+    state = {} if full else exporter.load_state()
+    if state.get('last_timestamp'):
+        click.echo(f"Resuming after {state['last_timestamp']}...")
+    else:
+        click.echo("Exporting all matching data points...")
+
+    start = time.perf_counter()
+    try:
+        summary = exporter.run(source=source, data_type=data_type, symbol=symbol,
+                               since=since, full=full)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    elapsed = time.perf_counter() - start
+
+    if not summary.rows:
+        click.echo("Nothing new to export.")
+        return
+    click.echo(f"Exported {summary.rows} rows to {summary.files} {fmt} files in {elapsed:.2f}s "
+               f"({summary.rows / elapsed:,.0f} rows/s)")
+    click.echo(f"Up to: {summary.last_timestamp}")
+
+
+@cli.command()
+@click.option('--yes', '-y', is_flag=True, help='Delete without asking')
+def dedupe(yes: bool):
+    """Delete duplicate data points so the dedupe index (and ON CONFLICT inserts) can be used"""
+    from sqlalchemy import text
+    from penguin.data.storage.bulk import DEDUPE_COLUMNS, count_duplicates_sql, remove_duplicates
+    from penguin.data.storage.database import db
+    from penguin.data.storage.models import DataPoint
+
+    db.connect()
+    table = DataPoint.__table__
+    with db.engine.connect() as conn:
+        duplicates = conn.execute(text(count_duplicates_sql(table))).scalar()
+    if duplicates and not yes:
+        click.confirm(f"Delete {duplicates} duplicate data points (keeping the first of each)?", abort=True)
+
+    deleted = remove_duplicates(db.engine, table)
+    click.echo(f"Deleted {deleted} duplicate data points; "
+               f"unique index on ({', '.join(DEDUPE_COLUMNS)}) is in place")
+
+
+@cli.group()
+def indicators():
+    """Typed technical-indicator snapshots"""
+    pass
+
+
+@indicators.command('migrate')
+@click.option('--strip', is_flag=True, help='Also remove migrated keys from data_points.extra_data')
+@click.option('--batch-size', default=5000, help='Data points per transaction')
+def migrate_indicators(strip: bool, batch_size: int):
+    """Copy technical_analysis JSON payloads into indicator_snapshots (resumable)"""
+    from penguin.data.storage.database import db
+    from penguin.data.storage.indicators import migrate_json
+    from penguin.data.storage.models import DataPoint
+
+    db.connect()
+    click.echo("Migrating technical_analysis payloads...")
+    stats = migrate_json(db.engine, DataPoint.__table__, batch_size=batch_size, strip=strip)
+    click.echo(f"Scanned {stats['rows']} data points, created {stats['migrated']} snapshots"
+               + (f", stripped {stats['stripped']} JSON payloads" if strip else ""))
+
+
+@indicators.command('screen')
+@click.argument('conditions', nargs=-1, required=True)
+@click.option('--hours', '-h', type=int, default=None, help='Ignore symbols without a snapshot this recent')
+@click.option('--symbol', '-s', multiple=True, help='Limit to these symbols')
+@click.option('--limit', '-l', type=int, default=None, help='Max results')
+def screen_indicators(conditions: tuple, hours: Optional[int], symbol: tuple, limit: Optional[int]):
+    """
+    Symbols whose latest snapshot matches every condition
+
+    \b
+    Example: penguin indicators screen bb_squeeze "rsi_14<30" "volume_ratio_10day>=1.5"
+    """
+    from penguin.data.storage.database import db
+    from penguin.data.storage.indicators import condition_column, parse_condition, screen
+
+    try:
+        for condition in conditions:
+            parse_condition(condition)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='CONDITIONS')
+
+    db.connect()
+    matches = screen(db.engine, conditions, hours=hours, symbols=list(symbol) or None, limit=limit)
+    if not matches:
+        click.echo("No symbols match.")
+        return
+
+    shown = dict.fromkeys(condition_column(condition) for condition in conditions)
+    click.echo(f"\n{len(matches)} symbols match:")
+    click.echo("=" * 80)
+    for row in matches:
+        values = ', '.join(f"{name}={getattr(row, name)}" for name in shown)
+        click.echo(f"{row.symbol:8s} {row.timestamp}  price={row.current_price}  {values}")
+
+
+@cli.group()
+def spool():
+    """Inspect and drain the write-ahead spool"""
+    pass
+
+
+@spool.command('status')
+def spool_status():
+    """Show data waiting in the spool"""
+    from penguin.data.storage.spool import Spool
+
+    queue = Spool()
+    pending = queue.pending()
+    click.echo(f"Spool: {queue.directory}")
+    click.echo(f"  Pending batches: {pending['batches']}")
+    click.echo(f"  Pending points: {pending['points']}")
+    click.echo(f"  Size: {pending['bytes'] / 1024:.1f} KB in {len(queue.segments())} segment(s)")
+
+
+@spool.command('flush')
+@click.option('--follow', '-f', is_flag=True, help='Keep draining as new batches arrive')
+@click.option('--interval', default=5.0, help='Seconds between flushes with --follow')
+def spool_flush(follow: bool, interval: float):
+    """Write spooled data to the database (each batch exactly once)"""
+    import time
+    from penguin.data.storage.spool import SpoolFlusher
+
+    flusher = SpoolFlusher()
+    while True:
+        try:
+            result = flusher.flush()
+            if result.batches or not follow:
+                click.echo(f"Flushed {result.batches} batches: {result.inserted} points inserted"
+                           + (f", {result.duplicates} already-ingested batches skipped"
+                              if result.duplicates else ""))
+        except Exception as e:
+            click.echo(f"Flush failed: {e}", err=True)
+            if not follow:
+                raise click.Abort()
+        if not follow:
+            return
+        time.sleep(interval)
+
+
 @cli.command()
 @click.option('--symbol', '-s', help='Filter by symbol')
 @click.option('--source', help='Filter by source')
 @click.option('--hours', '-h', default=24, help='Hours to look back')
 @click.option('--limit', '-l', default=100, help='Max results')
-def query(symbol: Optional[str], source: Optional[str], hours: int, limit: int):
+@click.option('--resolution', '-r', default='raw',
+              help='Bucket size (e.g. 5m, 1h); served from TimescaleDB aggregates when possible')
+@click.option('--cache/--no-cache', 'use_cache', default=False,
+              help='Reuse results of the same query from the last minute (may miss newer writes)')
+def query(symbol: Optional[str], source: Optional[str], hours: int, limit: int, resolution: str,
+          use_cache: bool):
     """Query collected data"""
+    from penguin.core.cache import get_cache
+    from penguin.data.storage import timescale
+    from penguin.data.storage.database import db
+
     click.echo(f"Querying data (last {hours} hours)...")
 
-    db.connect()
+    try:
+        bucket = timescale.parse_resolution(resolution)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--resolution')
 
-    data_points = store.get_recent_data_points(
-        symbol=symbol,
-        source=source,
-        hours=hours,
-        limit=limit
-    )
+    if timescale.aggregate_for(bucket) is None:
+        if bucket is not None:
+            click.echo("No TimescaleDB aggregates (run `penguin init --timescale`); showing raw rows")
+        db.connect()
+
+    def fetch():
+        # Plain dicts, so the result can be cached as JSON
+        return [timescale.point_dict(point) for point in timescale.get_recent_data_points(
+            symbol=symbol,
+            source=source,
+            hours=hours,
+            limit=limit,
+            resolution=bucket
+        )]
+
+    if use_cache:
+        data_points = get_cache().get_or_fetch(
+            'query',
+            fetch,
+            symbol=symbol,
+            source=source,
+            hours=hours,
+            limit=limit,
+            resolution=resolution,
+        )
+    else:
+        data_points = fetch()
 
     if not data_points:
         click.echo("No data found.")
@@ -198,8 +685,10 @@ def query(symbol: Optional[str], source: Optional[str], hours: int, limit: int):
     click.echo("=" * 80)
 
     for point in data_points[:10]:  # Show first 10
-        click.echo(f"\n{point.timestamp} | {point.symbol} | {point.source}")
-        click.echo(f"  Type: {point.data_type} | Value: {point.value}")
+        click.echo(f"\n{point['timestamp']} | {point['symbol']} | {point['source']}")
+        click.echo(f"  Type: {point['data_type']} | Value: {point['value']}")
+        if 'count' in point:
+            click.echo(f"  Count: {point['count']} | Avg sentiment: {point['avg_sentiment']}")
 
     if len(data_points) > 10:
         click.echo(f"\n... and {len(data_points) - 10} more")
@@ -208,6 +697,10 @@ def query(symbol: Optional[str], source: Optional[str], hours: int, limit: int):
 @cli.command()
 def status():
     """Show system status"""
+    from penguin.core.cache import get_cache
+    from penguin.core.config import config
+    from penguin.data.manifest import manifest
+
     click.echo("PENGUIN System Status")
     click.echo("=" * 80)
 
@@ -218,14 +711,27 @@ def status():
 
     # Check collectors
     click.echo("\nCollectors:")
-    registry.auto_discover()
-    collectors_list = registry.list_collectors()
+    collectors_list = manifest.list_collectors()
     enabled = [c for c in collectors_list if c['enabled']]
     click.echo(f"  Total: {len(collectors_list)}")
     click.echo(f"  Enabled: {len(enabled)}")
 
+    # Cache counters (shared across runs when Redis is the backend)
+    cache = get_cache()
+    stats = cache.summary()
+    click.echo(f"\nCache: {cache.backend.name}")
+    click.echo(f"  Hits: {stats['hits']:.0f} | Misses: {stats['misses']:.0f} | "
+               f"Coalesced: {stats['coalesced']:.0f} | Errors: {stats['errors']:.0f}")
+    click.echo(f"  Hit rate: {stats['hit_rate']:.1%} | Avg lookup: {stats['avg_lookup_ms']:.2f} ms | "
+               f"Avg fetch: {stats['avg_fetch_ms']:.1f} ms")
+
+    from penguin.data.storage.spool import Spool
+    pending = Spool().pending()
+    click.echo(f"\nSpool: {pending['batches']} batches / {pending['points']} points waiting")
+
     # Try to connect to database
     try:
+        from penguin.data.storage.database import db
         db.connect()
         click.echo("\nDatabase: CONNECTED")
     except Exception as e:
@@ -0,0 +1,355 @@
+"""
+Read-through cache
+Caches fetch results keyed by (source, symbol, params) in Redis, or in an
+in-process LRU when Redis is unavailable, with per-source TTLs and request
+coalescing so concurrent misses for one key trigger a single fetch; values
+are stored as JSON, so only plain data (dicts, lists, scalars, datetimes)
+is cached
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from penguin.core.config import config
+from penguin.core.constants import CollectionFrequency
+
+
+# TTLs for collectors that don't have an explicit CACHE_TTLS entry
+FREQUENCY_TTLS = {
+    CollectionFrequency.REALTIME: 5,
+    CollectionFrequency.HIGH: 60,
+    CollectionFrequency.MEDIUM: 900,
+    CollectionFrequency.LOW: 3600,
+    CollectionFrequency.ON_DEMAND: 0,
+}
+
+DEFAULT_SOURCE_TTLS = {
+    'yahoo_info': 3600,
+    'query': 60,
+}
+
+STATS_KEY = 'cache:stats'
+
+
+def encode(value: Any) -> bytes:
+    """JSON with datetimes tagged; Enums become their values; anything else raises TypeError"""
+    return json.dumps(value, default=_encode_default, separators=(',', ':')).encode()
+
+
+def decode(raw: bytes) -> Any:
+    return json.loads(raw, object_hook=_decode_object)
+
+
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return {'__datetime__': obj.isoformat()}
+    if isinstance(obj, date):
+        return {'__date__': obj.isoformat()}
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, 'item'):
+        # NumPy scalars
+        return obj.item()
+    raise TypeError(f"{type(obj).__name__} is not cacheable")
+
+
+def _decode_object(obj: Dict) -> Any:
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def parse_ttls(spec: str) -> Dict[str, int]:
+    """'yahoo_info=3600,reddit_wsb=60' -> {'yahoo_info': 3600, 'reddit_wsb': 60}"""
+    ttls = {}
+    for item in spec.split(','):
+        if '=' in item:
+            source, seconds = item.split('=', 1)
+            ttls[source.strip()] = int(seconds)
+    return ttls
+
+
+class LRUBackend:
+    """Bounded in-process store with per-entry expiry"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires and expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl if ttl else 0.0, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def add_stats(self, counters: Dict[str, float]):
+        """Stats are not shared across processes"""
+
+    def load_stats(self) -> Dict[str, float]:
+        return {}
+
+
+class RedisBackend:
+    """Redis store; counters are kept in a hash so `penguin status` can read them"""
+
+    name = 'redis'
+
+    def __init__(self, url: str, namespace: str = 'penguin'):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+        self.namespace = namespace
+        self.client.ping()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self.client.set(key, value, ex=ttl or None)
+
+    def delete(self, key: str):
+        self.client.delete(key)
+
+    def add_stats(self, counters: Dict[str, float]):
+        key = f'{self.namespace}:{STATS_KEY}'
+        pipe = self.client.pipeline()
+        for field, amount in counters.items():
+            if amount:
+                pipe.hincrbyfloat(key, field, amount)
+        pipe.execute()
+
+    def load_stats(self) -> Dict[str, float]:
+        raw = self.client.hgetall(f'{self.namespace}:{STATS_KEY}')
+        return {field.decode(): float(value) for field, value in raw.items()}
+
+
+class ReadThroughCache:
+    """Get-or-fetch cache with coalescing and hit/miss/latency counters"""
+
+    def __init__(self, backend=None, default_ttl: Optional[int] = None,
+                 ttls: Optional[Dict[str, int]] = None, namespace: str = 'penguin'):
+        self.backend = backend or LRUBackend(config.CACHE_MAX_ENTRIES)
+        self.default_ttl = config.CACHE_TTL_SECONDS if default_ttl is None else default_ttl
+        self.ttls = {**DEFAULT_SOURCE_TTLS, **(ttls if ttls is not None else parse_ttls(config.CACHE_TTLS))}
+        self.namespace = namespace
+
+        self.stats = self._empty_stats()
+        self._stats_lock = threading.Lock()
+
+        # In-flight fetches, for coalescing
+        self._pending: Dict[str, threading.Event] = {}
+        self._pending_lock = threading.Lock()
+        self._async_pending: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, float]:
+        return {'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0,
+                'lookup_seconds': 0.0, 'fetch_seconds': 0.0}
+
+    # --- Keys & TTLs -------------------------------------------------------
+
+    def make_key(self, source: str, symbol: Optional[str] = None, **params) -> str:
+        """Stable key for (source, symbol, params)"""
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        return f"{self.namespace}:{source}:{(symbol or '*').upper()}:{digest}"
+
+    def ttl_for(self, source: str, frequency: Optional[CollectionFrequency] = None) -> int:
+        """Explicit per-source TTL, else the collector frequency's TTL, else the default"""
+        if source in self.ttls:
+            return self.ttls[source]
+        if frequency is not None:
+            return FREQUENCY_TTLS[frequency]
+        return self.default_ttl
+
+    # --- Lookups -----------------------------------------------------------
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        start = time.perf_counter()
+        try:
+            raw = self.backend.get(key)
+        except Exception:
+            self._count(errors=1)
+            raw = None
+        self._count(lookup_seconds=time.perf_counter() - start)
+
+        if raw is None:
+            return False, None
+        try:
+            return True, decode(raw)
+        except ValueError:
+            # Written by an older version (or not by us at all)
+            self._count(errors=1)
+            return False, None
+
+    def _store(self, key: str, value: Any, ttl: int):
+        if ttl <= 0:
+            return
+        try:
+            self.backend.set(key, encode(value), ttl)
+        except Exception:
+            self._count(errors=1)
+
+    def get_or_fetch(self, source: str, fetch: Callable[[], Any], symbol: Optional[str] = None,
+                     ttl: Optional[int] = None, **params) -> Any:
+        """Return the cached value, or call fetch() once across concurrent threads"""
+        key = self.make_key(source, symbol, **params)
+        ttl = self.ttl_for(source) if ttl is None else ttl
+
+        found, value = self._lookup(key)
+        if found:
+            self._count(hits=1)
+            return value
+
+        with self._pending_lock:
+            event = self._pending.get(key)
+            leader = event is None
+            if leader:
+                event = self._pending[key] = threading.Event()
+
+        if not leader:
+            # Another thread is fetching this key; wait and read its result
+            event.wait()
+            found, value = self._lookup(key)
+            if found:
+                self._count(coalesced=1)
+                return value
+            return self._fetch(key, fetch, ttl)
+
+        try:
+            return self._fetch(key, fetch, ttl)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    async def aget_or_fetch(self, source: str, fetch: Callable[[], Awaitable[Any]],
+                            symbol: Optional[str] = None, ttl: Optional[int] = None,
+                            **params) -> Any:
+        """Async variant: concurrent misses await the first caller's fetch"""
+        key = self.make_key(source, symbol, **params)
+        ttl = self.ttl_for(source) if ttl is None else ttl
+
+        found, value = self._lookup(key)
+        if found:
+            self._count(hits=1)
+            return value
+
+        pending = self._async_pending.get(key)
+        if pending is not None:
+            self._count(coalesced=1)
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_pending[key] = future
+        try:
+            self._count(misses=1)
+            start = time.perf_counter()
+            value = await fetch()
+            self._count(fetch_seconds=time.perf_counter() - start)
+            self._store(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise; mark retrieved so an unawaited future doesn't warn
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._async_pending.pop(key, None)
+
+    def _fetch(self, key: str, fetch: Callable[[], Any], ttl: int) -> Any:
+        self._count(misses=1)
+        start = time.perf_counter()
+        value = fetch()
+        self._count(fetch_seconds=time.perf_counter() - start)
+        self._store(key, value, ttl)
+        return value
+
+    def invalidate(self, source: str, symbol: Optional[str] = None, **params):
+        self.backend.delete(self.make_key(source, symbol, **params))
+
+    # --- Stats -------------------------------------------------------------
+
+    def _count(self, **amounts: float):
+        with self._stats_lock:
+            for field, amount in amounts.items():
+                self.stats[field] += amount
+
+    def flush_stats(self):
+        """Push this process's counters to the shared backend"""
+        with self._stats_lock:
+            counters, self.stats = self.stats, self._empty_stats()
+        try:
+            self.backend.add_stats(counters)
+        except Exception:
+            pass
+
+    def summary(self) -> Dict[str, float]:
+        """Shared counters plus this process's unflushed ones, with derived rates"""
+        try:
+            totals = self.backend.load_stats()
+        except Exception:
+            totals = {}
+        stats = {field: totals.get(field, 0) + value for field, value in self.stats.items()}
+
+        lookups = stats['hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = (stats['hits'] + stats['coalesced']) / lookups if lookups else 0.0
+        stats['avg_lookup_ms'] = stats['lookup_seconds'] / lookups * 1000 if lookups else 0.0
+        stats['avg_fetch_ms'] = stats['fetch_seconds'] / stats['misses'] * 1000 if stats['misses'] else 0.0
+        return stats
+
+
+_cache: Optional[ReadThroughCache] = None
+
+
+def get_cache() -> ReadThroughCache:
+    """Process-wide cache: Redis when reachable (per CACHE_BACKEND), else the LRU"""
+    global _cache
+    if _cache is None:
+        backend = None
+        if config.CACHE_BACKEND in ('auto', 'redis'):
+            try:
+                backend = RedisBackend(config.REDIS_URL)
+            except Exception:
+                # Offline/test runs fall back to the in-process LRU
+                if config.CACHE_BACKEND == 'redis':
+                    raise
+        _cache = ReadThroughCache(backend)
+        atexit.register(_cache.flush_stats)
+    return _cache
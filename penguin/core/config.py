@@ -6,10 +6,23 @@ Loads settings from environment variables and config files
 import os
 from typing import Optional
 from pathlib import Path
-from dotenv import load_dotenv
+
+
+def _load_env():
+    """
+    Load the nearest .env file, searching up from this package like
+    python-dotenv's find_dotenv(); dotenv itself is only imported if one exists
+    """
+    for directory in Path(__file__).resolve().parents:
+        env_file = directory / '.env'
+        if env_file.is_file():
+            from dotenv import load_dotenv
+            load_dotenv(env_file)
+            return
+
 
 # Load .env file from project root
-load_dotenv()
+_load_env()
 
 
 class Config:
@@ -18,12 +31,18 @@ class Config:
     # Project paths
     BASE_DIR = Path(__file__).resolve().parent.parent.parent
     CONFIG_DIR = BASE_DIR / "config"
+    CACHE_DIR = Path(os.getenv('PENGUIN_CACHE_DIR', str(BASE_DIR / ".cache")))
 
     # Reddit API
     # IMPORTANT: Set these in .env file, NOT here!
     REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', '')
     REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET', '')
     REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'PENGUIN Stock Tracker v0.1')
+    REDDIT_REQUESTS_PER_MINUTE = int(os.getenv('REDDIT_REQUESTS_PER_MINUTE', '100'))  # OAuth client quota
+    REDDIT_COMMENT_THREADS = int(os.getenv('REDDIT_COMMENT_THREADS', '25'))  # Busiest threads harvested per run
+    REDDIT_COMMENT_CONCURRENCY = int(os.getenv('REDDIT_COMMENT_CONCURRENCY', '8'))  # Comment requests in flight
+    REDDIT_COMMENT_BUDGET_SECONDS = float(os.getenv('REDDIT_COMMENT_BUDGET_SECONDS', '60'))  # Per-run harvest time limit
+    TRENDING_CAPACITY = int(os.getenv('TRENDING_CAPACITY', '1000'))  # Tickers the trending ranking monitors
 
     # Options Flow APIs
     # IMPORTANT: Set these in .env file, NOT here!
@@ -42,6 +61,10 @@ class Config:
     DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost/penguin')
     TIMESCALE_URL = os.getenv('TIMESCALE_URL', DATABASE_URL)
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))  # Persistent connections in the async engine pool
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))  # Extra connections allowed under burst
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # Reconnect after this many seconds
 
     # Claude AI
     CLAUDE_API_KEY = os.getenv('CLAUDE_API_KEY', '')
@@ -50,10 +73,27 @@ class Config:
     # Data collection
     DEFAULT_COLLECTION_LIMIT = int(os.getenv('COLLECTION_LIMIT', '100'))
     RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    COLLECTOR_TIMEOUT_SECONDS = float(os.getenv('COLLECTOR_TIMEOUT_SECONDS', '120'))  # Per collector in fan-out runs
 
     # Storage
     DATA_RETENTION_DAYS = int(os.getenv('DATA_RETENTION_DAYS', '365'))
     CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '300'))
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'auto')  # auto (Redis if reachable), redis, memory
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1024'))  # In-process LRU size
+    CACHE_TTLS = os.getenv('CACHE_TTLS', '')  # Per-source overrides, e.g. "yahoo_info=3600,reddit_wsb=60"
+    SPOOL_DIR = Path(os.getenv('SPOOL_DIR', str(CACHE_DIR / "spool")))  # Write-ahead spool for collected data
+    SPOOL_SEGMENT_BYTES = int(os.getenv('SPOOL_SEGMENT_BYTES', str(64 * 1024 * 1024)))  # Rotate segments at this size
+    SPOOL_FSYNC = os.getenv('SPOOL_FSYNC', 'false').lower() == 'true'  # fsync each batch (survives power loss)
+    INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '5000'))  # Rows per bulk insert/COPY chunk
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '50000'))  # Rows per cursor fetch / export file
+    INDICATOR_STRIP_JSON = os.getenv('INDICATOR_STRIP_JSON', 'false').lower() == 'true'  # Drop snapshotted indicators from extra_data on ingest
+    SEEN_INDEX_CAPACITY = int(os.getenv('SEEN_INDEX_CAPACITY', '1000000'))  # Post IDs the Bloom filter is sized for
+    SEEN_POST_RETENTION_DAYS = int(os.getenv('SEEN_POST_RETENTION_DAYS', '7'))  # Forget analyzed posts older than this
+    TIMESCALE_COMPRESS_AFTER_DAYS = int(os.getenv('TIMESCALE_COMPRESS_AFTER_DAYS', '7'))
+
+    # Symbol universe (exchange listings used to validate tickers offline)
+    SYMBOL_UNIVERSE_REFRESH_HOURS = int(os.getenv('SYMBOL_UNIVERSE_REFRESH_HOURS', '24'))
+    INVALID_SYMBOL_TTL_HOURS = int(os.getenv('INVALID_SYMBOL_TTL_HOURS', '168'))
 
     @classmethod
     def validate(cls) -> bool:
@@ -0,0 +1,65 @@
+"""
+Rate limiting helpers shared by the async collectors
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Token bucket shared by concurrent coroutines hitting the same API"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        rate: tokens refilled per second
+        capacity: burst size (defaults to one second worth of tokens, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def per_minute(cls, requests: int, burst: Optional[float] = None) -> 'AsyncTokenBucket':
+        """Bucket sized from a requests-per-minute quota"""
+        return cls(rate=requests / 60.0, capacity=burst)
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available, then take them"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def sync_with_server(self, remaining: Optional[float], reset_seconds: Optional[float]):
+        """Respect the server's own view of the quota (e.g. X-Ratelimit-* headers)"""
+        if remaining is None:
+            return
+
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = min(self.tokens, remaining)
+
+        if remaining < 1 and reset_seconds:
+            self.blocked_until = max(self.blocked_until, now + reset_seconds)
@@ -0,0 +1 @@
+"""Data collection and storage for PENGUIN"""
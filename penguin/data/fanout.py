@@ -0,0 +1,67 @@
+"""
+Multi-collector fan-out
+Runs many collectors concurrently on one event loop, each with its own
+timeout and failure isolation, yielding results as they finish
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional
+
+from penguin.core.cache import ReadThroughCache
+
+
+class CollectorResult(NamedTuple):
+    """Outcome of one collector run"""
+    name: str
+    data: List[Dict[str, Any]]
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _run_one(collector, timeout: float, cache: Optional[ReadThroughCache],
+                   collect_kwargs: Dict[str, Any]) -> CollectorResult:
+    """Run one collector; timeouts and exceptions become a failed result"""
+    start = time.perf_counter()
+    try:
+        fetch = lambda: collector.collect(**collect_kwargs)
+        if cache is not None:
+            symbols = collect_kwargs.get('symbols')
+            params = {k: v for k, v in collect_kwargs.items() if k != 'symbols'}
+            coroutine = cache.aget_or_fetch(
+                collector.name, fetch,
+                symbol=','.join(sorted(symbols)) if symbols else None,
+                ttl=cache.ttl_for(collector.name, getattr(collector, 'frequency', None)),
+                **params,
+            )
+        else:
+            coroutine = fetch()
+
+        data = await asyncio.wait_for(coroutine, timeout=timeout)
+        return CollectorResult(collector.name, data or [], time.perf_counter() - start)
+    except asyncio.TimeoutError:
+        return CollectorResult(collector.name, [], time.perf_counter() - start,
+                               f"timed out after {timeout:.0f}s")
+    except Exception as e:
+        return CollectorResult(collector.name, [], time.perf_counter() - start,
+                               f"{type(e).__name__}: {e}")
+
+
+async def collect_concurrently(collectors: Iterable, timeout: float,
+                               cache: Optional[ReadThroughCache] = None,
+                               **collect_kwargs) -> AsyncIterator[CollectorResult]:
+    """Start every collector at once and yield results in completion order"""
+    tasks = [
+        asyncio.create_task(_run_one(collector, timeout, cache, collect_kwargs))
+        for collector in collectors
+    ]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
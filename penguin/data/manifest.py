@@ -0,0 +1,234 @@
+"""
+Collector manifest
+Reads collector metadata (name, category, frequency, requires_auth, enabled)
+straight from the collector sources with `ast`, caches it on disk keyed by
+file mtime, and imports a collector module only when that collector is used
+"""
+
+import ast
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from penguin.core.config import config
+
+
+COLLECTORS_DIR = Path(__file__).resolve().parent / 'collectors'
+BASE_CLASS = 'BaseCollector'
+MANIFEST_VERSION = 1
+
+# Class attributes copied into the manifest, with defaults for ones a collector omits
+METADATA_DEFAULTS = {
+    'name': None,
+    'category': None,
+    'frequency': None,
+    'requires_auth': False,
+    'enabled': True,
+    'rate_limit': None,
+}
+
+
+def _literal(node: ast.AST) -> Any:
+    """Value of a literal or an Enum member reference (DataCategory.SOCIAL -> 'social')"""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        from penguin.core import constants
+
+        enum_cls = getattr(constants, node.value.id, None)
+        member = getattr(enum_cls, node.attr, None) if enum_cls is not None else None
+        if member is None:
+            raise ValueError(f"Unresolvable attribute {node.value.id}.{node.attr}")
+        return member.value
+    return ast.literal_eval(node)
+
+
+def scan_source(path: Path, module: str) -> List[Dict[str, Any]]:
+    """Class definitions in one file: name, bases and literal metadata"""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    classes = []
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        metadata: Dict[str, Any] = {}
+        dynamic = []
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets, value = statement.targets, statement.value
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                targets, value = [statement.target], statement.value
+            else:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id in METADATA_DEFAULTS:
+                    try:
+                        metadata[target.id] = _literal(value)
+                    except (ValueError, TypeError):
+                        dynamic.append(target.id)
+
+        classes.append({
+            'class': node.name,
+            'module': module,
+            'bases': [base.id if isinstance(base, ast.Name) else getattr(base, 'attr', '')
+                      for base in node.bases],
+            'metadata': metadata,
+            # Non-literal metadata needs the module imported to be read
+            'dynamic': dynamic,
+        })
+
+    return classes
+
+
+class CollectorManifest:
+    """Collector metadata without imports; collectors are loaded on first use"""
+
+    def __init__(self, collectors_dir: Optional[Path] = None, cache_path: Optional[Path] = None):
+        self.collectors_dir = Path(collectors_dir or COLLECTORS_DIR)
+        self.cache_path = Path(cache_path or Path(config.CACHE_DIR) / 'collector_manifest.json')
+        self.package = 'penguin.data.collectors'
+
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._instances: Dict[str, Any] = {}
+
+    # --- Manifest ----------------------------------------------------------
+
+    def _module_name(self, path: Path) -> str:
+        relative = path.relative_to(self.collectors_dir).with_suffix('')
+        return '.'.join((self.package, *relative.parts))
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cached.get('files', {}) if cached.get('version') == MANIFEST_VERSION else {}
+
+    def _save_cache(self, files: Dict[str, Any]):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': files}, f)
+            tmp_path.replace(self.cache_path)
+        except OSError:
+            # A read-only cache dir only costs a re-scan next time
+            pass
+
+    def refresh(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Re-scan sources whose mtime/size changed and rebuild the collector entries"""
+        cached = {} if force else self._load_cache()
+        files: Dict[str, Any] = {}
+        changed = force
+
+        for path in sorted(self.collectors_dir.rglob('*.py')):
+            if path.name.startswith('_'):
+                continue
+            stat = path.stat()
+            key = str(path.relative_to(self.collectors_dir))
+            entry = cached.get(key)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                files[key] = entry
+                continue
+
+            try:
+                classes = scan_source(path, self._module_name(path))
+            except SyntaxError:
+                classes = []
+            files[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'classes': classes}
+            changed = True
+
+        if changed or files.keys() != cached.keys():
+            self._save_cache(files)
+
+        self._entries = self._resolve(files)
+        return self._entries
+
+    def _resolve(self, files: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Collector entries for every class that (transitively) subclasses BaseCollector"""
+        classes = {cls['class']: cls for entry in files.values() for cls in entry['classes']}
+
+        def is_collector(name: str, seen=()) -> bool:
+            cls = classes.get(name)
+            if cls is None or name in seen:
+                return False
+            return any(base == BASE_CLASS or is_collector(base, seen + (name,))
+                       for base in cls['bases'])
+
+        def inherited(cls: Dict[str, Any]) -> Dict[str, Any]:
+            metadata: Dict[str, Any] = {}
+            for base in cls['bases']:
+                if base in classes and base != cls['class']:
+                    metadata.update(inherited(classes[base]))
+            metadata.update(cls['metadata'])
+            return metadata
+
+        entries = {}
+        for cls in classes.values():
+            if not is_collector(cls['class']):
+                continue
+            metadata = {**METADATA_DEFAULTS, **inherited(cls)}
+            if cls['dynamic']:
+                metadata = self._import_metadata(cls, metadata)
+                if metadata is None:
+                    continue
+            elif not metadata['name']:
+                # Intermediate base class without a name of its own
+                continue
+            entries[metadata['name']] = {**metadata, 'module': cls['module'], 'class': cls['class']}
+
+        return entries
+
+    def _import_metadata(self, cls: Dict[str, Any], metadata: Dict[str, Any]) -> Optional[Dict]:
+        """Fallback for computed attributes: import the module and read the class"""
+        collector_cls = self._import_class(cls['module'], cls['class'])
+        if collector_cls is None or not getattr(collector_cls, 'name', None):
+            return None
+        for attr in METADATA_DEFAULTS:
+            value = getattr(collector_cls, attr, metadata.get(attr))
+            metadata[attr] = getattr(value, 'value', value)
+        return metadata
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self.refresh()
+        return self._entries
+
+    # --- Registry-style API ------------------------------------------------
+
+    def list_collectors(self) -> List[Dict[str, Any]]:
+        """Same shape as registry.list_collectors(), without importing collectors"""
+        return [
+            {key: entry[key] for key in ('name', 'category', 'frequency', 'requires_auth', 'enabled')}
+            for entry in sorted(self.entries.values(), key=lambda e: e['name'])
+        ]
+
+    def get_info(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(name)
+
+    def get_collector(self, name: str):
+        """Import the collector's module and instantiate it (cached per process)"""
+        if name in self._instances:
+            return self._instances[name]
+
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+
+        # Import errors (e.g. a missing optional dependency) surface to the caller
+        collector_cls = getattr(importlib.import_module(entry['module']), entry['class'])
+        self._instances[name] = collector_cls()
+        return self._instances[name]
+
+    @staticmethod
+    def _import_class(module: str, class_name: str):
+        """Class object, or None when its module can't be imported"""
+        try:
+            return getattr(importlib.import_module(module), class_name, None)
+        except ImportError:
+            return None
+
+
+manifest = CollectorManifest()
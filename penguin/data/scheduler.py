@@ -0,0 +1,287 @@
+"""
+Collection scheduler
+Keeps collectors resident and runs each at its CollectionFrequency on one
+asyncio loop, with jitter, overrun skipping, store backpressure,
+retried (then spooled) writes and per-collector lag metrics
+"""
+
+import asyncio
+import inspect
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from penguin.core.constants import CollectionFrequency
+
+
+# Seconds between runs (lower end of each frequency's documented range)
+FREQUENCY_INTERVALS = {
+    CollectionFrequency.REALTIME: 5,
+    CollectionFrequency.HIGH: 60,
+    CollectionFrequency.MEDIUM: 900,
+    CollectionFrequency.LOW: 3600,
+}
+
+
+@dataclass
+class CollectorMetrics:
+    """Per-collector scheduling and run statistics"""
+    name: str
+    interval: float
+    runs: int = 0
+    failures: int = 0
+    write_failures: int = 0
+    skipped: int = 0
+    points: int = 0
+    last_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
+    last_error: Optional[str] = None
+    last_success: Optional[float] = None
+
+    @property
+    def avg_lag(self) -> float:
+        return self.total_lag / self.runs if self.runs else 0.0
+
+
+@dataclass
+class _Job:
+    collector: Any
+    interval: float
+    metrics: CollectorMetrics
+    task: Optional[asyncio.Task] = None
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+def interval_for(collector) -> Optional[float]:
+    """Run interval for a collector (None for ON_DEMAND); an `interval_seconds` attribute wins"""
+    override = getattr(collector, 'interval_seconds', None)
+    if override:
+        return float(override)
+    return FREQUENCY_INTERVALS.get(getattr(collector, 'frequency', None))
+
+
+class CollectionScheduler:
+    """Runs collectors periodically and funnels their output into one store writer"""
+
+    def __init__(self, save: Callable[[List[Dict]], Any],
+                 on_status: Optional[Callable[[str, bool, Optional[str]], None]] = None,
+                 jitter: float = 0.1, max_pending_batches: int = 20,
+                 run_timeout_factor: float = 3.0, write_retries: int = 3,
+                 fallback: Optional[Callable[[List[Dict]], Any]] = None):
+        """
+        save: store write for a batch of data points; a coroutine function is
+              awaited on the loop, a blocking function runs in a thread
+        on_status: blocking callback(name, success, error) after each run, and
+                   again with success=False if its batch could not be written
+        write_retries: extra save attempts per batch, with exponential backoff
+        fallback: blocking write (e.g. a spool append) for a batch save kept
+                  rejecting; without one the batch is dropped and counted
+        jitter: random fraction of the interval added to each tick, to spread load
+        max_pending_batches: write queue size; full queue blocks collectors (backpressure)
+        run_timeout_factor: a run is cancelled after this many intervals
+        """
+        self.save = save
+        self.on_status = on_status
+        self.jitter = jitter
+        self.run_timeout_factor = run_timeout_factor
+        self.write_retries = write_retries
+        self.fallback = fallback
+
+        self.jobs: Dict[str, _Job] = {}
+        self.queue: Optional[asyncio.Queue] = None
+        self.max_pending_batches = max_pending_batches
+        self.saved_points = 0
+        self.write_failures = 0
+        self.fallback_points = 0
+        self.dropped_points = 0
+        self._stopping: Optional[asyncio.Event] = None
+
+    def add(self, collector, interval: Optional[float] = None, **collect_kwargs) -> bool:
+        """Register a collector; returns False for ON_DEMAND collectors"""
+        interval = interval or interval_for(collector)
+        if not interval:
+            return False
+        self.jobs[collector.name] = _Job(
+            collector, interval, CollectorMetrics(collector.name, interval), kwargs=collect_kwargs
+        )
+        return True
+
+    @property
+    def metrics(self) -> List[CollectorMetrics]:
+        return [job.metrics for job in self.jobs.values()]
+
+    # --- Loop --------------------------------------------------------------
+
+    async def run(self, duration: Optional[float] = None,
+                  report: Optional[Callable[['CollectionScheduler'], None]] = None,
+                  report_interval: float = 60.0):
+        """Run until stop() is called (or `duration` seconds pass)"""
+        self.queue = asyncio.Queue(maxsize=self.max_pending_batches)
+        self._stopping = asyncio.Event()
+
+        tasks = [asyncio.create_task(self._schedule(job)) for job in self.jobs.values()]
+        writer = asyncio.create_task(self._writer())
+        if report is not None:
+            tasks.append(asyncio.create_task(self._reporter(report, report_interval)))
+
+        try:
+            if duration is None:
+                await self._stopping.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            running = [job.task for job in self.jobs.values() if job.task and not job.task.done()]
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*tasks, *running, return_exceptions=True)
+
+            # Flush what was already collected
+            await self.queue.join()
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+
+    def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _schedule(self, job: _Job):
+        """Tick at the job's interval; a tick whose previous run is still going is skipped"""
+        loop = asyncio.get_running_loop()
+        # Random phase so collectors sharing a frequency don't fire together
+        due = loop.time() + random.uniform(0, job.interval * self.jitter)
+
+        while True:
+            await asyncio.sleep(max(0.0, due - loop.time()))
+
+            if job.task is not None and not job.task.done():
+                job.metrics.skipped += 1
+            else:
+                job.task = asyncio.create_task(self._run_once(job, due))
+
+            due += job.interval + random.uniform(0, job.interval * self.jitter)
+            # Don't try to catch up on ticks missed while the loop was blocked
+            now = loop.time()
+            while due < now:
+                due += job.interval
+                job.metrics.skipped += 1
+
+    async def _run_once(self, job: _Job, scheduled: float):
+        metrics = job.metrics
+        loop = asyncio.get_running_loop()
+        lag = loop.time() - scheduled
+        metrics.last_lag = lag
+        metrics.max_lag = max(metrics.max_lag, lag)
+        metrics.total_lag += lag
+
+        start = time.perf_counter()
+        error = None
+        try:
+            data = await asyncio.wait_for(
+                job.collector.collect(**job.kwargs),
+                timeout=job.interval * self.run_timeout_factor,
+            )
+            if data:
+                # Blocks while the writer is behind
+                await self.queue.put((job, data))
+                metrics.points += len(data)
+            metrics.last_success = time.time()
+        except asyncio.CancelledError:
+            # Shutdown: an interrupted run isn't counted
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            metrics.failures += 1
+            metrics.last_error = error
+
+        metrics.runs += 1
+        metrics.last_duration = time.perf_counter() - start
+
+        await self._report_status(job, error)
+
+    async def _report_status(self, job: _Job, error: Optional[str]):
+        if self.on_status is not None:
+            try:
+                await asyncio.to_thread(self.on_status, job.collector.name, error is None, error)
+            except Exception:
+                pass
+
+    async def _writer(self):
+        """Single consumer so the store sees one writer, batched per run"""
+        while True:
+            job, batch = await self.queue.get()
+            try:
+                await self._write(job, batch)
+            finally:
+                self.queue.task_done()
+
+    async def _save(self, batch: List[Dict]) -> int:
+        if inspect.iscoroutinefunction(self.save):
+            return await self.save(batch)
+        return await asyncio.to_thread(self.save, batch)
+
+    async def _write(self, job: _Job, batch: List[Dict]):
+        """
+        Save with retries; a batch that still fails goes to the fallback (or is
+        dropped) and marks its collector's last run as failed
+        """
+        for attempt in range(self.write_retries + 1):
+            try:
+                self.saved_points += await self._save(batch)
+                return
+            except Exception as e:
+                error = f"write failed: {type(e).__name__}: {e}"
+                self.write_failures += 1
+                print(f"  ⚠️  {job.collector.name}: {error} "
+                      f"(attempt {attempt + 1}/{self.write_retries + 1}, {len(batch)} points)")
+            if attempt < self.write_retries:
+                # The queue fills up meanwhile, which holds the collectors back
+                await asyncio.sleep(2 ** attempt)
+
+        metrics = job.metrics
+        metrics.failures += 1
+        metrics.write_failures += 1
+        metrics.last_error = error
+
+        if self.fallback is not None:
+            try:
+                await asyncio.to_thread(self.fallback, batch)
+                self.fallback_points += len(batch)
+                error += f" ({len(batch)} points kept by the fallback)"
+            except Exception as e:
+                self.dropped_points += len(batch)
+                error += f"; fallback failed: {type(e).__name__}: {e}"
+        else:
+            self.dropped_points += len(batch)
+        print(f"  ⚠️  {job.collector.name}: {error}")
+        await self._report_status(job, error)
+
+    async def _reporter(self, report: Callable[['CollectionScheduler'], None], interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            report(self)
+
+
+def format_metrics(scheduler: CollectionScheduler) -> List[str]:
+    """Lag/health table for the daemon's periodic report"""
+    lines = [
+        f"{'collector':24s} {'every':>7s} {'runs':>6s} {'fail':>5s} {'skip':>5s} "
+        f"{'lag ms':>9s} {'max lag':>9s} {'last s':>8s} {'points':>8s}"
+    ]
+    for m in scheduler.metrics:
+        lines.append(
+            f"{m.name:24s} {m.interval:6.0f}s {m.runs:6d} {m.failures:5d} {m.skipped:5d} "
+            f"{m.avg_lag * 1000:9.1f} {m.max_lag * 1000:9.1f} {m.last_duration:8.2f} {m.points:8d}"
+        )
+    queued = scheduler.queue.qsize() if scheduler.queue is not None else 0
+    lines.append(f"saved={scheduler.saved_points} write_failures={scheduler.write_failures} "
+                 f"fallback={scheduler.fallback_points} dropped={scheduler.dropped_points} "
+                 f"write_queue={queued}/{scheduler.max_pending_batches}")
+    return lines
@@ -0,0 +1 @@
+"""Database storage for PENGUIN"""
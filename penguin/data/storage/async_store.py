@@ -0,0 +1,177 @@
+"""
+Async data store
+SQLAlchemy asyncio engine (asyncpg on PostgreSQL, aiosqlite locally) with a
+pooled, long-lived connection set, so collectors can persist without
+blocking the event loop
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from penguin.core.config import config
+from penguin.data.storage.bulk import dedupe_index_ddl, dedupe_insert, prepare_rows, warn_duplicates
+from penguin.data.storage.indicators import indicator_snapshots, split_technical, write_snapshots
+
+
+# Sync driver URLs are rewritten to their asyncio drivers
+ASYNC_DRIVERS = {
+    'postgresql': 'asyncpg',
+    'sqlite': 'aiosqlite',
+}
+
+
+def async_url(url: str) -> str:
+    """postgresql://... -> postgresql+asyncpg://..., sqlite:///x -> sqlite+aiosqlite:///x"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+class AsyncDatabase:
+    """One pooled async engine per process (create it once, dispose on shutdown)"""
+
+    def __init__(self, url: Optional[str] = None, pool_size: Optional[int] = None,
+                 max_overflow: Optional[int] = None):
+        self.url = url or config.DATABASE_URL
+        self.pool_size = pool_size or config.DB_POOL_SIZE
+        self.max_overflow = config.DB_MAX_OVERFLOW if max_overflow is None else max_overflow
+        self._engine: Optional[AsyncEngine] = None
+        self._sessions: Optional[async_sessionmaker] = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            options: Dict[str, Any] = {'pool_pre_ping': True}
+            url = async_url(self.url)
+            # In-memory SQLite is a single connection; pool sizing doesn't apply
+            if make_url(url).database not in (None, '', ':memory:'):
+                options.update(
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_timeout=config.DB_POOL_TIMEOUT,
+                    pool_recycle=config.DB_POOL_RECYCLE,
+                )
+            self._engine = create_async_engine(url, **options)
+        return self._engine
+
+    @property
+    def sessions(self) -> async_sessionmaker:
+        if self._sessions is None:
+            # Returned rows stay readable after the session closes
+            self._sessions = async_sessionmaker(self.engine, expire_on_commit=False)
+        return self._sessions
+
+    async def create_tables(self):
+        from penguin.data.storage.models import Base
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def dispose(self):
+        """Close pooled connections (they are bound to the running event loop)"""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._sessions = None
+
+
+class AsyncStore:
+    """Async counterparts of store.save_data_points / store.get_recent_data_points"""
+
+    def __init__(self, database: Optional[AsyncDatabase] = None, batch_size: Optional[int] = None):
+        self.database = database or async_db
+        self.batch_size = batch_size or config.INGEST_BATCH_SIZE
+        # False when existing duplicates block the unique index ON CONFLICT needs
+        self.dedupe = True
+        self._index_checked = False
+        # Concurrent first saves (fan-out) must not all run the DDL. Created in
+        # the running loop: before 3.10 a Lock binds to the loop current at
+        # construction, which for the module-level store is the import-time one
+        self._index_lock: Optional[asyncio.Lock] = None
+        self._index_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def table(self):
+        from penguin.data.storage.models import DataPoint
+        return DataPoint.__table__
+
+    def _dedupe_index_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._index_lock is None or self._index_lock_loop is not loop:
+            self._index_lock = asyncio.Lock()
+            self._index_lock_loop = loop
+        return self._index_lock
+
+    async def ensure_dedupe_index(self):
+        """Create the unique index ON CONFLICT relies on, or fall back to plain inserts"""
+        table = self.table
+        try:
+            async with self.database.engine.begin() as conn:
+                await conn.execute(text(dedupe_index_ddl(table)))
+        except IntegrityError:
+            self.dedupe = False
+            warn_duplicates(table)
+        async with self.database.engine.begin() as conn:
+            await conn.run_sync(indicator_snapshots.create, checkfirst=True)
+        self._index_checked = True
+
+    async def save_data_points(self, data_points: Iterable[Dict[str, Any]]) -> int:
+        """Insert data points in one transaction, skipping duplicates; returns rows inserted"""
+        rows = prepare_rows(data_points)
+        if not rows:
+            return 0
+
+        engine = self.database.engine
+        table = self.table
+        if not self._index_checked:
+            async with self._dedupe_index_lock():
+                if not self._index_checked:
+                    await self.ensure_dedupe_index()
+        # rowcount is -1 for asyncpg executemany; RETURNING gives one row per
+        # inserted data point and none for conflicting ones
+        statement = dedupe_insert(table, engine.dialect.name) if self.dedupe else insert(table)
+        statement = statement.returning(table.c.id)
+
+        inserted = 0
+        async with engine.begin() as conn:
+            rows, snapshots = split_technical(rows, strip=config.INDICATOR_STRIP_JSON)
+            await conn.run_sync(write_snapshots, snapshots)
+            for offset in range(0, len(rows), self.batch_size):
+                result = await conn.execute(statement, rows[offset:offset + self.batch_size])
+                inserted += len(result.all())
+        return inserted
+
+    async def get_recent_data_points(self, symbol: Optional[str] = None,
+                                     source: Optional[str] = None,
+                                     data_type: Optional[str] = None,
+                                     hours: int = 24, limit: int = 100) -> List:
+        """DataPoint rows from the last `hours`, newest first"""
+        from penguin.data.storage.models import DataPoint
+
+        query = select(DataPoint).where(
+            DataPoint.timestamp >= datetime.utcnow() - timedelta(hours=hours)
+        )
+        if symbol:
+            query = query.where(DataPoint.symbol == symbol)
+        if source:
+            query = query.where(DataPoint.source == source)
+        if data_type:
+            query = query.where(DataPoint.data_type == data_type)
+        query = query.order_by(DataPoint.timestamp.desc()).limit(limit)
+
+        async with self.database.sessions() as session:
+            return list(await session.scalars(query))
+
+
+async_db = AsyncDatabase()
+async_store = AsyncStore()
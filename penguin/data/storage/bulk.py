@@ -0,0 +1,242 @@
+"""
+Bulk ingestion for data points
+Writes collector output in large batches inside one transaction, using
+COPY FROM STDIN on PostgreSQL and batched executemany INSERTs elsewhere, with
+duplicates dropped on (symbol, source, data_type, timestamp)
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+from penguin.core.config import config
+
+
+DEDUPE_COLUMNS = ('symbol', 'source', 'data_type', 'timestamp')
+DEDUPE_INDEX_NAME = 'uq_data_points_dedupe'
+
+DUPLICATES_WARNING = (
+    "⚠️  {table} already holds rows with the same ({columns}), so the dedupe index "
+    "can't be created; inserting without de-duplication until `penguin dedupe` is run"
+)
+
+COPY_COLUMNS = ('timestamp', 'symbol', 'source', 'category', 'data_type', 'value', 'extra_data')
+
+
+def prepare_rows(data_points: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize collector dicts into data_points rows
+    Duplicate keys within the batch keep the last occurrence
+    """
+    rows: Dict[tuple, Dict[str, Any]] = {}
+
+    for point in data_points:
+        category = point.get('category')
+        row = {
+            'timestamp': point.get('timestamp') or datetime.utcnow(),
+            'symbol': point.get('symbol'),
+            'source': point.get('source'),
+            'category': category.value if isinstance(category, Enum) else category,
+            'data_type': point.get('data_type'),
+            'value': point.get('value'),
+            'extra_data': point.get('metadata', point.get('extra_data')),
+        }
+        rows[tuple(row[column] for column in DEDUPE_COLUMNS)] = row
+
+    return list(rows.values())
+
+
+def dedupe_insert(table: Table, dialect: str, index_elements: Sequence[str] = DEDUPE_COLUMNS):
+    """INSERT that skips rows already present on the dedupe key"""
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        # No portable ON CONFLICT: fall back to a plain batched insert
+        return insert(table)
+
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=list(index_elements))
+
+
+def dedupe_index_ddl(table: Table) -> str:
+    """Unique index ON CONFLICT relies on (IF NOT EXISTS works on PostgreSQL and SQLite)"""
+    return (f"CREATE UNIQUE INDEX IF NOT EXISTS {DEDUPE_INDEX_NAME} "
+            f"ON {table.name} ({', '.join(DEDUPE_COLUMNS)})")
+
+
+# Rows with a NULL key column never conflict in a unique index
+_KEYS_NOT_NULL = ' AND '.join(f"{column} IS NOT NULL" for column in DEDUPE_COLUMNS)
+
+
+def count_duplicates_sql(table: Table) -> str:
+    """Rows that would be deleted by remove_duplicates"""
+    return (f"SELECT COALESCE(SUM(n - 1), 0) FROM (SELECT COUNT(*) AS n FROM {table.name} "
+            f"WHERE {_KEYS_NOT_NULL} GROUP BY {', '.join(DEDUPE_COLUMNS)}) AS dedupe_keys")
+
+
+def remove_duplicates_sql(table: Table) -> str:
+    """DELETE all but the first-inserted row of each dedupe key"""
+    return (f"DELETE FROM {table.name} WHERE {_KEYS_NOT_NULL} AND id NOT IN "
+            f"(SELECT MIN(id) FROM {table.name} WHERE {_KEYS_NOT_NULL} "
+            f"GROUP BY {', '.join(DEDUPE_COLUMNS)})")
+
+
+def remove_duplicates(engine: Engine, table: Table) -> int:
+    """Delete historical duplicates and create the dedupe index; returns rows deleted"""
+    with engine.begin() as conn:
+        deleted = conn.execute(text(remove_duplicates_sql(table))).rowcount
+        conn.execute(text(dedupe_index_ddl(table)))
+    return deleted
+
+
+def warn_duplicates(table: Table):
+    print(DUPLICATES_WARNING.format(table=table.name, columns=', '.join(DEDUPE_COLUMNS)))
+
+
+class BulkWriter:
+    """Batched, deduplicating writer for the data_points table"""
+
+    def __init__(self, engine: Optional[Engine] = None, table: Optional[Table] = None,
+                 batch_size: Optional[int] = None, split_indicators: bool = True,
+                 strip_indicators: Optional[bool] = None):
+        """
+        engine: defaults to the shared database engine
+        table: defaults to the DataPoint model's table
+        batch_size: rows per statement / COPY chunk (defaults to INGEST_BATCH_SIZE)
+        split_indicators: also store technical_analysis payloads in indicator_snapshots columns
+        strip_indicators: drop the snapshotted keys from the data point's JSON
+                          (defaults to INDICATOR_STRIP_JSON; query and export read that JSON)
+        """
+        if engine is None:
+            from penguin.data.storage.database import db
+            if getattr(db, 'engine', None) is None:
+                db.connect()
+            engine = db.engine
+        if table is None:
+            from penguin.data.storage.models import DataPoint
+            table = DataPoint.__table__
+
+        self.engine = engine
+        self.table = table
+        self.batch_size = batch_size or config.INGEST_BATCH_SIZE
+        self.split_indicators = split_indicators
+        self.strip_indicators = config.INDICATOR_STRIP_JSON if strip_indicators is None else strip_indicators
+        # False when existing duplicates block the unique index ON CONFLICT needs
+        self.dedupe = True
+        self._index_checked = False
+
+    @property
+    def use_copy(self) -> bool:
+        """COPY is only available through psycopg2 on PostgreSQL"""
+        return self.engine.dialect.name == 'postgresql' and self.engine.dialect.driver == 'psycopg2'
+
+    def ensure_dedupe_index(self):
+        """
+        Create the unique index ON CONFLICT relies on (no-op if it exists)
+        If existing duplicates block it, warn and insert without de-duplication
+        """
+        if self._index_checked:
+            return
+        # Raw DDL so the shared Table object is not mutated
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text(dedupe_index_ddl(self.table)))
+        except IntegrityError:
+            self.dedupe = False
+            warn_duplicates(self.table)
+        if self.split_indicators:
+            from penguin.data.storage.indicators import indicator_snapshots
+            with self.engine.begin() as conn:
+                indicator_snapshots.create(conn, checkfirst=True)
+        self._index_checked = True
+
+    def write(self, data_points: Iterable[Dict[str, Any]]) -> int:
+        """Insert data points in one transaction; returns rows actually inserted"""
+        rows = prepare_rows(data_points)
+        if not rows:
+            return 0
+
+        self.ensure_dedupe_index()
+
+        with self.engine.begin() as conn:
+            return self.write_rows(conn, rows)
+
+    def write_rows(self, conn: Connection, rows: List[Dict[str, Any]]) -> int:
+        """Insert prepared rows on a caller-owned transaction; returns rows inserted"""
+        if self.split_indicators:
+            from penguin.data.storage.indicators import split_technical, write_snapshots
+            rows, snapshots = split_technical(rows, strip=self.strip_indicators)
+            write_snapshots(conn, snapshots)
+
+        inserted = 0
+        for offset in range(0, len(rows), self.batch_size):
+            batch = rows[offset:offset + self.batch_size]
+            if self.use_copy:
+                inserted += self._write_copy(conn, batch)
+            else:
+                inserted += self._write_values(conn, batch)
+        return inserted
+
+    def _write_values(self, conn: Connection, rows: List[Dict[str, Any]]) -> int:
+        """
+        INSERT ... ON CONFLICT DO NOTHING as one executemany
+        (compiled once; psycopg2 sends it as multi-row VALUES pages)
+        """
+        statement = dedupe_insert(self.table, conn.dialect.name) if self.dedupe else insert(self.table)
+        return conn.execute(statement, rows).rowcount
+
+    def _write_copy(self, conn: Connection, rows: List[Dict[str, Any]]) -> int:
+        """COPY into a temp staging table, then INSERT ... SELECT ON CONFLICT DO NOTHING"""
+        table = self.table.name
+        columns = ', '.join(COPY_COLUMNS)
+        on_conflict = f" ON CONFLICT ({', '.join(DEDUPE_COLUMNS)}) DO NOTHING" if self.dedupe else ''
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_copy_value(row[column]) for column in COPY_COLUMNS])
+        buffer.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS _ingest_{table} "
+                f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.execute(f"TRUNCATE _ingest_{table}")
+            cursor.copy_expert(
+                f"COPY _ingest_{table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "
+                f"SELECT {columns} FROM _ingest_{table}{on_conflict}"
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+def _copy_value(value: Any) -> str:
+    """Render a value for CSV COPY input"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def save_data_points_bulk(data_points: Iterable[Dict[str, Any]],
+                          writer: Optional[BulkWriter] = None) -> int:
+    """Bulk counterpart of store.save_data_points"""
+    return (writer or BulkWriter()).write(data_points)
@@ -0,0 +1,273 @@
+"""
+Columnar export of data points
+Streams data_points through a server-side cursor into Parquet or Arrow IPC
+files partitioned by date and source, flattening the extra_data JSON into
+typed columns, and resumes from the last exported (timestamp, id)
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Table, and_, or_, select
+from sqlalchemy.engine import Engine
+
+from penguin.core.config import config
+
+
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+STATE_FILE = '_export_state.json'
+META_PREFIX = 'meta_'
+BASE_COLUMNS = ('id', 'timestamp', 'symbol', 'source', 'category', 'data_type', 'value')
+
+
+class ExportSummary(NamedTuple):
+    rows: int
+    files: int
+    last_timestamp: Optional[datetime]
+
+
+def flatten_metadata(metadata: Any, prefix: str = META_PREFIX) -> Dict[str, Any]:
+    """{'macd': 1.2, 'bb': {'upper': 3}} -> {'meta_macd': 1.2, 'meta_bb_upper': 3}"""
+    if not isinstance(metadata, dict):
+        return {}
+    flat = {}
+    for key, value in metadata.items():
+        column = prefix + re.sub(r'\W+', '_', str(key))
+        if isinstance(value, dict):
+            flat.update(flatten_metadata(value, column + '_'))
+        else:
+            flat[column] = value
+    return flat
+
+
+def _arrow_type(name: str):
+    """Type name as persisted in the export state -> Arrow type"""
+    import pyarrow as pa
+    return {'bool': pa.bool_(), 'double': pa.float64(), 'string': pa.string()}[name]
+
+
+def _column_type(values: List[Any], known: Optional[str] = None):
+    """
+    Arrow type per column: bool, float64 for any numbers, else string; a
+    column with no values is null-typed (or keeps its known type), and one
+    whose values don't fit its known type becomes string
+    """
+    import pyarrow as pa
+
+    present = [v for v in values if v is not None]
+    if not present:
+        return (_arrow_type(known) if known else pa.null()), values
+    if all(isinstance(v, bool) for v in present):
+        name = 'bool'
+    elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        name = 'double'
+    else:
+        name = 'string'
+
+    if known is not None and known != name:
+        name = 'string'
+    if name != 'string':
+        return _arrow_type(name), values
+    return pa.string(), [
+        v if v is None or isinstance(v, str) else json.dumps(v, default=str) for v in values
+    ]
+
+
+def build_table(rows: List[Dict[str, Any]], column_types: Optional[Dict[str, str]] = None):
+    """
+    Arrow table with the base columns plus one typed column per metadata key
+    column_types: metadata column -> type name from earlier chunks; updated in place
+    """
+    import pyarrow as pa
+
+    column_types = {} if column_types is None else column_types
+    flat = [flatten_metadata(row.get('extra_data')) for row in rows]
+    meta_columns = sorted({column for entry in flat for column in entry})
+
+    arrays = {
+        'id': pa.array([row['id'] for row in rows], pa.int64()),
+        'timestamp': pa.array([row['timestamp'] for row in rows], pa.timestamp('us')),
+    }
+    for column in ('symbol', 'source', 'category', 'data_type'):
+        arrays[column] = pa.array([row[column] for row in rows], pa.string())
+    arrays['value'] = pa.array([row['value'] for row in rows], pa.float64())
+
+    for column in meta_columns:
+        arrow_type, values = _column_type([entry.get(column) for entry in flat],
+                                          column_types.get(column))
+        arrays[column] = pa.array(values, arrow_type)
+        if arrow_type != pa.null():
+            column_types[column] = str(arrow_type)
+
+    return pa.table(arrays)
+
+
+def _partition_value(value: Optional[str]) -> str:
+    return re.sub(r'[^\w.-]+', '_', value) if value else '_unknown'
+
+
+class DataPointExporter:
+    """Incremental, partitioned export of data_points to a directory"""
+
+    def __init__(self, output_dir: Path, fmt: str = 'parquet', engine: Optional[Engine] = None,
+                 table: Optional[Table] = None, chunk_size: Optional[int] = None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt} (choose from {', '.join(FORMATS)})")
+        if engine is None:
+            from penguin.data.storage.database import db
+            if getattr(db, 'engine', None) is None:
+                db.connect()
+            engine = db.engine
+        if table is None:
+            from penguin.data.storage.models import DataPoint
+            table = DataPoint.__table__
+
+        self.output_dir = Path(output_dir)
+        self.fmt = fmt
+        self.engine = engine
+        self.table = table
+        self.chunk_size = chunk_size or config.EXPORT_CHUNK_SIZE
+        self.column_types: Dict[str, str] = {}
+
+    # --- Resume state ------------------------------------------------------
+
+    @property
+    def state_path(self) -> Path:
+        return self.output_dir / STATE_FILE
+
+    def load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if state.get('last_timestamp'):
+            state['last_timestamp'] = datetime.fromisoformat(state['last_timestamp'])
+        return state
+
+    def save_state(self, last_timestamp: datetime, last_id: int, filters: Dict[str, Any]):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_timestamp': last_timestamp.isoformat(), 'last_id': last_id,
+                       'format': self.fmt, 'filters': filters,
+                       'column_types': self.column_types}, f, default=str)
+        tmp_path.replace(self.state_path)
+
+    # --- Export ------------------------------------------------------------
+
+    def run(self, source: Optional[str] = None, data_type: Optional[str] = None,
+            symbol: Optional[str] = None, since: Optional[datetime] = None,
+            full: bool = False) -> ExportSummary:
+        """Export rows after the saved cursor (or everything since `since` with full=True)"""
+        filters = {'source': source, 'data_type': data_type, 'symbol': symbol}
+        state = {} if full else self.load_state()
+        if state and state.get('filters', filters) != filters:
+            raise ValueError(
+                f"{self.output_dir} was exported with filters {state['filters']}; "
+                f"use the same filters, another directory, or a full re-export"
+            )
+
+        columns = self.table.c
+        query = select(*(columns[name] for name in BASE_COLUMNS), columns.extra_data)
+        for name, value in filters.items():
+            if value:
+                query = query.where(columns[name] == value)
+        if since is not None:
+            query = query.where(columns.timestamp >= since)
+        if state.get('last_timestamp') is not None:
+            last_timestamp, last_id = state['last_timestamp'], state['last_id']
+            # (timestamp, id) cursor: rows sharing the last timestamp aren't skipped
+            query = query.where(or_(
+                columns.timestamp > last_timestamp,
+                and_(columns.timestamp == last_timestamp, columns.id > last_id),
+            ))
+        query = query.order_by(columns.timestamp, columns.id)
+        self.column_types = dict(state.get('column_types', {}))
+
+        rows = files = 0
+        last_timestamp = state.get('last_timestamp')
+        with self.engine.connect() as conn:
+            # Server-side cursor: memory stays bounded by one chunk
+            result = conn.execution_options(stream_results=True, yield_per=self.chunk_size).execute(query)
+            for chunk in result.mappings().partitions(self.chunk_size):
+                files += self._write_chunk(chunk)
+                rows += len(chunk)
+                last_timestamp = chunk[-1]['timestamp']
+                self.save_state(last_timestamp, chunk[-1]['id'], filters)
+
+        return ExportSummary(rows, files, last_timestamp)
+
+    def _write_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """
+        One file per (date, source) partition in the chunk; file names are
+        deterministic so a chunk re-exported after a crash overwrites its files
+        """
+        partitions: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in chunk:
+            partitions.setdefault((row['timestamp'].date().isoformat(), _partition_value(row['source'])), []).append(row)
+
+        name = f"part-{chunk[0]['id']:012d}{FORMATS[self.fmt]}"
+        for (day, source), partition_rows in partitions.items():
+            directory = self.output_dir / f"date={day}" / f"source={source}"
+            directory.mkdir(parents=True, exist_ok=True)
+            self._write_file(build_table(partition_rows, self.column_types), directory / name)
+        return len(partitions)
+
+    def _write_file(self, table, path: Path):
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        if self.fmt == 'parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(table, tmp_path, compression='zstd')
+        else:
+            import pyarrow as pa
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        tmp_path.replace(path)
+
+
+def load_export(output_dir: Path, fmt: str = 'parquet'):
+    """
+    pyarrow dataset over an export directory, with the schema unified across
+    files (metadata columns vary by source) and `date` usable for pruning
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    file_format = 'ipc' if fmt == 'arrow' else fmt
+    partitioning = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+    dataset = ds.dataset(str(output_dir), format=file_format, partitioning=partitioning,
+                         exclude_invalid_files=True)
+    schema = unify_schemas([fragment.physical_schema for fragment in dataset.get_fragments()]
+                           or [dataset.schema])
+    return ds.dataset(str(output_dir), schema=schema.append(pa.field('date', pa.string())),
+                      format=file_format, partitioning=partitioning,
+                      exclude_invalid_files=True)
+
+
+def unify_schemas(schemas: List):
+    """
+    Permissive unify (null columns take the other files' type); a column
+    still typed differently across files, e.g. double in files written
+    before it turned string, is read as string
+    """
+    import pyarrow as pa
+
+    types: Dict[str, List] = {}
+    for schema in schemas:
+        for field in schema:
+            types.setdefault(field.name, []).append(field.type)
+
+    fields = []
+    for name, column_types in types.items():
+        try:
+            field = pa.unify_schemas([pa.schema([(name, t)]) for t in column_types],
+                                     promote_options='permissive').field(name)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            field = pa.field(name, pa.string())
+        fields.append(field)
+    return pa.schema(fields)
@@ -0,0 +1,275 @@
+"""
+Typed indicator snapshots
+Fixed-schema wide table for the technical_analysis payload (one row per
+symbol per run, REAL/BOOLEAN columns instead of a JSON dict), with the JSON
+migration and a screening API that filters on indexed columns
+"""
+
+import math
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    REAL, Boolean, Column, DateTime, Double, Index, Integer, String, Table, and_, bindparam, func,
+    select,
+)
+from sqlalchemy.engine import Engine
+
+from penguin.data.storage.models import Base
+
+
+TECHNICAL_DATA_TYPE = 'technical_analysis'
+TABLE_NAME = 'indicator_snapshots'
+SNAPSHOT_KEY = ('symbol', 'source', 'timestamp')
+
+# Text states (e.g. rsi_status='oversold')
+LABEL_COLUMNS = (
+    'rsi_status', 'stoch_signal', 'volatility_level', 'obv_trend', 'ichimoku_signal',
+    'supertrend_direction',
+)
+BOOL_COLUMNS = ('bb_squeeze', 'volume_spike', 'consolidation_detected')
+# Volume-scale values lose precision in float32
+DOUBLE_COLUMNS = ('volume_current', 'volume_avg_10d', 'obv', 'ad_line', 'force_index')
+FLOAT_COLUMNS = (
+    # Trend
+    'sma_5', 'sma_10', 'sma_20', 'sma_50', 'sma_200', 'ema_9', 'ema_12', 'ema_26',
+    'price_vs_sma20', 'price_vs_sma200', 'macd', 'macd_signal', 'macd_histogram', 'adx',
+    # Momentum
+    'rsi_14', 'stoch_k', 'stoch_d', 'williams_r', 'roc_10d', 'roc_20d', 'cci', 'momentum_10d',
+    'tsi', 'uo',
+    # Volatility
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'bb_percent_b', 'atr_14', 'volatility_10d',
+    'volatility_30d', 'keltner_upper', 'keltner_middle', 'keltner_lower', 'donchian_upper',
+    'donchian_lower',
+    # Volume
+    'volume_ratio_10day', 'cmf', 'mfi', 'volume_profile_high', 'volume_profile_low', 'vwap',
+    'ease_of_movement',
+    # Price patterns
+    'support_level', 'resistance_level', 'distance_to_support', 'distance_to_resistance',
+    'price_channel_position', 'pivot_point',
+    # Returns & statistics
+    'return_1d', 'return_5d', 'return_10d', 'return_20d', 'return_50d', 'volatility_10d_pct',
+    'sharpe_ratio_20d', 'z_score', 'correlation_spy', 'beta',
+    # Fibonacci
+    'fib_0', 'fib_236', 'fib_382', 'fib_500', 'fib_618', 'fib_786', 'fib_100',
+    # Advanced
+    'ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_a', 'ichimoku_senkou_b',
+    'ichimoku_chikou', 'supertrend', 'vortex_positive', 'vortex_negative', 'aroon_up',
+    'aroon_down', 'aroon_oscillator', 'pivot_classic', 'pivot_r1', 'pivot_r2', 'pivot_s1',
+    'pivot_s2', 'hull_ma', 'dema',
+    'current_price',
+)
+
+INDICATOR_COLUMNS = FLOAT_COLUMNS + DOUBLE_COLUMNS + BOOL_COLUMNS + LABEL_COLUMNS
+
+# Columns screens commonly filter on get their own index
+INDEXED_COLUMNS = (
+    'rsi_14', 'adx', 'bb_percent_b', 'volume_ratio_10day', 'z_score', 'bb_squeeze', 'volume_spike',
+)
+
+
+def _column(name: str) -> Column:
+    if name in BOOL_COLUMNS:
+        kind = Boolean()
+    elif name in LABEL_COLUMNS:
+        kind = String(16)
+    elif name in DOUBLE_COLUMNS:
+        kind = Double()
+    else:
+        kind = REAL()  # float32
+    return Column(name, kind, index=name in INDEXED_COLUMNS)
+
+
+indicator_snapshots = Table(
+    TABLE_NAME, Base.metadata,
+    Column('id', Integer, primary_key=True),
+    Column('timestamp', DateTime, nullable=False),
+    Column('symbol', String(10), nullable=False),
+    Column('source', String(50), nullable=False),
+    # data_points row a snapshot was migrated from (NULL for ones written directly)
+    Column('data_point_id', Integer, unique=True),
+    *(_column(name) for name in INDICATOR_COLUMNS),
+    Index('uq_indicator_snapshots_key', *SNAPSHOT_KEY, unique=True),
+    Index('ix_indicator_snapshots_symbol_time', 'symbol', 'timestamp'),
+)
+
+
+# --- Packing ---------------------------------------------------------------
+
+def _coerce(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name in BOOL_COLUMNS:
+        return bool(value)
+    if name in LABEL_COLUMNS:
+        return str(value)[:16]
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def pack(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split a technical_analysis payload into (typed columns, leftover JSON keys)"""
+    columns = {name: _coerce(name, metadata.get(name)) for name in INDICATOR_COLUMNS}
+    leftovers = {key: value for key, value in metadata.items() if key not in columns}
+    return columns, leftovers
+
+
+def unpack(row: Any) -> Dict[str, Any]:
+    """Snapshot row -> indicator dict in the collector's payload shape (None values dropped)"""
+    mapping = row._mapping if hasattr(row, '_mapping') else row
+    return {name: mapping[name] for name in INDICATOR_COLUMNS if mapping[name] is not None}
+
+
+def split_technical(rows: List[Dict[str, Any]], strip: bool = False
+                    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    For prepared data_points rows: copy technical_analysis indicators into
+    snapshot rows; with strip=True they are also removed from the data
+    point's extra_data (leaving only unknown keys), like `indicators migrate --strip`
+    """
+    snapshots = []
+    for row in rows:
+        metadata = row.get('extra_data')
+        if row.get('data_type') != TECHNICAL_DATA_TYPE or not isinstance(metadata, dict):
+            continue
+        columns, leftovers = pack(metadata)
+        snapshots.append({'timestamp': row['timestamp'], 'symbol': row['symbol'],
+                          'source': row['source'], **columns})
+        if strip:
+            row['extra_data'] = leftovers or None
+    return rows, snapshots
+
+
+def write_snapshots(conn, snapshots: List[Dict[str, Any]]) -> int:
+    """Insert snapshots, skipping ones already stored for (symbol, source, timestamp)"""
+    from penguin.data.storage.bulk import dedupe_insert
+
+    if not snapshots:
+        return 0
+    statement = dedupe_insert(indicator_snapshots, conn.dialect.name, SNAPSHOT_KEY)
+    return conn.execute(statement, snapshots).rowcount
+
+
+# --- Migration -------------------------------------------------------------
+
+def migrate_json(engine: Engine, data_points: Table, batch_size: int = 5000,
+                 strip: bool = False) -> Dict[str, int]:
+    """
+    Copy technical_analysis JSON payloads into indicator_snapshots
+    Resumes after the highest data_point_id already migrated; with strip=True
+    the migrated keys are also removed from data_points.extra_data
+    """
+    indicator_snapshots.create(engine, checkfirst=True)
+    stats = {'rows': 0, 'migrated': 0, 'stripped': 0}
+
+    with engine.connect() as conn:
+        last_id = conn.execute(select(func.max(indicator_snapshots.c.data_point_id))).scalar() or 0
+
+    while True:
+        with engine.begin() as conn:
+            batch = conn.execute(
+                select(data_points.c.id, data_points.c.timestamp, data_points.c.symbol,
+                       data_points.c.source, data_points.c.extra_data)
+                .where(data_points.c.data_type == TECHNICAL_DATA_TYPE, data_points.c.id > last_id)
+                .order_by(data_points.c.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                return stats
+
+            snapshots, updates = [], []
+            for row in batch:
+                if not isinstance(row.extra_data, dict):
+                    continue
+                columns, leftovers = pack(row.extra_data)
+                snapshots.append({'timestamp': row.timestamp, 'symbol': row.symbol,
+                                  'source': row.source, 'data_point_id': row.id, **columns})
+                updates.append({'row_id': row.id, 'extra_data': leftovers or None})
+
+            stats['rows'] += len(batch)
+            stats['migrated'] += write_snapshots(conn, snapshots)
+            if strip and updates:
+                conn.execute(
+                    data_points.update()
+                    .where(data_points.c.id == bindparam('row_id'))
+                    .values(extra_data=bindparam('extra_data')),
+                    updates,
+                )
+                stats['stripped'] += len(updates)
+            last_id = batch[-1].id
+
+
+# --- Screening -------------------------------------------------------------
+
+CONDITION = re.compile(r'^\s*(!?)(\w+)\s*(?:(<=|>=|!=|=|<|>)\s*(.+?))?\s*$')
+
+
+def condition_column(text: str) -> str:
+    """Indicator a condition refers to ('rsi_14<30' -> 'rsi_14')"""
+    match = CONDITION.match(text)
+    if not match:
+        raise ValueError(f"Can't parse condition: {text!r}")
+    return match.group(2)
+
+
+def parse_condition(text: str):
+    """
+    'rsi_14<30', 'bb_squeeze', '!volume_spike', 'rsi_status=oversold'
+    -> SQL expression on the matching indexed/typed column
+    """
+    match = CONDITION.match(text)
+    if not match:
+        raise ValueError(f"Can't parse condition: {text!r}")
+    negate, name, op, raw = match.groups()
+    if name not in INDICATOR_COLUMNS:
+        raise ValueError(f"Unknown indicator: {name}")
+    column = indicator_snapshots.c[name]
+
+    if op is None:
+        if name not in BOOL_COLUMNS:
+            raise ValueError(f"{name} is not a boolean indicator; use a comparison")
+        return column.is_(not negate)
+    if negate:
+        raise ValueError(f"'!' only applies to boolean indicators: {text!r}")
+
+    if name in LABEL_COLUMNS:
+        value = raw
+    elif name in BOOL_COLUMNS:
+        value = raw.lower() in ('1', 'true', 'yes')
+    else:
+        value = float(raw)
+    return {
+        '<': column < value, '<=': column <= value, '>': column > value,
+        '>=': column >= value, '=': column == value, '!=': column != value,
+    }[op]
+
+
+def screen(engine: Engine, conditions: Iterable[str], hours: Optional[int] = None,
+           symbols: Optional[List[str]] = None, limit: Optional[int] = None) -> List:
+    """
+    Latest snapshot per symbol that matches every condition (rows, by symbol)
+    hours limits how old a symbol's latest snapshot may be
+    """
+    table = indicator_snapshots
+    latest = select(table.c.symbol, func.max(table.c.timestamp).label('latest')).group_by(table.c.symbol)
+    if hours is not None:
+        latest = latest.where(table.c.timestamp >= datetime.utcnow() - timedelta(hours=hours))
+    if symbols:
+        latest = latest.where(table.c.symbol.in_(symbols))
+    latest = latest.subquery()
+
+    query = (
+        select(table)
+        .join(latest, and_(table.c.symbol == latest.c.symbol, table.c.timestamp == latest.c.latest))
+        .where(*(parse_condition(condition) for condition in conditions))
+        .order_by(table.c.symbol)
+    )
+    if limit:
+        query = query.limit(limit)
+
+    with engine.connect() as conn:
+        return conn.execute(query).all()
@@ -0,0 +1,325 @@
+"""
+Write-ahead spool for collected data
+Collectors append compressed, length-prefixed batches to local segment files;
+a flusher drains them into data_points in large transactions, recording each
+batch ID alongside the rows so a batch is ingested exactly once, even after a
+crash between the database commit and the spool checkpoint
+"""
+
+import json
+import os
+import struct
+import time
+import uuid
+import zlib
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+from penguin.core.config import config
+
+
+# magic, payload length, crc32 of the payload
+HEADER = struct.Struct('>4sII')
+MAGIC = b'PSP1'
+SEGMENT_PREFIX = 'segment-'
+SEGMENT_SUFFIX = '.log'
+CHECKPOINT_FILE = 'checkpoint.json'
+BATCHES_TABLE = 'spool_batches'
+
+
+class SpoolCorruption(Exception):
+    """A complete record failed its checksum"""
+
+
+class Position(NamedTuple):
+    """Byte offset within a numbered segment"""
+    segment: int
+    offset: int
+
+
+class SpoolRecord(NamedTuple):
+    batch_id: str
+    created: float
+    points: List[Dict[str, Any]]
+
+
+class FlushResult(NamedTuple):
+    batches: int
+    inserted: int
+    duplicates: int     # batches already ingested before a crash, skipped
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and '$dt' in obj:
+        return datetime.fromisoformat(obj['$dt'])
+    return obj
+
+
+def encode_record(batch_id: str, points: List[Dict[str, Any]]) -> bytes:
+    """Header + zlib-compressed JSON payload (datetimes round-trip)"""
+    payload = zlib.compress(json.dumps(
+        {'id': batch_id, 'created': time.time(), 'points': points},
+        default=_encode_value, separators=(',', ':'),
+    ).encode(), 1)
+    return HEADER.pack(MAGIC, len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_payload(payload: bytes) -> SpoolRecord:
+    body = json.loads(zlib.decompress(payload), object_hook=_decode_object)
+    return SpoolRecord(body['id'], body['created'], body['points'])
+
+
+def read_records(path: Path, offset: int = 0) -> Iterator[Tuple[int, SpoolRecord]]:
+    """
+    (end offset, record) for each complete record from `offset`
+    Stops quietly at a torn tail (a crashed or in-progress append)
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return
+            magic, length, crc = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise SpoolCorruption(f"{path.name}: bad record header at offset {offset}")
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            if zlib.crc32(payload) != crc:
+                raise SpoolCorruption(f"{path.name}: checksum mismatch at offset {offset}")
+            offset += HEADER.size + length
+            yield offset, decode_payload(payload)
+
+
+def valid_length(path: Path) -> int:
+    """Bytes up to the end of the last complete record (headers only, plus the last CRC)"""
+    size = path.stat().st_size
+    offset = last = 0
+    with open(path, 'rb') as f:
+        while offset + HEADER.size <= size:
+            f.seek(offset)
+            magic, length, crc = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or offset + HEADER.size + length > size:
+                break
+            last, offset = offset, offset + HEADER.size + length
+        if offset > 0:
+            f.seek(last)
+            _, length, crc = HEADER.unpack(f.read(HEADER.size))
+            if zlib.crc32(f.read(length)) != crc:
+                offset = last
+    return offset
+
+
+class Spool:
+    """Append-only segment files, safe for concurrent writers via a lock file"""
+
+    def __init__(self, directory: Optional[Path] = None, segment_bytes: Optional[int] = None,
+                 fsync: Optional[bool] = None):
+        self.directory = Path(directory or config.SPOOL_DIR)
+        self.segment_bytes = segment_bytes or config.SPOOL_SEGMENT_BYTES
+        self.fsync = config.SPOOL_FSYNC if fsync is None else fsync
+        self._recovered = set()
+
+    # --- Segments ----------------------------------------------------------
+
+    def segment_path(self, segment: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{segment:08d}{SEGMENT_SUFFIX}"
+
+    def segments(self) -> List[int]:
+        if not self.directory.exists():
+            return []
+        return sorted(
+            int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            for path in self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+        )
+
+    def _lock(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock = open(self.directory / 'spool.lock', 'a')
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    # --- Writing -----------------------------------------------------------
+
+    def append(self, data_points: List[Dict[str, Any]]) -> str:
+        """Durably queue a batch; returns its batch ID"""
+        batch_id = uuid.uuid4().hex
+        record = encode_record(batch_id, list(data_points))
+
+        with self._lock():
+            segments = self.segments()
+            segment = segments[-1] if segments else 1
+            path = self.segment_path(segment)
+
+            if path.exists():
+                if segment not in self._recovered:
+                    # Drop a torn tail left by a writer that crashed mid-append
+                    length = valid_length(path)
+                    if length < path.stat().st_size:
+                        os.truncate(path, length)
+                    self._recovered.add(segment)
+                if path.stat().st_size + len(record) > self.segment_bytes:
+                    path = self.segment_path(segment + 1)
+
+            with open(path, 'ab') as f:
+                f.write(record)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+        return batch_id
+
+    # --- Reading -----------------------------------------------------------
+
+    def read_from(self, position: Position) -> Iterator[Tuple[Position, SpoolRecord]]:
+        """Records after `position`, with the position just past each"""
+        for segment in self.segments():
+            if segment < position.segment:
+                continue
+            offset = position.offset if segment == position.segment else 0
+            for end, record in read_records(self.segment_path(segment), offset):
+                yield Position(segment, end), record
+
+    def load_checkpoint(self) -> Position:
+        try:
+            with open(self.directory / CHECKPOINT_FILE) as f:
+                return Position(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return Position(0, 0)
+
+    def save_checkpoint(self, position: Position):
+        path = self.directory / CHECKPOINT_FILE
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(position._asdict(), f)
+        tmp_path.replace(path)
+
+        # Fully drained segments can go (never the one writers append to)
+        segments = self.segments()
+        for segment in segments[:-1]:
+            if segment < position.segment:
+                self.segment_path(segment).unlink(missing_ok=True)
+
+    def pending(self) -> Dict[str, int]:
+        """Batches, points and bytes not yet flushed"""
+        position = self.load_checkpoint()
+        batches = points = 0
+        for _, record in self.read_from(position):
+            batches += 1
+            points += len(record.points)
+        size = sum(
+            self.segment_path(s).stat().st_size - (position.offset if s == position.segment else 0)
+            for s in self.segments() if s >= position.segment
+        )
+        return {'batches': batches, 'points': points, 'bytes': size}
+
+
+class SpoolFlusher:
+    """Drains the spool into data_points; safe to re-run after any crash"""
+
+    def __init__(self, spool: Optional[Spool] = None, writer=None,
+                 batch_rows: Optional[int] = None):
+        """
+        writer: BulkWriter used for the inserts (defaults to the shared database)
+        batch_rows: spool batches are grouped until at least this many rows per transaction
+        """
+        from penguin.data.storage.bulk import BulkWriter
+
+        self.spool = spool or Spool()
+        self.writer = writer or BulkWriter()
+        self.batch_rows = batch_rows or config.INGEST_BATCH_SIZE
+        self._batches_table = None
+
+    @property
+    def batches_table(self):
+        """Ingested batch IDs, committed in the same transaction as their rows"""
+        if self._batches_table is None:
+            from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+
+            table = Table(
+                BATCHES_TABLE, MetaData(),
+                Column('batch_id', String(32), primary_key=True),
+                Column('points', Integer, nullable=False),
+                Column('ingested_at', DateTime, nullable=False),
+            )
+            table.create(self.writer.engine, checkfirst=True)
+            self._batches_table = table
+        return self._batches_table
+
+    def flush(self, max_batches: Optional[int] = None) -> FlushResult:
+        """Ingest everything after the checkpoint (or up to `max_batches` spool batches)"""
+        position = self.spool.load_checkpoint()
+        group: List[SpoolRecord] = []
+        group_rows = 0
+        batches = inserted = duplicates = 0
+
+        for end, record in self.spool.read_from(position):
+            group.append(record)
+            group_rows += len(record.points)
+            position = end
+            if group_rows >= self.batch_rows or (max_batches and batches + len(group) >= max_batches):
+                added, skipped = self._ingest(group)
+                self.spool.save_checkpoint(position)
+                batches, inserted, duplicates = batches + len(group), inserted + added, duplicates + skipped
+                group, group_rows = [], 0
+                if max_batches and batches >= max_batches:
+                    break
+
+        if group:
+            added, skipped = self._ingest(group)
+            self.spool.save_checkpoint(position)
+            batches, inserted, duplicates = batches + len(group), inserted + added, duplicates + skipped
+
+        return FlushResult(batches, inserted, duplicates)
+
+    def _ingest(self, records: List[SpoolRecord]) -> Tuple[int, int]:
+        """One transaction: record new batch IDs and insert their rows"""
+        from penguin.data.storage.bulk import prepare_rows
+
+        table = self.batches_table
+        self.writer.ensure_dedupe_index()
+
+        # A concurrent flusher claiming the same batch trips the primary key and
+        # rolls this transaction back; the next flush skips what it committed
+        with self.writer.engine.begin() as conn:
+            already = set(conn.execute(
+                table.select().with_only_columns(table.c.batch_id).where(
+                    table.c.batch_id.in_([record.batch_id for record in records])
+                )
+            ).scalars())
+            fresh = [record for record in records if record.batch_id not in already]
+            if not fresh:
+                return 0, len(records)
+
+            conn.execute(table.insert(), [
+                {'batch_id': record.batch_id, 'points': len(record.points),
+                 'ingested_at': datetime.utcnow()}
+                for record in fresh
+            ])
+            rows = prepare_rows(point for record in fresh for point in record.points)
+            inserted = self.writer.write_rows(conn, rows) if rows else 0
+
+        return inserted, len(records) - len(fresh)
+
+
+def spool_data_points(data_points: List[Dict[str, Any]], spool: Optional[Spool] = None) -> int:
+    """Scheduler-compatible save: queue the batch and report it as accepted"""
+    (spool or Spool()).append(data_points)
+    return len(data_points)
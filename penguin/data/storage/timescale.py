@@ -0,0 +1,267 @@
+"""
+TimescaleDB storage backend
+Turns data_points into a hypertable (daily time chunks), maintains real-time
+per-minute and per-hour continuous aggregates, and applies retention and
+compression policies from DATA_RETENTION_DAYS
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from penguin.core.config import config
+
+
+HYPERTABLE = 'data_points'
+# Time partitioning only: a symbol space dimension buys nothing on a single
+# node and would have to be part of every unique index (symbol is nullable)
+CHUNK_INTERVAL = '1 day'
+
+# Aggregate name -> (bucket width, refresh start offset, refresh end offset, schedule)
+AGGREGATES = {
+    'data_points_1m': (timedelta(minutes=1), '2 hours', '1 minute', '1 minute'),
+    'data_points_1h': (timedelta(hours=1), '3 days', '1 hour', '30 minutes'),
+}
+
+# Sentiment is stored per post in extra_data by the social collectors
+SENTIMENT_EXPR = "(extra_data->>'sentiment_score')::double precision"
+
+
+class AggregatePoint(NamedTuple):
+    """One bucket of a continuous aggregate (field names mirror DataPoint)"""
+    timestamp: datetime
+    symbol: str
+    source: str
+    data_type: str
+    value: float            # sum of value over the bucket (mention count for mentions)
+    count: int
+    avg_value: Optional[float]
+    avg_sentiment: Optional[float]
+
+
+def pick_aggregate(resolution: Optional[timedelta],
+                   available: Iterable[str] = AGGREGATES) -> Optional[str]:
+    """Coarsest available aggregate whose bucket fits the requested resolution (None = raw rows)"""
+    if resolution is None:
+        return None
+    best = None
+    for name in available:
+        bucket = AGGREGATES[name][0]
+        if bucket <= resolution and (best is None or bucket > AGGREGATES[best][0]):
+            best = name
+    return best
+
+
+def parse_resolution(value: Optional[str]) -> Optional[timedelta]:
+    """'raw', '5m', '1h', '1d' -> timedelta (None for raw)"""
+    if not value or value == 'raw':
+        return None
+    units = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+    unit = value[-1].lower()
+    if unit not in units or not value[:-1].isdigit():
+        raise ValueError(f"Unsupported resolution: {value}")
+    return timedelta(**{units[unit]: int(value[:-1])})
+
+
+class TimescaleBackend:
+    """Schema management and aggregate queries against TIMESCALE_URL"""
+
+    def __init__(self, url: Optional[str] = None, retention_days: Optional[int] = None,
+                 compress_after_days: Optional[int] = None):
+        self.url = url or config.TIMESCALE_URL
+        self.retention_days = retention_days or config.DATA_RETENTION_DAYS
+        # Compression must kick in before chunks are dropped
+        self.compress_after_days = min(
+            compress_after_days or config.TIMESCALE_COMPRESS_AFTER_DAYS,
+            max(self.retention_days - 1, 1),
+        )
+        self._engine: Optional[Engine] = None
+        self._aggregates: Optional[Set[str]] = None
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = create_engine(self.url, pool_pre_ping=True)
+        return self._engine
+
+    # --- Schema ------------------------------------------------------------
+
+    def setup(self):
+        """Idempotently convert data_points and create aggregates and policies"""
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+            self._ensure_time_in_primary_key(conn)
+            conn.execute(text(
+                f"SELECT create_hypertable('{HYPERTABLE}', 'timestamp', "
+                f"chunk_time_interval => INTERVAL '{CHUNK_INTERVAL}', "
+                f"if_not_exists => TRUE, migrate_data => TRUE)"
+            ))
+
+            conn.execute(text(
+                f"ALTER TABLE {HYPERTABLE} SET (timescaledb.compress, "
+                f"timescaledb.compress_segmentby = 'symbol, source', "
+                f"timescaledb.compress_orderby = 'timestamp DESC')"
+            ))
+            conn.execute(text(
+                f"SELECT add_compression_policy('{HYPERTABLE}', "
+                f"INTERVAL '{self.compress_after_days} days', if_not_exists => TRUE)"
+            ))
+            conn.execute(text(
+                f"SELECT add_retention_policy('{HYPERTABLE}', "
+                f"INTERVAL '{self.retention_days} days', if_not_exists => TRUE)"
+            ))
+
+        # Continuous aggregates cannot be created inside a transaction block
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            for name, (bucket, start_offset, end_offset, schedule) in AGGREGATES.items():
+                conn.execute(text(self._aggregate_ddl(name, bucket)))
+                # Views from before real-time aggregation was enabled
+                conn.execute(text(
+                    f"ALTER MATERIALIZED VIEW {name} SET (timescaledb.materialized_only = false)"
+                ))
+                conn.execute(text(
+                    f"SELECT add_continuous_aggregate_policy('{name}', "
+                    f"start_offset => INTERVAL '{start_offset}', "
+                    f"end_offset => INTERVAL '{end_offset}', "
+                    f"schedule_interval => INTERVAL '{schedule}', if_not_exists => TRUE)"
+                ))
+                conn.execute(text(
+                    f"SELECT add_retention_policy('{name}', "
+                    f"INTERVAL '{self.retention_days} days', if_not_exists => TRUE)"
+                ))
+        self._aggregates = None
+
+    def aggregates(self) -> Set[str]:
+        """
+        Continuous aggregates that exist in the database (checked once)
+        Empty on SQLite, plain PostgreSQL, or before `penguin init --timescale`
+        """
+        if self._aggregates is None:
+            found: Set[str] = set()
+            if self.engine.dialect.name == 'postgresql':
+                with self.engine.connect() as conn:
+                    if conn.execute(text(
+                        "SELECT to_regclass('timescaledb_information.continuous_aggregates')"
+                    )).scalar() is not None:
+                        found = set(conn.execute(text(
+                            "SELECT view_name FROM timescaledb_information.continuous_aggregates"
+                        )).scalars())
+            self._aggregates = found & set(AGGREGATES)
+        return self._aggregates
+
+    def _ensure_time_in_primary_key(self, conn):
+        """Hypertable unique constraints must include the time column"""
+        pk_columns = conn.execute(text(
+            "SELECT a.attname FROM pg_index i "
+            "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+            f"WHERE i.indrelid = '{HYPERTABLE}'::regclass AND i.indisprimary"
+        )).scalars().all()
+
+        if pk_columns and 'timestamp' not in pk_columns:
+            constraint = conn.execute(text(
+                "SELECT conname FROM pg_constraint "
+                f"WHERE conrelid = '{HYPERTABLE}'::regclass AND contype = 'p'"
+            )).scalar()
+            conn.execute(text(
+                f"ALTER TABLE {HYPERTABLE} DROP CONSTRAINT {constraint}, "
+                f"ADD PRIMARY KEY ({', '.join(pk_columns)}, timestamp)"
+            ))
+
+    @staticmethod
+    def _aggregate_ddl(name: str, bucket: timedelta) -> str:
+        # Real-time: buckets newer than the last refresh are computed from raw rows
+        # (materialized-only is the default since TimescaleDB 2.13)
+        seconds = int(bucket.total_seconds())
+        return (
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} "
+            f"WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS "
+            f"SELECT time_bucket(INTERVAL '{seconds} seconds', timestamp) AS bucket, "
+            f"symbol, source, data_type, "
+            f"count(*) AS count, sum(value) AS value, avg(value) AS avg_value, "
+            f"avg({SENTIMENT_EXPR}) AS avg_sentiment "
+            f"FROM {HYPERTABLE} "
+            f"GROUP BY bucket, symbol, source, data_type "
+            f"WITH NO DATA"
+        )
+
+    # --- Queries -----------------------------------------------------------
+
+    def get_aggregated_points(self, aggregate: str, symbol: Optional[str] = None,
+                              source: Optional[str] = None, data_type: Optional[str] = None,
+                              hours: int = 24, limit: int = 100,
+                              resolution: Optional[timedelta] = None) -> List[AggregatePoint]:
+        """
+        Recent buckets from a continuous aggregate, newest first
+        A resolution wider than the aggregate's bucket is re-bucketed on the fly
+        """
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {aggregate}")
+
+        filters = ["bucket >= :since"]
+        params: Dict = {'since': datetime.utcnow() - timedelta(hours=hours), 'limit': limit}
+        for column, value in (('symbol', symbol), ('source', source), ('data_type', data_type)):
+            if value:
+                filters.append(f"{column} = :{column}")
+                params[column] = value
+        where = ' AND '.join(filters)
+
+        if resolution is None or resolution == AGGREGATES[aggregate][0]:
+            query = text(
+                f"SELECT bucket, symbol, source, data_type, value, count, avg_value, avg_sentiment "
+                f"FROM {aggregate} WHERE {where} "
+                f"ORDER BY bucket DESC LIMIT :limit"
+            )
+        else:
+            # Sentiment is re-weighted by bucket counts
+            params['width'] = resolution
+            query = text(
+                f"SELECT time_bucket(:width, bucket) AS wide, symbol, source, data_type, "
+                f"sum(value), sum(count), sum(value) / sum(count), "
+                f"sum(avg_sentiment * count) / nullif(sum(count) FILTER (WHERE avg_sentiment IS NOT NULL), 0) "
+                f"FROM {aggregate} WHERE {where} "
+                f"GROUP BY wide, symbol, source, data_type "
+                f"ORDER BY wide DESC LIMIT :limit"
+            )
+
+        with self.engine.connect() as conn:
+            return [AggregatePoint(*row) for row in conn.execute(query, params)]
+
+
+timescale = TimescaleBackend()
+
+
+def aggregate_for(resolution: Optional[timedelta]) -> Optional[str]:
+    """Aggregate a query at this resolution is served from (None = raw rows from the store)"""
+    if resolution is None:
+        return None
+    return pick_aggregate(resolution, timescale.aggregates())
+
+
+def get_recent_data_points(symbol: Optional[str] = None, source: Optional[str] = None,
+                           data_type: Optional[str] = None, hours: int = 24, limit: int = 100,
+                           resolution: Optional[timedelta] = None):
+    """
+    store.get_recent_data_points, routed to a continuous aggregate when the
+    requested resolution is at least one of the bucket widths and the aggregate
+    exists; raw rows otherwise
+    """
+    aggregate = aggregate_for(resolution)
+    if aggregate is not None:
+        return timescale.get_aggregated_points(
+            aggregate, symbol=symbol, source=source, data_type=data_type,
+            hours=hours, limit=limit, resolution=resolution,
+        )
+
+    from penguin.data.storage.store import store
+    kwargs = {'data_type': data_type} if data_type else {}
+    return store.get_recent_data_points(symbol=symbol, source=source, hours=hours,
+                                        limit=limit, **kwargs)
+
+
+def point_dict(point) -> Dict:
+    """DataPoint row or AggregatePoint -> plain dict (column/field name -> value)"""
+    if isinstance(point, AggregatePoint):
+        return point._asdict()
+    return {column.name: getattr(point, column.name) for column in point.__table__.columns}
@@ -0,0 +1 @@
+"""Technical indicator engines for PENGUIN"""
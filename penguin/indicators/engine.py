@@ -0,0 +1,514 @@
+"""
+Cross-sectional indicator engine
+Computes technical indicators for a whole universe at once from
+(time x symbols) NumPy price matrices
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# --- Rolling primitives (axis 0 is time, axis 1 is symbol) ------------------
+# Windows containing a NaN produce NaN, matching pandas min_periods=window
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum via cumulative sums"""
+    out = np.full(x.shape, np.nan)
+    if len(x) < window:
+        return out
+
+    valid = ~np.isnan(x)
+    csum = np.cumsum(np.where(valid, x, 0.0), axis=0)
+    ccount = np.cumsum(valid, axis=0)
+
+    total = csum[window - 1:].copy()
+    total[1:] -= csum[:-window]
+    count = ccount[window - 1:].copy()
+    count[1:] -= ccount[:-window]
+
+    out[window - 1:] = np.where(count == window, total, np.nan)
+    return out
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average"""
+    return rolling_sum(x, window) / window
+
+
+def _rolling_apply(x: np.ndarray, window: int, func) -> np.ndarray:
+    """Apply a reduction over sliding windows"""
+    out = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        out[window - 1:] = func(sliding_window_view(x, window, axis=0), axis=-1)
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation (ddof=1, as pandas)"""
+    return _rolling_apply(x, window, lambda v, axis: v.std(axis=axis, ddof=1))
+
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_apply(x, window, np.max)
+
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_apply(x, window, np.min)
+
+
+def _rolling_position(x: np.ndarray, window: int, func) -> np.ndarray:
+    """Index of the window's extreme (0 = oldest bar), NaN for windows containing a NaN"""
+    out = _rolling_apply(x, window, lambda v, axis: func(v, axis=axis).astype('f8'))
+    out[np.isnan(rolling_sum(x, window))] = np.nan
+    return out
+
+
+def rolling_argmax(x: np.ndarray, window: int) -> np.ndarray:
+    """Position of the window maximum (first occurrence on ties)"""
+    return _rolling_position(x, window, np.argmax)
+
+
+def rolling_argmin(x: np.ndarray, window: int) -> np.ndarray:
+    """Position of the window minimum (first occurrence on ties)"""
+    return _rolling_position(x, window, np.argmin)
+
+
+def rolling_wma(x: np.ndarray, window: int) -> np.ndarray:
+    """Linearly weighted moving average (newest bar weighs `window`)"""
+    weights = np.arange(1, window + 1, dtype='f8')
+    return _rolling_apply(x, window, lambda v, axis: v @ weights / weights.sum())
+
+
+def rolling_cov(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """Sample covariance (ddof=1) via rolling sums; y may be a single (time x 1) column"""
+    with np.errstate(invalid='ignore'):
+        return (rolling_sum(x * y, window)
+                - rolling_sum(x, window) * rolling_sum(y, window) / window) / (window - 1)
+
+
+def rolling_mean_deviation(x: np.ndarray, window: int) -> np.ndarray:
+    """Mean absolute deviation from the window mean (for CCI)"""
+    def mad(v, axis):
+        return np.abs(v - v.mean(axis=axis, keepdims=True)).mean(axis=axis)
+    return _rolling_apply(x, window, mad)
+
+
+def ewm(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average with pandas ewm(adjust=False, ignore_na=True) semantics
+    NaNs carry the previous value forward; series start at their first value
+    """
+    out = np.empty(x.shape)
+    prev = np.full(x.shape[1:], np.nan)
+
+    for t in range(len(x)):
+        row = x[t]
+        prev = np.where(np.isnan(prev), row, np.where(np.isnan(row), prev, alpha * row + (1 - alpha) * prev))
+        out[t] = prev
+    return out
+
+
+def ema(x: np.ndarray, span: int) -> np.ndarray:
+    """EMA by span (alpha = 2 / (span + 1))"""
+    return ewm(x, 2.0 / (span + 1))
+
+
+def wilder(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's smoothing (RMA, alpha = 1 / period)"""
+    return ewm(x, 1.0 / period)
+
+
+def shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift forward in time, padding with NaN"""
+    out = np.full(x.shape, np.nan)
+    if periods < len(x):
+        out[periods:] = x[:-periods]
+    return out
+
+
+def rolling_midpoint(high: np.ndarray, low: np.ndarray, window: int) -> np.ndarray:
+    """(highest high + lowest low) / 2 over the window (Ichimoku lines)"""
+    return (rolling_max(high, window) + rolling_min(low, window)) / 2
+
+
+def supertrend(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               atr: np.ndarray, multiplier: float = 3.0):
+    """
+    Supertrend line and direction (+1 up, -1 down), stepping through time
+    for all symbols at once; bands only tighten while the trend holds
+    """
+    hl2 = (high + low) / 2
+    basic_upper = hl2 + multiplier * atr
+    basic_lower = hl2 - multiplier * atr
+
+    line = np.full(close.shape, np.nan)
+    direction = np.full(close.shape, np.nan)
+    upper = np.full(close.shape[1:], np.nan)
+    lower = np.full(close.shape[1:], np.nan)
+    trend = np.full(close.shape[1:], np.nan)
+    prev_close = np.full(close.shape[1:], np.nan)
+
+    for t in range(len(close)):
+        bu, bl, c = basic_upper[t], basic_lower[t], close[t]
+        missing = np.isnan(bu) | np.isnan(c)
+        new_upper = np.where(np.isnan(upper) | (bu < upper) | (prev_close > upper), bu, upper)
+        new_lower = np.where(np.isnan(lower) | (bl > lower) | (prev_close < lower), bl, lower)
+        new_trend = np.where(np.isnan(trend), 1.0,
+                             np.where(trend > 0, np.where(c < new_lower, -1.0, 1.0),
+                                      np.where(c > new_upper, 1.0, -1.0)))
+
+        # Missing bars carry the previous state
+        upper = np.where(missing, upper, new_upper)
+        lower = np.where(missing, lower, new_lower)
+        trend = np.where(missing, trend, new_trend)
+        prev_close = np.where(missing, prev_close, c)
+
+        direction[t] = trend
+        line[t] = np.where(trend > 0, lower, upper)
+    return line, direction
+
+
+def volume_profile(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                   window: int = 20, bins: int = 10, rows: Optional[range] = None):
+    """
+    Lower and upper edge of the price bin that traded the most volume over
+    each window: `bins` equal bins between the window's low and high, each
+    bar's volume counted at its typical price; only `rows` are computed
+    (default: every full window)
+    """
+    typical = (high + low + close) / 3
+    edge_low = np.full(close.shape, np.nan)
+    edge_high = np.full(close.shape, np.nan)
+
+    for t in rows if rows is not None else range(window - 1, len(close)):
+        span = slice(t - window + 1, t + 1)
+        bottom = low[span].min(axis=0)
+        width = (high[span].max(axis=0) - bottom) / bins
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position = np.clip(np.floor((typical[span] - bottom) / width), 0, bins - 1)
+        weights = np.stack([np.where(position == b, volume[span], 0.0).sum(axis=0) for b in range(bins)])
+        lower = bottom + np.argmax(weights, axis=0) * width
+
+        valid = (width > 0) & ~np.isnan(typical[span]).any(axis=0) & ~np.isnan(volume[span]).any(axis=0)
+        edge_low[t] = np.where(valid, lower, np.nan)
+        edge_high[t] = np.where(valid, lower + width, np.nan)
+    return edge_low, edge_high
+
+
+def _label(conditions, labels, default: str) -> np.ndarray:
+    """First matching label per element (NaN comparisons fall through to the default)"""
+    return np.select(conditions, labels, default=default)
+
+
+def _safe_divide(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Elementwise division with NaN where the denominator is 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(den == 0, np.nan, num / den)
+
+
+def _rsi(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI from average gains/losses (100 when there were no losses)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+# --- Engine ------------------------------------------------------------------
+
+class PriceMatrix(NamedTuple):
+    """Aligned (time x symbols) OHLCV matrices"""
+    dates: pd.DatetimeIndex
+    symbols: List[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'PriceMatrix':
+        """Build from a bulk (field, symbol) frame as returned by download_history"""
+        close = frame['Close']
+        symbols = list(close.columns)
+
+        def field(name: str) -> np.ndarray:
+            return frame[name].reindex(columns=symbols).to_numpy(dtype='f8')
+
+        return cls(close.index, symbols, field('Open'), field('High'),
+                   field('Low'), field('Close'), field('Volume'))
+
+
+class IndicatorEngine:
+    """Vectorized indicator pass over a whole universe"""
+
+    def __init__(self, benchmark: str = 'SPY'):
+        """benchmark: symbol correlation_spy/beta are measured against (NaN if not in the universe)"""
+        self.benchmark = benchmark
+
+    def compute(self, prices: PriceMatrix, latest_only: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Compute every indicator
+        Returns name -> (time x symbols) array, or name -> (symbols,) array of
+        the last row when latest_only=True
+        """
+        close, high, low, volume = prices.close, prices.high, prices.low, prices.volume
+        result: Dict[str, np.ndarray] = {}
+
+        def put(name: str, values: np.ndarray):
+            result[name] = values[-1].copy() if latest_only else values
+
+        prev_close = shift(close)
+        put('current_price', close)
+
+        # Trend
+        sma = {}
+        for window in (5, 10, 20, 50, 200):
+            sma[window] = rolling_mean(close, window)
+            put(f'sma_{window}', sma[window])
+
+        emas = {}
+        for span in (9, 12, 20, 26):
+            emas[span] = ema(close, span)
+            if span != 20:
+                put(f'ema_{span}', emas[span])
+
+        # Double EMA and Hull MA (20)
+        put('dema', 2 * emas[20] - ema(emas[20], 20))
+        put('hull_ma', rolling_wma(2 * rolling_wma(close, 10) - rolling_wma(close, 20), 4))
+
+        put('price_vs_sma20', _safe_divide(close - sma[20], sma[20]) * 100)
+        put('price_vs_sma200', _safe_divide(close - sma[200], sma[200]) * 100)
+
+        macd = emas[12] - emas[26]
+        macd_signal = ema(macd, 9)
+        put('macd', macd)
+        put('macd_signal', macd_signal)
+        put('macd_histogram', macd - macd_signal)
+
+        # Momentum
+        delta = close - prev_close
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        gain[np.isnan(delta)] = np.nan
+        loss[np.isnan(delta)] = np.nan
+
+        rsi_14 = _rsi(wilder(gain, 14), wilder(loss, 14))
+        put('rsi_14', rsi_14)
+        put('rsi_status', _label([rsi_14 < 30, rsi_14 > 70], ['oversold', 'overbought'], 'neutral'))
+        # Simple-average RSI used by the PoC scrapers
+        put('rsi_14_sma', _rsi(rolling_mean(gain, 14), rolling_mean(loss, 14)))
+
+        highest_14 = rolling_max(high, 14)
+        lowest_14 = rolling_min(low, 14)
+        stoch_k = _safe_divide(close - lowest_14, highest_14 - lowest_14) * 100
+        put('stoch_k', stoch_k)
+        put('stoch_d', rolling_mean(stoch_k, 3))
+        put('stoch_signal', _label([stoch_k < 20, stoch_k > 80], ['oversold', 'overbought'], 'neutral'))
+        put('williams_r', _safe_divide(highest_14 - close, highest_14 - lowest_14) * -100)
+
+        for window in (10, 20):
+            put(f'roc_{window}d', _safe_divide(close - shift(close, window), shift(close, window)) * 100)
+        put('momentum_10d', close - shift(close, 10))
+
+        # True Strength Index (25, 13)
+        put('tsi', 100 * _safe_divide(ema(ema(delta, 25), 13), ema(ema(np.abs(delta), 25), 13)))
+
+        # Ultimate Oscillator (7, 14, 28)
+        floor = np.fmin(low, prev_close)
+        buying_pressure = close - floor
+        uo_range = np.fmax(high, prev_close) - floor
+        averages = [_safe_divide(rolling_sum(buying_pressure, window), rolling_sum(uo_range, window))
+                    for window in (7, 14, 28)]
+        put('uo', 100 * (4 * averages[0] + 2 * averages[1] + averages[2]) / 7)
+
+        typical = (high + low + close) / 3
+        put('cci', _safe_divide(typical - rolling_mean(typical, 20),
+                                0.015 * rolling_mean_deviation(typical, 20)))
+
+        # Volatility
+        std_20 = rolling_std(close, 20)
+        bb_upper = sma[20] + 2 * std_20
+        bb_lower = sma[20] - 2 * std_20
+        put('bb_upper', bb_upper)
+        put('bb_middle', sma[20])
+        put('bb_lower', bb_lower)
+        put('bb_width', _safe_divide(bb_upper - bb_lower, sma[20]) * 100)
+        put('bb_percent_b', _safe_divide(close - bb_lower, bb_upper - bb_lower))
+
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        true_range[0] = high[0] - low[0]
+        atr_14 = wilder(true_range, 14)
+        put('atr_14', atr_14)
+
+        keltner_upper = emas[20] + 2 * atr_14
+        keltner_lower = emas[20] - 2 * atr_14
+        put('keltner_upper', keltner_upper)
+        put('keltner_middle', emas[20])
+        put('keltner_lower', keltner_lower)
+        # Bollinger Bands inside the Keltner Channel: volatility coiled for a breakout
+        put('bb_squeeze', (bb_upper < keltner_upper) & (bb_lower > keltner_lower))
+        put('donchian_upper', rolling_max(high, 20))
+        put('donchian_lower', rolling_min(low, 20))
+
+        returns = _safe_divide(delta, prev_close)
+        returns_std_10 = rolling_std(returns, 10)
+        put('volatility_10d', returns_std_10 * 100)
+        volatility_30d = rolling_std(returns, 30) * 100
+        put('volatility_30d', volatility_30d)
+        put('volatility_level', _label(
+            [np.isnan(volatility_30d), volatility_30d < 1.5, volatility_30d < 3.0],
+            ['unknown', 'low', 'moderate'], 'high'
+        ))
+
+        # Trend strength (ADX)
+        up_move = high - shift(high)
+        down_move = shift(low) - low
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+        plus_dm[0] = minus_dm[0] = np.nan
+        plus_di = 100 * _safe_divide(wilder(plus_dm, 14), atr_14)
+        minus_di = 100 * _safe_divide(wilder(minus_dm, 14), atr_14)
+        dx = 100 * _safe_divide(np.abs(plus_di - minus_di), plus_di + minus_di)
+        put('plus_di', plus_di)
+        put('minus_di', minus_di)
+        put('adx', wilder(dx, 14))
+
+        # Volume
+        volume_avg_10 = rolling_mean(volume, 10)
+        put('volume_current', volume)
+        put('volume_avg_10d', volume_avg_10)
+        volume_ratio = _safe_divide(volume, volume_avg_10)
+        put('volume_ratio_10day', volume_ratio)
+        # Same 1.5x threshold as the PoC detect_signals
+        put('volume_spike', volume_ratio > 1.5)
+
+        direction = np.sign(np.nan_to_num(delta))
+        obv = np.cumsum(direction * np.nan_to_num(volume), axis=0)
+        put('obv', obv)
+        obv_sma_10 = rolling_mean(obv, 10)
+        put('obv_trend', _label([obv > obv_sma_10, obv < obv_sma_10], ['rising', 'falling'], 'flat'))
+
+        money_flow_multiplier = _safe_divide((close - low) - (high - close), high - low)
+        money_flow_volume = np.nan_to_num(money_flow_multiplier) * volume
+        put('cmf', _safe_divide(rolling_sum(money_flow_volume, 20), rolling_sum(volume, 20)))
+        put('ad_line', np.cumsum(np.nan_to_num(money_flow_volume), axis=0))
+        put('force_index', ema(delta * volume, 13))
+
+        # Ease of movement (14), volume in units of 100M shares
+        midpoint = (high + low) / 2
+        box_ratio = _safe_divide(volume / 1e8, high - low)
+        put('ease_of_movement', rolling_mean(_safe_divide(midpoint - shift(midpoint), box_ratio), 14))
+
+        last_row = len(close) - 1
+        profile_low, profile_high = volume_profile(
+            high, low, close, volume, rows=range(max(last_row, 19), len(close)) if latest_only else None
+        )
+        put('volume_profile_low', profile_low)
+        put('volume_profile_high', profile_high)
+
+        raw_money_flow = typical * volume
+        typical_delta = typical - shift(typical)
+        positive_flow = rolling_sum(np.where(typical_delta > 0, raw_money_flow, 0.0), 14)
+        negative_flow = rolling_sum(np.where(typical_delta < 0, raw_money_flow, 0.0), 14)
+        put('mfi', 100 - 100 / (1 + _safe_divide(positive_flow, negative_flow)))
+
+        put('vwap', _safe_divide(rolling_sum(raw_money_flow, 20), rolling_sum(volume, 20)))
+
+        # Price patterns: 20-day swing low/high as support/resistance
+        support = rolling_min(low, 20)
+        resistance = rolling_max(high, 20)
+        put('support_level', support)
+        put('resistance_level', resistance)
+        put('distance_to_support', _safe_divide(close - support, close) * 100)
+        put('distance_to_resistance', _safe_divide(resistance - close, close) * 100)
+        channel = resistance - support
+        put('price_channel_position', _safe_divide(close - support, channel))
+        # 20-day range within 5% of the price
+        put('consolidation_detected', _safe_divide(channel, close) * 100 < 5)
+
+        # Fibonacci levels across the 20-day range (fib_0 = low, fib_100 = high)
+        for name, ratio in (('fib_0', 0.0), ('fib_236', 0.236), ('fib_382', 0.382), ('fib_500', 0.5),
+                            ('fib_618', 0.618), ('fib_786', 0.786), ('fib_100', 1.0)):
+            put(name, support + ratio * channel)
+
+        # Classic floor pivots from this bar, for the next session
+        pivot = typical
+        put('pivot_point', pivot)
+        put('pivot_classic', pivot)
+        put('pivot_r1', 2 * pivot - low)
+        put('pivot_s1', 2 * pivot - high)
+        put('pivot_r2', pivot + (high - low))
+        put('pivot_s2', pivot - (high - low))
+
+        # Ichimoku (9/26/52); the cloud is the one plotted under today's bar,
+        # i.e. spans computed 26 bars ago, and the lagging span's latest point
+        # is today's close
+        tenkan = rolling_midpoint(high, low, 9)
+        kijun = rolling_midpoint(high, low, 26)
+        senkou_a = shift((tenkan + kijun) / 2, 26)
+        senkou_b = shift(rolling_midpoint(high, low, 52), 26)
+        put('ichimoku_tenkan', tenkan)
+        put('ichimoku_kijun', kijun)
+        put('ichimoku_senkou_a', senkou_a)
+        put('ichimoku_senkou_b', senkou_b)
+        put('ichimoku_chikou', close)
+        cloud_top = np.fmax(senkou_a, senkou_b)
+        cloud_bottom = np.fmin(senkou_a, senkou_b)
+        put('ichimoku_signal', _label(
+            [(close > cloud_top) & (tenkan > kijun), (close < cloud_bottom) & (tenkan < kijun)],
+            ['bullish', 'bearish'], 'neutral'
+        ))
+
+        # Supertrend (10, 3)
+        trend_line, trend_direction = supertrend(high, low, close, wilder(true_range, 10))
+        put('supertrend', trend_line)
+        put('supertrend_direction', _label([trend_direction > 0, trend_direction < 0], ['up', 'down'], ''))
+
+        # Vortex (14)
+        range_sum = rolling_sum(true_range, 14)
+        put('vortex_positive', _safe_divide(rolling_sum(np.abs(high - shift(low)), 14), range_sum))
+        put('vortex_negative', _safe_divide(rolling_sum(np.abs(low - shift(high)), 14), range_sum))
+
+        # Aroon (25): bars since the 25-day high/low, over the 26 bars that include today
+        aroon_up = rolling_argmax(high, 26) / 25 * 100
+        aroon_down = rolling_argmin(low, 26) / 25 * 100
+        put('aroon_up', aroon_up)
+        put('aroon_down', aroon_down)
+        put('aroon_oscillator', aroon_up - aroon_down)
+
+        # Returns & statistics
+        for window in (1, 5, 10, 20, 50):
+            put(f'return_{window}d', _safe_divide(close - shift(close, window), shift(close, window)) * 100)
+        put('z_score', _safe_divide(close - sma[20], std_20))
+        # Annualized, in percent (volatility_10d is the daily figure)
+        put('volatility_10d_pct', returns_std_10 * np.sqrt(252) * 100)
+        put('sharpe_ratio_20d', _safe_divide(rolling_mean(returns, 20), rolling_std(returns, 20)) * np.sqrt(252))
+
+        # Correlation and beta of daily returns against the benchmark over 60 days
+        if self.benchmark in prices.symbols:
+            market = returns[:, [prices.symbols.index(self.benchmark)]]
+            covariance = rolling_cov(returns, market, 60)
+            market_variance = rolling_cov(market, market, 60)
+            with np.errstate(invalid='ignore'):
+                put('correlation_spy', _safe_divide(
+                    covariance, np.sqrt(rolling_cov(returns, returns, 60) * market_variance)))
+            put('beta', _safe_divide(covariance, market_variance))
+        else:
+            put('correlation_spy', np.full(close.shape, np.nan))
+            put('beta', np.full(close.shape, np.nan))
+
+        return result
+
+    def compute_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Latest value of every indicator as a (symbols x indicators) DataFrame"""
+        prices = PriceMatrix.from_frame(frame)
+        latest = self.compute(prices, latest_only=True)
+        return pd.DataFrame(latest, index=pd.Index(prices.symbols, name='symbol'))
+
+
+def compute_indicators(prices: PriceMatrix, latest_only: bool = False,
+                       engine: Optional[IndicatorEngine] = None) -> Dict[str, np.ndarray]:
+    """Module-level shortcut for IndicatorEngine().compute"""
+    return (engine or IndicatorEngine()).compute(prices, latest_only=latest_only)
@@ -0,0 +1,291 @@
+"""
+Streaming indicators
+Constant-time per-tick updates for indicators that would otherwise be
+recomputed over the whole window on every new bar, with JSON-serializable
+state so realtime/high-frequency sources survive restarts
+"""
+
+import json
+import math
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+class StreamingIndicator:
+    """Base class: update() consumes one value, to_dict()/from_dict() round-trip state"""
+
+    kind = 'indicator'
+    _registry: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        StreamingIndicator._registry[cls.kind] = cls
+
+    def update(self, value: float) -> Optional[float]:
+        raise NotImplementedError
+
+    @property
+    def value(self) -> Optional[float]:
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, **self.__dict__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StreamingIndicator':
+        """Rebuild any registered indicator from to_dict() output"""
+        data = dict(data)
+        indicator_cls = cls._registry[data.pop('kind')]
+        indicator = indicator_cls.__new__(indicator_cls)
+        indicator.__dict__.update(indicator_cls._restore(data))
+        return indicator
+
+    @classmethod
+    def _restore(cls, data: Dict) -> Dict:
+        return data
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average over a ring buffer with a running sum"""
+
+    kind = 'sma'
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = deque(maxlen=window)
+        self.total = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self.buffer) == self.window:
+            self.total -= self.buffer[0]
+        self.buffer.append(value)
+        self.total += value
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self.buffer) < self.window:
+            return None
+        return self.total / self.window
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'window': self.window,
+                'buffer': list(self.buffer), 'total': self.total}
+
+    @classmethod
+    def _restore(cls, data: Dict) -> Dict:
+        data['buffer'] = deque(data['buffer'], maxlen=data['window'])
+        return data
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average seeded with the first value (pandas adjust=False)"""
+
+    kind = 'ema'
+
+    def __init__(self, span: Optional[int] = None, alpha: Optional[float] = None):
+        if alpha is None:
+            if span is None:
+                raise ValueError("Either span or alpha is required")
+            alpha = 2.0 / (span + 1)
+        self.alpha = alpha
+        self.current: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self.current is None:
+            self.current = value
+        else:
+            self.current = self.alpha * value + (1 - self.alpha) * self.current
+        return self.current
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.current
+
+
+class WilderRSI(StreamingIndicator):
+    """Relative Strength Index with Wilder smoothing of gains and losses"""
+
+    kind = 'rsi'
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self.prev_close is not None:
+            delta = value - self.prev_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            if self.avg_gain is None:
+                self.avg_gain, self.avg_loss = gain, loss
+            else:
+                alpha = 1.0 / self.period
+                self.avg_gain = alpha * gain + (1 - alpha) * self.avg_gain
+                self.avg_loss = alpha * loss + (1 - alpha) * self.avg_loss
+        self.prev_close = value
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.avg_gain is None:
+            return None
+        if self.avg_loss == 0:
+            return 100.0 if self.avg_gain > 0 else None
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+
+class RollingVariance(StreamingIndicator):
+    """Sliding-window mean/variance using Welford's update with removal"""
+
+    kind = 'variance'
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = deque(maxlen=window)
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self.buffer) < self.window:
+            # Growing phase: standard Welford
+            self.buffer.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.buffer)
+            self.m2 += delta * (value - self.mean)
+        else:
+            # Full window: replace the oldest value in one step
+            old = self.buffer[0]
+            self.buffer.append(value)
+            old_mean = self.mean
+            self.mean += (value - old) / self.window
+            self.m2 += (value - old) * (value - self.mean + old - old_mean)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        """Sample variance (ddof=1), once the window is full"""
+        if len(self.buffer) < self.window:
+            return None
+        return max(self.m2, 0.0) / (self.window - 1)
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.value
+        return None if variance is None else math.sqrt(variance)
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'window': self.window, 'buffer': list(self.buffer),
+                'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def _restore(cls, data: Dict) -> Dict:
+        data['buffer'] = deque(data['buffer'], maxlen=data['window'])
+        return data
+
+
+class SymbolIndicators:
+    """
+    Streaming counterparts of the batch engine's core close-price indicators
+    Value names match IndicatorEngine output
+    """
+
+    def __init__(self, bb_window: int = 20, bb_std: float = 2.0):
+        self.bb_std = bb_std
+        self.indicators: Dict[str, StreamingIndicator] = {
+            'sma_20': StreamingSMA(20),
+            'sma_50': StreamingSMA(50),
+            'ema_12': StreamingEMA(12),
+            'ema_26': StreamingEMA(26),
+            'macd_signal': StreamingEMA(9),
+            'rsi_14': WilderRSI(14),
+            'bb_variance': RollingVariance(bb_window),
+        }
+        self.bars = 0
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        """Consume one close (NaNs are skipped) and return the current values"""
+        if close is None or math.isnan(close):
+            return self.values()
+
+        ind = self.indicators
+        for name in ('sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi_14', 'bb_variance'):
+            ind[name].update(close)
+        ind['macd_signal'].update(ind['ema_12'].value - ind['ema_26'].value)
+        self.bars += 1
+        return self.values()
+
+    def warm(self, closes: Iterable[float]) -> Dict[str, Optional[float]]:
+        """Replay history to initialise state"""
+        values = self.values()
+        for close in closes:
+            values = self.update(float(close))
+        return values
+
+    def values(self) -> Dict[str, Optional[float]]:
+        ind = self.indicators
+        values = {
+            'sma_20': ind['sma_20'].value,
+            'sma_50': ind['sma_50'].value,
+            'ema_12': ind['ema_12'].value,
+            'ema_26': ind['ema_26'].value,
+            'rsi_14': ind['rsi_14'].value,
+            'macd': None,
+            'macd_signal': ind['macd_signal'].value,
+            'macd_histogram': None,
+            'bb_upper': None,
+            'bb_middle': None,
+            'bb_lower': None,
+        }
+
+        if values['ema_12'] is not None:
+            values['macd'] = values['ema_12'] - values['ema_26']
+            values['macd_histogram'] = values['macd'] - values['macd_signal']
+
+        variance = ind['bb_variance']
+        std = variance.std
+        if std is not None:
+            values['bb_middle'] = variance.mean
+            values['bb_upper'] = variance.mean + self.bb_std * std
+            values['bb_lower'] = variance.mean - self.bb_std * std
+
+        return values
+
+    def to_dict(self) -> Dict:
+        return {
+            'bb_std': self.bb_std,
+            'bars': self.bars,
+            'indicators': {name: ind.to_dict() for name, ind in self.indicators.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SymbolIndicators':
+        state = cls.__new__(cls)
+        state.bb_std = data['bb_std']
+        state.bars = data['bars']
+        state.indicators = {
+            name: StreamingIndicator.from_dict(ind) for name, ind in data['indicators'].items()
+        }
+        return state
+
+
+def save_state(path: Path, states: Dict[str, SymbolIndicators]):
+    """Persist per-symbol streaming state atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({symbol: state.to_dict() for symbol, state in states.items()}, f)
+    tmp_path.replace(path)
+
+
+def load_state(path: Path) -> Dict[str, SymbolIndicators]:
+    """Load per-symbol streaming state (empty if the file does not exist)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {symbol: SymbolIndicators.from_dict(state) for symbol, state in data.items()}
@@ -0,0 +1 @@
+"""Market data helpers for PENGUIN"""
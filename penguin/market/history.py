@@ -0,0 +1,89 @@
+"""
+Bulk price history downloads
+Pulls OHLCV for many symbols per request into one column-oriented frame
+"""
+
+from typing import Iterable, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+
+OHLCV_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Symbols per multi-ticker request; large batches are split to keep URLs sane
+DEFAULT_CHUNK_SIZE = 200
+
+
+def download_history(symbols: Iterable[str], period: str = '3mo', interval: str = '1d',
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """
+    Download OHLCV history for many symbols
+    Returns a frame indexed by date with (field, symbol) columns, so
+    frame['Close'] is a dates x symbols matrix
+    `start` overrides `period` to fetch only bars from that date on
+    """
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    if not symbols:
+        return _empty_frame()
+
+    frames = []
+    for offset in range(0, len(symbols), chunk_size):
+        chunk = symbols[offset:offset + chunk_size]
+        window = {'start': start} if start is not None else {'period': period}
+        raw = yf.download(
+            chunk,
+            **window,
+            interval=interval,
+            group_by='column',
+            # Split/dividend-adjusted, like Ticker.history()
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        if raw is not None and not raw.empty:
+            frames.append(_normalize(raw, chunk))
+
+    if not frames:
+        return _empty_frame()
+
+    frame = pd.concat(frames, axis=1).sort_index()
+    return frame.dropna(axis=1, how='all')
+
+
+def history_for(frame: pd.DataFrame, symbol: str) -> Optional[pd.DataFrame]:
+    """Per-symbol OHLCV frame (same shape as Ticker.history) sliced from a bulk frame"""
+    symbol = symbol.upper()
+    if frame is None or frame.empty or symbol not in symbols_in(frame):
+        return None
+
+    hist = frame.xs(symbol, axis=1, level='symbol')
+    hist = hist[[field for field in OHLCV_FIELDS if field in hist.columns]]
+    hist = hist.dropna(how='all')
+    return hist if not hist.empty else None
+
+
+def symbols_in(frame: pd.DataFrame) -> List[str]:
+    """Symbols present in a bulk frame"""
+    if frame is None or frame.empty:
+        return []
+    return list(frame.columns.get_level_values('symbol').unique())
+
+
+def _normalize(raw: pd.DataFrame, chunk: List[str]) -> pd.DataFrame:
+    """Coerce yf.download output to (field, symbol) columns"""
+    if not isinstance(raw.columns, pd.MultiIndex):
+        # Single-symbol downloads come back with flat columns
+        raw = raw.copy()
+        raw.columns = pd.MultiIndex.from_product([raw.columns, chunk[:1]])
+
+    raw = raw[[field for field in OHLCV_FIELDS if field in raw.columns.get_level_values(0)]]
+    raw.columns = raw.columns.set_names(['field', 'symbol'])
+    return raw
+
+
+def _empty_frame() -> pd.DataFrame:
+    """Empty bulk frame with the expected column levels"""
+    columns = pd.MultiIndex.from_arrays([[], []], names=['field', 'symbol'])
+    return pd.DataFrame(columns=columns)
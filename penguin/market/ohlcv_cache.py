@@ -0,0 +1,249 @@
+"""
+Incremental OHLCV cache
+Keeps per-symbol bars on disk as memory-mapped NumPy arrays and only fetches
+the missing tail (re-fetching the last two stored bars to pick up corrections
+and split/dividend re-adjustments)
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from penguin.core.config import config
+from penguin.market.history import OHLCV_FIELDS, download_history, history_for
+
+
+BAR_DTYPE = np.dtype([
+    ('ts', 'i8'),           # bar timestamp, ns since epoch (naive UTC)
+    ('Open', 'f8'),
+    ('High', 'f8'),
+    ('Low', 'f8'),
+    ('Close', 'f8'),
+    ('Volume', 'f8'),
+])
+
+
+def period_start(period: str, now: Optional[pd.Timestamp] = None) -> Optional[pd.Timestamp]:
+    """First date covered by a yfinance period string ('3mo', '30d', '1y', 'ytd'); None for 'max'"""
+    now = (now or pd.Timestamp.now()).normalize()
+    if period == 'max':
+        return None
+    if period == 'ytd':
+        return pd.Timestamp(year=now.year, month=1, day=1)
+
+    offsets = {
+        'mo': lambda n: pd.DateOffset(months=n),
+        'wk': lambda n: pd.DateOffset(weeks=n),
+        'd': lambda n: pd.DateOffset(days=n),
+        'y': lambda n: pd.DateOffset(years=n),
+    }
+    for suffix, offset in offsets.items():
+        if period.endswith(suffix):
+            return now - offset(int(period[:-len(suffix)]))
+
+    raise ValueError(f"Unsupported period: {period}")
+
+
+class OHLCVCache:
+    """On-disk bar store that turns repeated history requests into small delta fetches"""
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 min_refresh_seconds: Optional[int] = None):
+        """
+        cache_dir: root directory (defaults to CACHE_DIR/ohlcv)
+        min_refresh_seconds: skip the network entirely when a symbol was
+            refreshed this recently (defaults to CACHE_TTL_SECONDS)
+        """
+        self.cache_dir = Path(cache_dir or Path(config.CACHE_DIR) / 'ohlcv')
+        self.min_refresh_seconds = (
+            config.CACHE_TTL_SECONDS if min_refresh_seconds is None else min_refresh_seconds
+        )
+
+        self.stats = {'hits': 0, 'delta_fetches': 0, 'full_fetches': 0}
+
+    def _path(self, symbol: str, interval: str) -> Path:
+        return self.cache_dir / interval / f'{symbol.upper()}.npy'
+
+    def _index_path(self, interval: str) -> Path:
+        return self.cache_dir / interval / '_index.json'
+
+    # --- Storage -----------------------------------------------------------
+
+    def load_bars(self, symbol: str, interval: str = '1d') -> Optional[np.ndarray]:
+        """Memory-mapped bars for a symbol, or None if not cached"""
+        path = self._path(symbol, interval)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode='r')
+
+    def save_bars(self, symbol: str, interval: str, bars: np.ndarray):
+        """Write bars atomically"""
+        path = self._path(symbol, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npy')
+        np.save(tmp_path, bars)
+        tmp_path.replace(path)
+
+    def _load_index(self, interval: str) -> Dict[str, Dict]:
+        """Per-symbol {'fetched_at': epoch, 'covered_from': ns} bookkeeping"""
+        path = self._index_path(interval)
+        if not path.exists():
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_index(self, interval: str, index: Dict[str, Dict]):
+        path = self._index_path(interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        tmp_path.replace(path)
+
+    # --- Fetching ----------------------------------------------------------
+
+    def get(self, symbols: Iterable[str], period: str = '3mo',
+            interval: str = '1d') -> pd.DataFrame:
+        """
+        Bulk frame (same layout as download_history) served from local bars
+        Only bars after the last stored one are downloaded
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        start = period_start(period)
+        index = self._load_index(interval)
+        now = time.time()
+
+        # Group symbols by the date their fetch must start from, so each
+        # group is a single multi-ticker request
+        full: List[str] = []
+        deltas: Dict[pd.Timestamp, List[str]] = {}
+
+        for symbol in symbols:
+            entry = index.get(symbol)
+            bars = self.load_bars(symbol, interval) if entry else None
+
+            # The stored window must reach back to the requested start
+            covered_from = entry.get('covered_from') if entry else None
+            if bars is None or len(bars) == 0 or covered_from is None \
+                    or (start is not None and covered_from > start.value):
+                full.append(symbol)
+                continue
+
+            if now - entry.get('fetched_at', 0) < self.min_refresh_seconds:
+                self.stats['hits'] += 1
+                continue
+
+            # Re-fetch from the bar before the last: the last may have been
+            # partial, the one before is a settled close that shows whether
+            # prices were re-adjusted since they were stored
+            anchor = pd.Timestamp(int(bars['ts'][-2 if len(bars) > 1 else -1])).normalize()
+            deltas.setdefault(anchor, []).append(symbol)
+
+        # 'max' is recorded as covering everything
+        covered_from = start.value if start is not None else 0
+
+        if full:
+            self.stats['full_fetches'] += len(full)
+            self._fetch_and_merge(full, interval, period=period)
+            for symbol in full:
+                index[symbol] = {'fetched_at': now, 'covered_from': covered_from}
+
+        readjusted: List[str] = []
+        for since, group in deltas.items():
+            self.stats['delta_fetches'] += len(group)
+            readjusted.extend(self._fetch_and_merge(group, interval, start=since))
+            for symbol in group:
+                index[symbol]['fetched_at'] = now
+
+        if readjusted:
+            # A split or dividend rescaled the adjusted history: replace it all
+            self.stats['full_fetches'] += len(readjusted)
+            self._fetch_and_merge(readjusted, interval, period=period)
+            # The stored bars now reach back only as far as this request
+            for symbol in readjusted:
+                index[symbol] = {'fetched_at': now, 'covered_from': covered_from}
+
+        if full or deltas:
+            self._save_index(interval, index)
+
+        return self._assemble(symbols, interval, start)
+
+    def history(self, symbol: str, period: str = '3mo',
+                interval: str = '1d') -> Optional[pd.DataFrame]:
+        """Single-symbol OHLCV frame (same shape as Ticker.history)"""
+        return history_for(self.get([symbol], period, interval), symbol)
+
+    def _fetch_and_merge(self, symbols: List[str], interval: str,
+                         period: str = '3mo', start: Optional[pd.Timestamp] = None) -> List[str]:
+        """
+        Download bars and merge them into each symbol's store
+        Returns the symbols whose stored closes no longer match (not merged)
+        """
+        frame = download_history(symbols, period=period, interval=interval, start=start)
+        readjusted = []
+
+        for symbol in symbols:
+            hist = history_for(frame, symbol)
+            if hist is None:
+                continue
+
+            new_bars = _frame_to_bars(hist)
+            old_bars = self.load_bars(symbol, interval)
+
+            if old_bars is not None and len(old_bars) and start is not None:
+                # The overlapping settled bar must still have the stored close
+                overlap = old_bars[old_bars['ts'] == new_bars['ts'][0]]
+                if len(old_bars) > 1 and len(overlap) and overlap['ts'][0] != old_bars['ts'][-1] \
+                        and not np.isclose(overlap['Close'][0], new_bars['Close'][0], rtol=1e-6):
+                    readjusted.append(symbol)
+                    continue
+
+                # Fetched bars replace anything from the first fetched timestamp on
+                keep = np.asarray(old_bars[old_bars['ts'] < new_bars['ts'][0]])
+                new_bars = np.concatenate([keep, new_bars])
+
+            self.save_bars(symbol, interval, new_bars)
+
+        return readjusted
+
+    def _assemble(self, symbols: List[str], interval: str,
+                  start: Optional[pd.Timestamp]) -> pd.DataFrame:
+        """Build the bulk (field, symbol) frame from stored bars"""
+        frames = {}
+        for symbol in symbols:
+            bars = self.load_bars(symbol, interval)
+            if bars is None or len(bars) == 0:
+                continue
+            if start is not None:
+                bars = bars[bars['ts'] >= start.value]
+            frames[symbol] = _bars_to_frame(bars)
+
+        if not frames:
+            return download_history([], interval=interval)
+
+        frame = pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+        frame.columns = frame.columns.set_names(['field', 'symbol'])
+        return frame
+
+
+def _frame_to_bars(hist: pd.DataFrame) -> np.ndarray:
+    """OHLCV frame -> structured bar array"""
+    index = hist.index
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+
+    bars = np.empty(len(hist), dtype=BAR_DTYPE)
+    bars['ts'] = index.as_unit('ns').asi8
+    for field in OHLCV_FIELDS:
+        bars[field] = hist[field].to_numpy(dtype='f8') if field in hist else np.nan
+    return bars
+
+
+def _bars_to_frame(bars: np.ndarray) -> pd.DataFrame:
+    """Structured bar array -> OHLCV frame indexed by date"""
+    index = pd.DatetimeIndex(np.asarray(bars['ts']).astype('datetime64[ns]'), name='Date')
+    return pd.DataFrame({field: np.asarray(bars[field]) for field in OHLCV_FIELDS}, index=index)
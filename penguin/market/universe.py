@@ -0,0 +1,200 @@
+"""
+Symbol universe index
+Validates tickers against exchange listings kept in a local snapshot, with a
+TTL'd negative cache so junk tokens are never re-checked over the network
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from penguin.core.config import config
+
+
+# NASDAQ Trader symbol directories (cover NASDAQ, NYSE, NYSE American, Arca, BATS)
+LISTING_URLS = [
+    'https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt',
+    'https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt',
+]
+
+VALID = 'valid'
+INVALID = 'invalid'
+UNKNOWN = 'unknown'
+
+
+def parse_listing(text: str) -> List[str]:
+    """Parse a pipe-delimited NASDAQ Trader listing into symbols (test issues skipped)"""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return []
+
+    header = lines[0].split('|')
+    symbol_col = 0
+    test_col = header.index('Test Issue') if 'Test Issue' in header else None
+
+    symbols = []
+    for line in lines[1:]:
+        if line.startswith('File Creation Time'):
+            continue
+        fields = line.split('|')
+        if test_col is not None and len(fields) > test_col and fields[test_col] == 'Y':
+            continue
+        symbol = fields[symbol_col].strip().upper()
+        if symbol:
+            symbols.append(symbol)
+
+    return symbols
+
+
+class SymbolUniverse:
+    """In-memory set of listed symbols backed by an on-disk snapshot"""
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 refresh_hours: Optional[int] = None,
+                 invalid_ttl_hours: Optional[int] = None):
+        """Initialize with cache location and refresh policy (defaults come from config)"""
+        self.cache_dir = Path(cache_dir or config.CACHE_DIR)
+        self.refresh_seconds = (refresh_hours or config.SYMBOL_UNIVERSE_REFRESH_HOURS) * 3600
+        self.invalid_ttl = (invalid_ttl_hours or config.INVALID_SYMBOL_TTL_HOURS) * 3600
+
+        self.snapshot_path = self.cache_dir / 'symbol_universe.json'
+        self.checks_path = self.cache_dir / 'symbol_checks.json'
+
+        self.symbols: frozenset = frozenset()
+        self.snapshot_time = 0.0
+
+        # Results of one-off network checks: symbol -> checked_at
+        self.verified: Dict[str, float] = {}
+        self.invalid: Dict[str, float] = {}
+
+    # --- Loading -----------------------------------------------------------
+
+    def load(self, listing_files: Optional[Iterable[Path]] = None,
+             refresh: bool = True) -> 'SymbolUniverse':
+        """
+        Load symbols from listing files, or from the cached snapshot
+        A stale snapshot is refreshed from the exchanges when refresh=True
+        """
+        if listing_files:
+            symbols = []
+            for path in listing_files:
+                symbols.extend(parse_listing(Path(path).read_text()))
+            self._set_symbols(symbols, time.time())
+            self.save_snapshot()
+        else:
+            self._load_snapshot()
+            if refresh and self.is_stale():
+                try:
+                    self.refresh()
+                except Exception as e:
+                    # Keep serving the stale snapshot rather than failing the run
+                    print(f"  ⚠️  Symbol universe refresh failed: {e}")
+
+        self._load_checks()
+        return self
+
+    def refresh(self, timeout: float = 30.0):
+        """Download the exchange listings and replace the snapshot"""
+        symbols = []
+        for url in LISTING_URLS:
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            symbols.extend(parse_listing(response.text))
+
+        if not symbols:
+            raise ValueError("Exchange listings were empty")
+
+        self._set_symbols(symbols, time.time())
+        self.save_snapshot()
+
+    def is_stale(self) -> bool:
+        """True when the snapshot is missing or older than the refresh interval"""
+        return not self.symbols or time.time() - self.snapshot_time > self.refresh_seconds
+
+    def _set_symbols(self, symbols: Iterable[str], created: float):
+        """Replace the symbol set"""
+        self.symbols = frozenset(symbols)
+        self.snapshot_time = created
+
+    def _load_snapshot(self):
+        """Read the cached snapshot, if any"""
+        if not self.snapshot_path.exists():
+            return
+        with open(self.snapshot_path) as f:
+            snapshot = json.load(f)
+        self._set_symbols(snapshot.get('symbols', []), snapshot.get('created', 0.0))
+
+    def save_snapshot(self):
+        """Write the symbol set to the cache directory"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(self.snapshot_path, {
+            'created': self.snapshot_time,
+            'symbols': sorted(self.symbols),
+        })
+
+    def _load_checks(self):
+        """Read cached network check results, dropping expired negatives"""
+        if not self.checks_path.exists():
+            return
+        with open(self.checks_path) as f:
+            checks = json.load(f)
+
+        now = time.time()
+        self.verified = checks.get(VALID, {})
+        self.invalid = {
+            symbol: checked for symbol, checked in checks.get(INVALID, {}).items()
+            if now - checked < self.invalid_ttl
+        }
+
+    def save_checks(self):
+        """Persist network check results"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(self.checks_path, {VALID: self.verified, INVALID: self.invalid})
+
+    # --- Lookups -----------------------------------------------------------
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.status(symbol) == VALID
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def status(self, symbol: str) -> str:
+        """'valid', 'invalid' or 'unknown' without touching the network"""
+        symbol = symbol.upper()
+        if symbol in self.symbols or symbol in self.verified:
+            return VALID
+
+        checked = self.invalid.get(symbol)
+        if checked is not None:
+            if time.time() - checked < self.invalid_ttl:
+                return INVALID
+            del self.invalid[symbol]
+
+        # Unlisted (e.g. OTC) symbols need one network check before being cached
+        return UNKNOWN
+
+    def classify(self, symbols: Iterable[str]) -> Dict[str, str]:
+        """Status for many symbols at once"""
+        status = self.status
+        return {symbol: status(symbol) for symbol in symbols}
+
+    def record(self, symbol: str, valid: bool):
+        """Remember the outcome of a network check"""
+        symbol = symbol.upper()
+        if valid:
+            self.verified[symbol] = time.time()
+            self.invalid.pop(symbol, None)
+        else:
+            self.invalid[symbol] = time.time()
+
+
+def _write_json(path: Path, payload: Dict):
+    """Write JSON atomically so a crash never leaves a truncated cache file"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(payload, f)
+    tmp_path.replace(path)
@@ -0,0 +1 @@
+"""Social sentiment processing for PENGUIN"""
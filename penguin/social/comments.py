@@ -0,0 +1,268 @@
+"""
+Comment harvesting
+Expands the comment forests of the busiest threads over the OAuth API with a
+bounded number of requests in flight and a per-run time budget, fetching only
+comments newer than each thread's last-seen comment ID, and returns them as
+raw records for the same batch ticker/sentiment path as posts
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+from penguin.core.config import config
+from penguin.social.reddit_async import AsyncRedditCollector
+
+
+# /api/morechildren accepts at most 100 IDs per call
+MORE_BATCH = 100
+STATE_FILE = 'comment_watermarks.json'
+REMOVED_BODIES = {'[deleted]', '[removed]'}
+
+
+def comment_number(comment_id: str) -> int:
+    """Reddit IDs are base-36 and increase over time"""
+    return int(comment_id, 36)
+
+
+def comment_id(number: int) -> str:
+    """Inverse of comment_number"""
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    text = ''
+    while True:
+        number, remainder = divmod(number, 36)
+        text = digits[remainder] + text
+        if not number:
+            return text
+
+
+class Thread:
+    """Progress for one thread during a harvest"""
+
+    __slots__ = ('subreddit', 'link_id', 'watermark', 'newest', 'pending', 'incomplete',
+                 'records', 'collected')
+
+    def __init__(self, subreddit: str, link_id: str, watermark: int):
+        self.subreddit = subreddit
+        self.link_id = link_id
+        self.watermark = watermark
+        self.newest = watermark
+        self.pending = 0            # queued or running requests
+        self.incomplete = False     # a request was skipped (budget) or failed
+        self.records: List[Dict] = []
+        self.collected = set()      # comment IDs kept (a continued subtree repeats its root)
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending and not self.incomplete
+
+
+class HarvestStats(NamedTuple):
+    threads: int
+    complete: int
+    requests: int
+    comments: int
+    skipped_old: int        # IDs in 'more' stubs at or below the watermark, never fetched
+    truncated: int          # deep "continue this thread" stubs, followed by comment subtree
+    seconds: float
+
+    def __str__(self) -> str:
+        return (f"{self.comments} new comments from {self.threads} threads "
+                f"({self.complete} complete) in {self.requests} requests, {self.seconds:.1f}s; "
+                f"{self.skipped_old} already-seen IDs skipped")
+
+
+class CommentHarvester:
+    """Incremental, concurrency- and time-bounded comment expansion for many threads"""
+
+    def __init__(self, collector: Optional[AsyncRedditCollector] = None,
+                 state_path: Optional[Path] = None, concurrency: Optional[int] = None,
+                 budget_seconds: Optional[float] = None):
+        """
+        concurrency: comment requests in flight (the collector's limiter still applies)
+        budget_seconds: stop issuing requests after this long; unfinished threads
+        keep their old watermark and are resumed next run
+        """
+        self.collector = collector or AsyncRedditCollector()
+        self.state_path = Path(state_path or Path(config.CACHE_DIR) / STATE_FILE)
+        self.concurrency = concurrency or config.REDDIT_COMMENT_CONCURRENCY
+        self.budget_seconds = config.REDDIT_COMMENT_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+        self.watermarks = self.load_state()
+
+    # --- Watermarks --------------------------------------------------------
+
+    def load_state(self) -> Dict[str, Tuple[str, float]]:
+        """link_id -> (newest comment ID harvested, when)"""
+        try:
+            with open(self.state_path) as f:
+                return {link_id: tuple(entry) for link_id, entry in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        cutoff = time.time() - config.SEEN_POST_RETENTION_DAYS * 86400
+        state = {link_id: entry for link_id, entry in self.watermarks.items() if entry[1] >= cutoff}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        tmp_path.replace(self.state_path)
+        self.watermarks = state
+
+    def watermark(self, link_id: str) -> int:
+        entry = self.watermarks.get(link_id)
+        return comment_number(entry[0]) if entry else 0
+
+    # --- Harvest -----------------------------------------------------------
+
+    def harvest(self, threads: List[Tuple[str, str]]) -> Tuple[Dict[str, List[Dict]], HarvestStats]:
+        """Blocking wrapper around harvest_async"""
+        return asyncio.run(self.harvest_async(threads))
+
+    async def harvest_async(self, threads: List[Tuple[str, str]]
+                            ) -> Tuple[Dict[str, List[Dict]], HarvestStats]:
+        """
+        threads: (subreddit, link fullname) pairs, busiest first
+        Returns subreddit -> comment records newer than each thread's watermark
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.budget_seconds
+        counters = {'requests': 0, 'skipped_old': 0, 'truncated': 0}
+
+        states = [Thread(subreddit, link_id, self.watermark(link_id)) for subreddit, link_id in threads]
+        queue: asyncio.Queue = asyncio.Queue()
+        for thread in states:
+            thread.pending += 1
+            queue.put_nowait((thread, None))
+
+        async def worker(session: aiohttp.ClientSession):
+            while True:
+                # request: None (thread top), comment IDs to expand, or a comment ID to continue from
+                thread, request = await queue.get()
+                try:
+                    if loop.time() >= deadline:
+                        thread.incomplete = True
+                        continue
+                    counters['requests'] += 1
+                    if request is None:
+                        items = await self.collector.fetch_thread(session, thread.link_id[3:])
+                    elif isinstance(request, str):
+                        items = await self.collector.fetch_thread(session, thread.link_id[3:], comment=request)
+                    else:
+                        items = await self.collector.fetch_more_children(session, thread.link_id, request)
+                    more, continued = self._collect(thread, items, counters)
+                    for start in range(0, len(more), MORE_BATCH):
+                        thread.pending += 1
+                        queue.put_nowait((thread, more[start:start + MORE_BATCH]))
+                    for parent in continued:
+                        thread.pending += 1
+                        queue.put_nowait((thread, parent))
+                except asyncio.CancelledError:
+                    # Cut off by the budget mid-request
+                    thread.incomplete = True
+                    raise
+                except Exception as e:
+                    thread.incomplete = True
+                    print(f"  ⚠️  Error expanding comments for {thread.link_id}: {e}")
+                finally:
+                    thread.pending -= 1
+                    queue.task_done()
+
+        async with aiohttp.ClientSession() as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(self.concurrency)]
+            drained = asyncio.create_task(queue.join())
+            await asyncio.wait({drained}, timeout=max(0.0, deadline - loop.time()))
+            # Out of budget: requests still queued or in flight leave their threads incomplete
+            for task in workers + [drained]:
+                task.cancel()
+            await asyncio.gather(*workers, drained, return_exceptions=True)
+
+        now = time.time()
+        grouped: Dict[str, List[Dict]] = {}
+        for thread in states:
+            grouped.setdefault(thread.subreddit, []).extend(thread.records)
+            if thread.complete and thread.newest > thread.watermark:
+                self.watermarks[thread.link_id] = (comment_id(thread.newest), now)
+            elif thread.link_id in self.watermarks:
+                # Still active: keep the entry from ageing out
+                self.watermarks[thread.link_id] = (self.watermarks[thread.link_id][0], now)
+        self.save_state()
+
+        stats = HarvestStats(
+            threads=len(states),
+            complete=sum(thread.complete for thread in states),
+            requests=counters['requests'],
+            comments=sum(len(thread.records) for thread in states),
+            skipped_old=counters['skipped_old'],
+            truncated=counters['truncated'],
+            seconds=loop.time() - started,
+        )
+        return grouped, stats
+
+    def _collect(self, thread: Thread, items: List[Dict], counters: Dict[str, int]
+                 ) -> Tuple[List[str], List[str]]:
+        """
+        Keep comments newer than the watermark (walking every reply, since old
+        comments gain new replies); returns the newer IDs hidden in 'more' stubs
+        and the comments whose deep replies sit behind "continue this thread"
+        """
+        more: List[str] = []
+        continued: List[str] = []
+        stack = list(items)
+        while stack:
+            item = stack.pop()
+            data = item.get('data', {})
+            if item.get('kind') == 'more':
+                children = data.get('children', [])
+                if not children:
+                    # No IDs to expand: the replies are only reachable as the
+                    # parent's subtree, which may hold comments of any age
+                    counters['truncated'] += 1
+                    parent = data.get('parent_id', '')
+                    if parent.startswith('t1_'):
+                        continued.append(parent[3:])
+                    else:
+                        thread.incomplete = True
+                    continue
+                # A stub lists every hidden descendant, so new replies under old
+                # comments still show up here by ID
+                fresh = [c for c in children if comment_number(c) > thread.watermark]
+                counters['skipped_old'] += len(children) - len(fresh)
+                more.extend(fresh)
+                continue
+            if item.get('kind') != 't1':
+                continue
+
+            number = comment_number(data['id'])
+            if (number > thread.watermark and data.get('body') not in REMOVED_BODIES
+                    and data['id'] not in thread.collected):
+                thread.collected.add(data['id'])
+                thread.records.append(comment_record(data, thread.link_id))
+            thread.newest = max(thread.newest, number)
+
+            replies = data.get('replies')
+            if isinstance(replies, dict):
+                stack.extend(replies.get('data', {}).get('children', []))
+        return more, continued
+
+
+def comment_record(data: Dict, link_id: str) -> Dict:
+    """t1 comment -> the raw post record shape build_posts analyzes (body as selftext)"""
+    return {
+        'id': data['id'],
+        'name': data.get('name') or f"t1_{data['id']}",
+        'link_id': link_id,
+        'title': '',
+        'selftext': data.get('body', ''),
+        'score': data.get('score', 0),
+        'num_comments': 0,
+        'created_utc': data.get('created_utc', 0.0),
+        'permalink': data.get('permalink', ''),
+        'stickied': data.get('stickied', False),
+    }
+
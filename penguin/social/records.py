@@ -0,0 +1,159 @@
+"""
+Compact post and mention records
+Slotted post records interned by post ID in a PostStore, and per-ticker
+mention aggregates that count in place and reference posts by store index
+instead of copying title/score/sentiment dicts for every mention
+"""
+
+import sys
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from penguin.social.sentiment import BEARISH, BULLISH, LABELS, NEUTRAL
+
+
+_LABEL_CODES = {label: code for code, label in enumerate(LABELS)}
+
+
+def sentiment_code(sentiment) -> int:
+    """'bullish' / BULLISH -> BULLISH (unknown labels count as neutral)"""
+    if isinstance(sentiment, str):
+        return _LABEL_CODES.get(sentiment, NEUTRAL)
+    return int(sentiment)
+
+
+class Post:
+    """One analyzed post; repeated strings (subreddit, author, tickers) are interned"""
+
+    __slots__ = ('post_id', 'subreddit', 'title', 'author', 'score', 'upvote_ratio',
+                 'num_comments', 'created_utc', 'url', 'tickers', 'sentiment', 'polarity',
+                 'awards')
+
+    def __init__(self, post_id: str, subreddit: str, title: str, score: int = 0,
+                 num_comments: int = 0, created_utc: float = 0.0, url: str = '',
+                 tickers: Iterable[str] = (), sentiment=NEUTRAL, polarity: float = 0.0,
+                 author: Optional[str] = None, upvote_ratio: float = 0.0, awards: int = 0):
+        """created_utc: epoch seconds; sentiment: label code or 'bullish'/'bearish'/'neutral'"""
+        self.post_id = post_id
+        self.subreddit = sys.intern(subreddit)
+        self.title = title
+        self.author = sys.intern(author) if author else None
+        self.score = score
+        self.upvote_ratio = upvote_ratio
+        self.num_comments = num_comments
+        self.created_utc = created_utc
+        self.url = url
+        self.tickers = tuple(sys.intern(ticker) for ticker in tickers)
+        self.sentiment = sentiment_code(sentiment)
+        self.polarity = polarity
+        self.awards = awards
+
+    @property
+    def label(self) -> str:
+        """Sentiment as 'bullish' / 'bearish' / 'neutral'"""
+        return LABELS[self.sentiment]
+
+    @property
+    def created(self) -> datetime:
+        return datetime.fromtimestamp(self.created_utc)
+
+    def __repr__(self) -> str:
+        return f"Post({self.post_id!r}, r/{self.subreddit}, score={self.score}, tickers={self.tickers})"
+
+
+class PostStore:
+    """
+    Posts in arrival order, one record per post ID (a re-seen post is updated
+    in place); crossposts collapse only if the caller keys them by their parent
+    """
+
+    def __init__(self, posts: Iterable[Post] = ()):
+        self._posts: List[Post] = []
+        self._index: Dict[str, int] = {}
+        self.extend(posts)
+
+    def add(self, post: Post) -> int:
+        """Store a post and return its index; a known ID keeps its index but takes the new values"""
+        index = self._index.get(post.post_id)
+        if index is None:
+            index = self._index[post.post_id] = len(self._posts)
+            self._posts.append(post)
+        else:
+            self._posts[index] = post
+        return index
+
+    def extend(self, posts: Iterable[Post]) -> List[int]:
+        return [self.add(post) for post in posts]
+
+    def index_of(self, post_id: str) -> Optional[int]:
+        return self._index.get(post_id)
+
+    def get(self, post_id: str) -> Optional[Post]:
+        index = self._index.get(post_id)
+        return None if index is None else self._posts[index]
+
+    def __getitem__(self, index: int) -> Post:
+        return self._posts[index]
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def __iter__(self) -> Iterator[Post]:
+        return iter(self._posts)
+
+    def __contains__(self, post_id: str) -> bool:
+        return post_id in self._index
+
+
+class MentionAggregate:
+    """Running counters for one ticker plus the store indices of the posts mentioning it"""
+
+    __slots__ = ('mention_count', 'total_score', 'total_comments', 'bullish_count',
+                 'bearish_count', 'neutral_count', 'post_indices')
+
+    def __init__(self):
+        self.mention_count = 0
+        self.total_score = 0
+        self.total_comments = 0
+        self.bullish_count = 0
+        self.bearish_count = 0
+        self.neutral_count = 0
+        self.post_indices = array('I')
+
+    def add(self, index: int, post: Post):
+        self.mention_count += 1
+        self.total_score += post.score
+        self.total_comments += post.num_comments
+        if post.sentiment == BULLISH:
+            self.bullish_count += 1
+        elif post.sentiment == BEARISH:
+            self.bearish_count += 1
+        else:
+            self.neutral_count += 1
+        self.post_indices.append(index)
+
+    def posts(self, store: Sequence[Post]) -> List[Post]:
+        return [store[index] for index in self.post_indices]
+
+    def top_post(self, store: Sequence[Post]) -> Optional[Post]:
+        """Highest-scoring post mentioning the ticker"""
+        if not self.post_indices:
+            return None
+        return store[max(self.post_indices, key=lambda index: store[index].score)]
+
+    def __repr__(self) -> str:
+        return (f"MentionAggregate(mentions={self.mention_count}, bullish={self.bullish_count}, "
+                f"bearish={self.bearish_count}, posts={len(self.post_indices)})")
+
+
+def analyze_mentions(posts: Sequence[Post]) -> Dict[str, MentionAggregate]:
+    """Ticker -> aggregate over every (ticker, post) mention"""
+    ticker_data: Dict[str, MentionAggregate] = {}
+    for index, post in enumerate(posts):
+        for ticker in post.tickers:
+            aggregate = ticker_data.get(ticker)
+            if aggregate is None:
+                aggregate = ticker_data[ticker] = MentionAggregate()
+            aggregate.add(index, post)
+    return ticker_data
@@ -0,0 +1,175 @@
+"""
+Concurrent Reddit collection
+Fetches many subreddit listings at once over Reddit's OAuth API (aiohttp)
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from penguin.core.config import config
+from penguin.core.ratelimit import AsyncTokenBucket
+
+
+TOKEN_URL = 'https://www.reddit.com/api/v1/access_token'
+API_URL = 'https://oauth.reddit.com'
+
+# Reddit returns at most 100 items per listing page
+PAGE_SIZE = 100
+
+
+class AsyncRedditCollector:
+    """Fetch hot posts from several subreddits concurrently under one rate limiter"""
+
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 user_agent: Optional[str] = None,
+                 limiter: Optional[AsyncTokenBucket] = None):
+        """Initialize with app credentials (defaults come from config)"""
+        self.client_id = client_id or config.REDDIT_CLIENT_ID
+        self.client_secret = client_secret or config.REDDIT_CLIENT_SECRET
+        self.user_agent = user_agent or config.REDDIT_USER_AGENT
+
+        # One bucket for every request this client makes, sized to the OAuth quota
+        self.limiter = limiter or AsyncTokenBucket.per_minute(
+            config.REDDIT_REQUESTS_PER_MINUTE, burst=10
+        )
+
+        self._token: Optional[str] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+    async def _authenticate(self, session: aiohttp.ClientSession) -> str:
+        """Get an application-only OAuth token (shared by all concurrent fetches)"""
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+
+        async with self._auth_lock:
+            if self._token is None:
+                self._token = await self._request_token(session)
+        return self._token
+
+    async def _request_token(self, session: aiohttp.ClientSession) -> str:
+        """POST the client-credentials grant"""
+        await self.limiter.acquire()
+        auth = aiohttp.BasicAuth(self.client_id, self.client_secret)
+
+        async with session.post(TOKEN_URL, auth=auth,
+                                data={'grant_type': 'client_credentials'},
+                                headers={'User-Agent': self.user_agent}) as response:
+            response.raise_for_status()
+            payload = await response.json()
+
+        return payload['access_token']
+
+    async def _get(self, session: aiohttp.ClientSession, path: str, params: Dict,
+                   retry: bool = True) -> Dict:
+        """Rate-limited GET against the OAuth API"""
+        if self._token is None:
+            await self._authenticate(session)
+
+        await self.limiter.acquire()
+        headers = {'Authorization': f'bearer {self._token}', 'User-Agent': self.user_agent}
+
+        async with session.get(f'{API_URL}{path}', params=params, headers=headers) as response:
+            remaining = response.headers.get('X-Ratelimit-Remaining')
+            reset = response.headers.get('X-Ratelimit-Reset')
+            self.limiter.sync_with_server(
+                float(remaining) if remaining else None,
+                float(reset) if reset else None
+            )
+
+            if response.status == 401 and retry:
+                # Token expired mid-run; re-authenticate once and retry
+                self._token = None
+                return await self._get(session, path, params, retry=False)
+
+            response.raise_for_status()
+            return await response.json()
+
+    async def iter_subreddit(self, session: aiohttp.ClientSession, subreddit: str,
+                             limit: int = 100, listing: str = 'hot') -> AsyncIterator[List[Dict]]:
+        """Yield pages of post records from one subreddit listing"""
+        after = None
+        fetched = 0
+
+        while fetched < limit:
+            params = {'limit': min(PAGE_SIZE, limit - fetched), 'raw_json': 1}
+            if after:
+                params['after'] = after
+
+            payload = await self._get(session, f'/r/{subreddit}/{listing}', params)
+            children = payload.get('data', {}).get('children', [])
+            if not children:
+                return
+
+            page = [child['data'] for child in children]
+            fetched += len(page)
+            yield page
+
+            after = payload['data'].get('after')
+            if not after:
+                return
+
+    async def fetch_thread(self, session: aiohttp.ClientSession, article: str,
+                           limit: int = 500, sort: str = 'new',
+                           comment: Optional[str] = None) -> List[Dict]:
+        """
+        Top of a thread's comment forest (t1 comments and 'more' stubs), or with
+        `comment` the subtree rooted at that comment ("continue this thread")
+        """
+        params = {'limit': limit, 'sort': sort, 'raw_json': 1}
+        if comment:
+            params['comment'] = comment
+        payload = await self._get(session, f'/comments/{article}', params)
+        return payload[1]['data']['children'] if len(payload) > 1 else []
+
+    async def fetch_more_children(self, session: aiohttp.ClientSession, link_id: str,
+                                  children: List[str], sort: str = 'new') -> List[Dict]:
+        """Expand up to 100 comment IDs from 'more' stubs (flat list, may contain new stubs)"""
+        payload = await self._get(session, '/api/morechildren', {
+            'link_id': link_id, 'children': ','.join(children), 'api_type': 'json',
+            'sort': sort, 'raw_json': 1,
+        })
+        return payload.get('json', {}).get('data', {}).get('things', [])
+
+    async def stream_posts(self, subreddits: List[str], limit: int = 100,
+                           listing: str = 'hot') -> AsyncIterator[Tuple[str, List[Dict]]]:
+        """
+        Fetch all subreddits concurrently, yielding (subreddit, page) as each page arrives
+        Errors are reported per subreddit and do not stop the others
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def worker(session: aiohttp.ClientSession, name: str):
+            try:
+                async for page in self.iter_subreddit(session, name, limit, listing):
+                    await queue.put((name, page))
+            except Exception as e:
+                print(f"  ⚠️  Error scraping r/{name}: {e}")
+            finally:
+                await queue.put(done)
+
+        async with aiohttp.ClientSession() as session:
+            tasks = [asyncio.create_task(worker(session, name)) for name in subreddits]
+            pending = len(tasks)
+
+            try:
+                while pending:
+                    item = await queue.get()
+                    if item is done:
+                        pending -= 1
+                        continue
+                    yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fetch_all(self, subreddits: List[str], limit: int = 100,
+                        listing: str = 'hot') -> Dict[str, List[Dict]]:
+        """Fetch all subreddits concurrently and return records grouped by subreddit"""
+        results: Dict[str, List[Dict]] = {name: [] for name in subreddits}
+        async for name, page in self.stream_posts(subreddits, limit, listing):
+            results[name].extend(page)
+        return results
@@ -0,0 +1,277 @@
+"""
+Reddit fixtures
+Records praw listing responses to gzipped JSONL, replays them through a
+praw-shaped client so the scrapers run offline, and generates synthetic
+corpora with realistic ticker, sentiment and engagement distributions
+"""
+
+import gzip
+import itertools
+import json
+import random
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from penguin.core.constants import EXCLUDED_WORDS
+from penguin.social.comments import comment_id
+from penguin.social.sentiment import BEARISH_WORDS, BULLISH_WORDS
+
+
+# Submission attributes the Reddit PoCs read
+SUBMISSION_FIELDS = (
+    'id', 'name', 'crosspost_parent', 'title', 'selftext', 'author', 'score', 'upvote_ratio',
+    'num_comments', 'created_utc', 'url', 'permalink', 'stickied', 'total_awards_received',
+)
+
+SUBREDDITS = ['wallstreetbets', 'pennystocks', 'stocks', 'investing', 'options',
+              'Daytrading', 'SecurityAnalysis', 'ValueInvesting', 'Dividends', 'StockMarket']
+
+
+def submission_record(submission) -> Dict:
+    """praw Submission -> plain dict of SUBMISSION_FIELDS"""
+    record = {field: getattr(submission, field, None) for field in SUBMISSION_FIELDS}
+    record['author'] = str(record['author']) if record['author'] is not None else '[deleted]'
+    return record
+
+
+# --- Fixture files ---------------------------------------------------------
+
+class FixtureWriter:
+    """Appends (subreddit, listing, record) lines to a gzipped JSONL file, published on close"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        self.file = gzip.open(self.tmp_path, 'wt', encoding='utf-8', compresslevel=6)
+        self.count = 0
+
+    def write(self, subreddit: str, listing: str, record: Dict):
+        # subreddit/listing lead each line so replay can filter before decoding
+        line = {'subreddit': subreddit, 'listing': listing, **record}
+        self.file.write(json.dumps(line, separators=(',', ':')) + '\n')
+        self.count += 1
+
+    def write_many(self, rows: Iterable[Tuple[str, str, Dict]]):
+        for subreddit, listing, record in rows:
+            self.write(subreddit, listing, record)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+            self.tmp_path.replace(self.path)
+
+    def __enter__(self) -> 'FixtureWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_fixture(path: Path, subreddit: Optional[str] = None,
+                 listing: Optional[str] = None) -> Iterator[Tuple[str, str, Dict]]:
+    """Stream (subreddit, listing, record) from a fixture, optionally for one listing"""
+    prefix = None
+    if subreddit is not None and listing is not None:
+        prefix = json.dumps({'subreddit': subreddit, 'listing': listing}, separators=(',', ':'))[:-1]
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if prefix is not None and not line.startswith(prefix):
+                continue
+            record = json.loads(line)
+            name, kind = record.pop('subreddit'), record.pop('listing')
+            if subreddit is not None and name != subreddit:
+                continue
+            yield name, kind, record
+
+
+# --- praw-shaped clients ---------------------------------------------------
+
+class RecordingReddit:
+    """Wraps praw.Reddit: listings pass through unchanged and are written to a fixture"""
+
+    def __init__(self, reddit, writer: FixtureWriter):
+        self.reddit = reddit
+        self.writer = writer
+
+    def subreddit(self, name: str) -> 'RecordingSubreddit':
+        return RecordingSubreddit(self.reddit.subreddit(name), name, self.writer)
+
+
+class RecordingSubreddit:
+
+    def __init__(self, subreddit, name: str, writer: FixtureWriter):
+        self._subreddit = subreddit
+        self.display_name = name
+        self._writer = writer
+
+    def _listing(self, listing: str, **kwargs) -> Iterator:
+        for submission in getattr(self._subreddit, listing)(**kwargs):
+            self._writer.write(self.display_name, listing, submission_record(submission))
+            yield submission
+
+    def hot(self, **kwargs) -> Iterator:
+        return self._listing('hot', **kwargs)
+
+    def new(self, **kwargs) -> Iterator:
+        return self._listing('new', **kwargs)
+
+    def rising(self, **kwargs) -> Iterator:
+        return self._listing('rising', **kwargs)
+
+    def top(self, **kwargs) -> Iterator:
+        return self._listing('top', **kwargs)
+
+
+class ReplayReddit:
+    """Serves listings from a fixture in recorded order, as attribute-style submissions"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"No Reddit fixture at {self.path}")
+
+    def subreddit(self, name: str) -> 'ReplaySubreddit':
+        return ReplaySubreddit(self.path, name)
+
+    def subreddits(self) -> List[str]:
+        """Subreddits present in the fixture, in first-seen order"""
+        return list(dict.fromkeys(name for name, _, _ in read_fixture(self.path)))
+
+
+class ReplaySubreddit:
+
+    def __init__(self, path: Path, name: str):
+        self.path = path
+        self.display_name = name
+
+    def _listing(self, listing: str, limit: Optional[int] = 100, **kwargs) -> Iterator[SimpleNamespace]:
+        # Like praw, limit=None means the whole listing
+        for served, (_, _, record) in enumerate(read_fixture(self.path, self.display_name, listing)):
+            if limit is not None and served >= limit:
+                return
+            yield SimpleNamespace(**record)
+
+    def hot(self, **kwargs) -> Iterator[SimpleNamespace]:
+        return self._listing('hot', **kwargs)
+
+    def new(self, **kwargs) -> Iterator[SimpleNamespace]:
+        return self._listing('new', **kwargs)
+
+    def rising(self, **kwargs) -> Iterator[SimpleNamespace]:
+        return self._listing('rising', **kwargs)
+
+    def top(self, **kwargs) -> Iterator[SimpleNamespace]:
+        return self._listing('top', **kwargs)
+
+
+# --- Synthetic corpora -----------------------------------------------------
+
+POPULAR_SYMBOLS = [
+    'GME', 'AMC', 'TSLA', 'NVDA', 'AAPL', 'PLTR', 'SOFI', 'AMD', 'MSFT', 'BB', 'META', 'AMZN',
+    'GOOGL', 'NFLX', 'COIN', 'HOOD', 'RIVN', 'LCID', 'NIO', 'BABA', 'INTC', 'MU', 'SMCI', 'ARM',
+    'MSTR', 'RKLB', 'ASTS', 'HIMS', 'UPST', 'AFRM', 'SNOW', 'CRWD', 'JPM', 'BAC', 'DIS', 'KO',
+    'PEP', 'JNJ', 'PFE', 'XOM', 'CVX', 'WMT', 'COST', 'SCHD', 'VOO', 'TQQQ', 'SQQQ',
+]
+
+FILLER_WORDS = (
+    "the market is going to be wild today and I think we all know what happens next when "
+    "shorts have to cover their positions before earnings my wife's boyfriend said this "
+    "company has real revenue growth and the chart looks like a cup with handle so I am "
+    "adding more shares here but honestly the fed could wreck everything on wednesday what "
+    "do you guys think about the guidance and margins for next quarter position below"
+).split()
+
+
+class SyntheticCorpus:
+    """
+    Deterministic Reddit-like submissions: subreddit sizes, ticker popularity
+    and scores are heavy-tailed, texts mix filler with tickers, cashtags,
+    all-caps false positives and sentiment phrases, and a few posts are
+    stickied or crossposted
+    """
+
+    def __init__(self, seed: int = 42, universe: int = 2000,
+                 subreddits: Sequence[str] = SUBREDDITS, start: float = 1.7e9):
+        self.rng = random.Random(seed)
+        self.subreddits = list(subreddits)
+        # r/wallstreetbets dwarfs the rest
+        self.subreddit_weights = list(itertools.accumulate(
+            1 / (rank + 1) for rank in range(len(self.subreddits))
+        ))
+
+        letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        tail = {''.join(self.rng.choices(letters, k=self.rng.randint(2, 5))) for _ in range(universe)}
+        self.symbols = POPULAR_SYMBOLS + sorted(tail - set(POPULAR_SYMBOLS) - EXCLUDED_WORDS)
+        # Cumulative, so each draw is a bisect rather than a pass over the weights
+        self.symbol_weights = list(itertools.accumulate(
+            1 / (rank + 1) ** 1.1 for rank in range(len(self.symbols))
+        ))
+        self.noise = sorted(word for word in EXCLUDED_WORDS if len(word) > 1)
+        self.bullish = list(BULLISH_WORDS)
+        self.bearish = list(BEARISH_WORDS)
+        self.start = start
+
+    def text(self, words: int) -> str:
+        rng = self.rng
+        tokens = rng.choices(FILLER_WORDS, k=words)
+        # About one ticker-ish token per 15 words, at least one in most posts
+        mentions = words // 15 or (1 if rng.random() < 0.8 else 0)
+        for _ in range(mentions):
+            pick = rng.random()
+            if pick < 0.55:
+                token = rng.choices(self.symbols, cum_weights=self.symbol_weights)[0]
+            elif pick < 0.7:
+                token = '$' + rng.choices(self.symbols, cum_weights=self.symbol_weights)[0]
+            else:
+                token = rng.choice(self.noise)
+            tokens.insert(rng.randrange(len(tokens) + 1), token)
+        mood = rng.random()
+        phrases = self.bullish if mood < 0.45 else self.bearish if mood < 0.75 else ()
+        for _ in range(rng.randint(0, 3) if phrases else 0):
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(phrases))
+        return ' '.join(tokens)
+
+    def records(self, count: int) -> Iterator[Tuple[str, Dict]]:
+        """(subreddit, submission record) for `count` posts, oldest first"""
+        rng = self.rng
+        recent: List[Tuple[str, str, str]] = []
+        for index in range(count):
+            subreddit = rng.choices(self.subreddits, cum_weights=self.subreddit_weights)[0]
+            post_id = comment_id(36 ** 5 + index)
+            score = int(rng.paretovariate(1.1)) - 1
+            body_words = min(int(rng.lognormvariate(3.5, 1.0)), 2000)
+            record = {
+                'id': post_id,
+                'name': f"t3_{post_id}",
+                'crosspost_parent': None,
+                'title': self.text(rng.randint(4, 18)),
+                # Link posts have no self-text; long DDs are rare
+                'selftext': '' if rng.random() < 0.35 else self.text(body_words),
+                'author': f"user{rng.randrange(max(1, count // 5))}",
+                'score': score,
+                'upvote_ratio': round(rng.uniform(0.5, 1.0), 2),
+                'num_comments': int(score * rng.uniform(0.05, 0.6)) + rng.randint(0, 5),
+                'created_utc': self.start + index * 86400 * 30 / max(count, 1),
+                'url': f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/",
+                'permalink': f"/r/{subreddit}/comments/{post_id}/",
+                'stickied': rng.random() < 0.002,
+                'total_awards_received': int(rng.paretovariate(3)) - 1,
+            }
+            if recent and rng.random() < 0.02:
+                parent_subreddit, parent_name, parent_title = rng.choice(recent)
+                if parent_subreddit != subreddit:
+                    record.update(crosspost_parent=parent_name, title=parent_title)
+            recent.append((subreddit, record['name'], record['title']))
+            if len(recent) > 200:
+                recent = recent[-100:]
+            yield subreddit, record
+
+    def write(self, path: Path, count: int, listing: str = 'hot') -> Path:
+        """Write `count` posts as a fixture replayable with ReplayReddit"""
+        with FixtureWriter(path) as writer:
+            writer.write_many((subreddit, listing, record) for subreddit, record in self.records(count))
+        return Path(path)
+
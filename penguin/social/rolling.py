@@ -0,0 +1,361 @@
+"""
+Rolling-window mention aggregation
+Per-ticker counters kept in a ring of minute buckets plus running totals for
+each query horizon (1h/6h/24h by default), so a refresh only applies its new
+posts and "top momentum over the last N hours" never re-reads raw posts
+"""
+
+import heapq
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from penguin.core.config import config
+from penguin.social.records import Post
+from penguin.social.sentiment import BEARISH, BULLISH
+
+
+DEFAULT_HORIZONS = (3600, 6 * 3600, 24 * 3600)
+STATE_FILE = 'mention_window.json'
+
+# Ranking keys computed straight from counters, so only the top n get summarized
+RANK_KEYS = {
+    # mentions x bullish% x subreddits == bullish x subreddits
+    'momentum_score': lambda c: c.bullish * len(c.subreddits),
+    'mentions': lambda c: c.mentions,
+    'avg_score': lambda c: c.score / c.mentions,
+    'total_comments': lambda c: c.comments,
+    'bullish_pct': lambda c: c.bullish / c.mentions,
+    'bearish_pct': lambda c: c.bearish / c.mentions,
+    'subreddit_count': lambda c: len(c.subreddits),
+}
+
+
+class MentionCounters:
+    """Additive per-ticker counters (subreddits counted so they can be subtracted)"""
+
+    __slots__ = ('mentions', 'score', 'comments', 'bullish', 'bearish', 'neutral', 'polarity',
+                 'subreddits')
+
+    def __init__(self):
+        self.mentions = 0
+        self.score = 0
+        self.comments = 0
+        self.bullish = 0
+        self.bearish = 0
+        self.neutral = 0
+        self.polarity = 0.0
+        self.subreddits: Dict[str, int] = {}
+
+    def add_post(self, post: Post):
+        self.mentions += 1
+        self.score += post.score
+        self.comments += post.num_comments
+        if post.sentiment == BULLISH:
+            self.bullish += 1
+        elif post.sentiment == BEARISH:
+            self.bearish += 1
+        else:
+            self.neutral += 1
+        self.polarity += post.polarity
+        self.subreddits[post.subreddit] = self.subreddits.get(post.subreddit, 0) + 1
+
+    def merge(self, other: 'MentionCounters', sign: int = 1):
+        """Add (sign=1) or subtract (sign=-1) another set of counters"""
+        self.mentions += sign * other.mentions
+        self.score += sign * other.score
+        self.comments += sign * other.comments
+        self.bullish += sign * other.bullish
+        self.bearish += sign * other.bearish
+        self.neutral += sign * other.neutral
+        self.polarity += sign * other.polarity
+        for subreddit, count in other.subreddits.items():
+            remaining = self.subreddits.get(subreddit, 0) + sign * count
+            if remaining > 0:
+                self.subreddits[subreddit] = remaining
+            else:
+                self.subreddits.pop(subreddit, None)
+
+    def summary(self, ticker: str) -> Dict:
+        """Row in aggregate_stock_data's shape (momentum = mentions x bullish share x subreddits)"""
+        bullish_pct = self.bullish / self.mentions * 100
+        bearish_pct = self.bearish / self.mentions * 100
+        return {
+            'ticker': ticker,
+            'mentions': self.mentions,
+            'avg_score': self.score / self.mentions,
+            'total_comments': self.comments,
+            'bullish_pct': bullish_pct,
+            'bearish_pct': bearish_pct,
+            'avg_polarity': self.polarity / self.mentions,
+            'subreddit_count': len(self.subreddits),
+            'subreddits': list(self.subreddits),
+            'momentum_score': self.mentions * (bullish_pct / 100) * len(self.subreddits),
+        }
+
+    def to_list(self) -> list:
+        return [self.mentions, self.score, self.comments, self.bullish, self.bearish,
+                self.neutral, self.polarity, self.subreddits]
+
+    @classmethod
+    def from_list(cls, values: list) -> 'MentionCounters':
+        counters = cls()
+        (counters.mentions, counters.score, counters.comments, counters.bullish,
+         counters.bearish, counters.neutral, counters.polarity, counters.subreddits) = values
+        return counters
+
+
+class Bucket:
+    """Counters for the posts created within one bucket interval"""
+
+    __slots__ = ('number', 'tickers', 'posts', 'top')
+
+    def __init__(self, number: int):
+        self.number = number
+        self.tickers: Dict[str, MentionCounters] = {}
+        # post ID -> [score, comments, tickers] as last seen, for refresh deltas
+        self.posts: Dict[str, list] = {}
+        # ticker -> (score, post ID) of its best post in this bucket
+        self.top: Dict[str, Tuple[int, str]] = {}
+
+    def note_top(self, ticker: str, score: int, post_id: str):
+        best = self.top.get(ticker)
+        if best is None or score > best[0]:
+            self.top[ticker] = (score, post_id)
+
+
+class MentionWindow:
+    """
+    Sliding window of ticker mentions in fixed-size buckets
+    Posts are bucketed by creation time and counted once per post ID; a post
+    seen again by a later refresh only moves its score/comment deltas
+    """
+
+    def __init__(self, bucket_seconds: int = 60, horizons: Sequence[int] = DEFAULT_HORIZONS):
+        """horizons: query windows in seconds (multiples of bucket_seconds) with running totals"""
+        if any(h <= 0 or h % bucket_seconds for h in horizons):
+            raise ValueError(f"Horizons must be positive multiples of {bucket_seconds}s")
+        self.bucket_seconds = bucket_seconds
+        self.horizons = tuple(sorted(horizons))
+        self.slots = self.horizons[-1] // bucket_seconds
+        self.ring: List[Optional[Bucket]] = [None] * self.slots
+        self.newest: Optional[int] = None
+        self.totals: Dict[int, Dict[str, MentionCounters]] = {h: {} for h in self.horizons}
+        # post ID -> bucket number, for posts still inside the window
+        self.post_buckets: Dict[str, int] = {}
+
+    # --- Buckets -----------------------------------------------------------
+
+    def bucket_number(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _bucket(self, number: int) -> Optional[Bucket]:
+        bucket = self.ring[number % self.slots]
+        return bucket if bucket is not None and bucket.number == number else None
+
+    def _covering(self, number: int) -> List[int]:
+        """Horizons whose window currently includes bucket `number`"""
+        return [h for h in self.horizons if number > self.newest - h // self.bucket_seconds]
+
+    def advance(self, timestamp: float):
+        """Slide the window so it ends at `timestamp`, expiring older buckets"""
+        target = self.bucket_number(timestamp)
+        if self.newest is None:
+            self.newest = target
+            return
+        if target <= self.newest:
+            return
+
+        oldest = self.newest - self.slots + 1
+        for horizon in self.horizons:
+            # Buckets that fall out of this horizon (only ones that can exist)
+            span = horizon // self.bucket_seconds
+            totals = self.totals[horizon]
+            for number in range(max(self.newest - span + 1, oldest), min(target - span, self.newest) + 1):
+                bucket = self._bucket(number)
+                if bucket is not None:
+                    _subtract(totals, bucket.tickers)
+
+        for number in range(oldest, min(target - self.slots, self.newest) + 1):
+            bucket = self._bucket(number)
+            if bucket is not None:
+                for post_id in bucket.posts:
+                    self.post_buckets.pop(post_id, None)
+                self.ring[number % self.slots] = None
+
+        self.newest = target
+
+    # --- Updates -----------------------------------------------------------
+
+    def add(self, post: Post) -> bool:
+        """Apply one post in O(tickers in post); False if it was already counted or is too old"""
+        if not post.tickers:
+            return False
+        number = self.bucket_number(post.created_utc)
+        if self.newest is None or number > self.newest:
+            self.advance(post.created_utc)
+        if number <= self.newest - self.slots:
+            return False
+
+        known = self.post_buckets.get(post.post_id)
+        if known is not None:
+            self._refresh(self._bucket(known), post)
+            return False
+
+        bucket = self._bucket(number)
+        if bucket is None:
+            bucket = self.ring[number % self.slots] = Bucket(number)
+        bucket.posts[post.post_id] = [post.score, post.num_comments, post.tickers]
+        self.post_buckets[post.post_id] = number
+
+        covering = [self.totals[h] for h in self._covering(number)]
+        for ticker in post.tickers:
+            counters = bucket.tickers.get(ticker)
+            if counters is None:
+                counters = bucket.tickers[ticker] = MentionCounters()
+            counters.add_post(post)
+            bucket.note_top(ticker, post.score, post.post_id)
+            for totals in covering:
+                total = totals.get(ticker)
+                if total is None:
+                    total = totals[ticker] = MentionCounters()
+                total.add_post(post)
+        return True
+
+    def add_many(self, posts: Iterable[Post]) -> int:
+        """Apply posts in any order; returns how many were new"""
+        return sum(self.add(post) for post in posts)
+
+    def _refresh(self, bucket: Bucket, post: Post):
+        """Move a re-seen post's score/comment changes into its bucket and totals"""
+        seen = bucket.posts[post.post_id]
+        score_delta = post.score - seen[0]
+        comments_delta = post.num_comments - seen[1]
+        seen[0], seen[1] = post.score, post.num_comments
+        if not score_delta and not comments_delta:
+            return
+
+        covering = [self.totals[h] for h in self._covering(bucket.number)]
+        for ticker in seen[2]:
+            for counters in [bucket.tickers[ticker]] + [totals[ticker] for totals in covering]:
+                counters.score += score_delta
+                counters.comments += comments_delta
+            bucket.note_top(ticker, post.score, post.post_id)
+
+    # --- Queries -----------------------------------------------------------
+
+    def counters(self, horizon: int) -> Dict[str, MentionCounters]:
+        """Ticker counters over the last `horizon` seconds (summed from buckets if not tracked)"""
+        if horizon in self.totals:
+            return self.totals[horizon]
+        if horizon <= 0 or horizon % self.bucket_seconds or horizon > self.horizons[-1]:
+            raise ValueError(f"Horizon must be a multiple of {self.bucket_seconds}s "
+                             f"up to {self.horizons[-1]}s")
+        totals: Dict[str, MentionCounters] = {}
+        if self.newest is not None:
+            for bucket in self._buckets(horizon):
+                for ticker, counters in bucket.tickers.items():
+                    totals.setdefault(ticker, MentionCounters()).merge(counters)
+        return totals
+
+    def _buckets(self, horizon: int) -> Iterable[Bucket]:
+        for number in range(self.newest - horizon // self.bucket_seconds + 1, self.newest + 1):
+            bucket = self._bucket(number)
+            if bucket is not None:
+                yield bucket
+
+    def top(self, horizon: int = 3600, n: int = 20, key: str = 'momentum_score',
+            now: Optional[float] = None) -> List[Dict]:
+        """
+        Top n tickers over the last `horizon` seconds ending at `now` (default:
+        the current time), with the ID of each ticker's best post in the window
+        """
+        if key not in RANK_KEYS:
+            raise ValueError(f"Unknown ranking key: {key} (choose from {', '.join(RANK_KEYS)})")
+        rank = RANK_KEYS[key]
+        self.advance(time.time() if now is None else now)
+        ranked = heapq.nlargest(n, ((ticker, counters) for ticker, counters in self.counters(horizon).items()
+                                    if counters.mentions > 0), key=lambda item: rank(item[1]))
+        rows = [counters.summary(ticker) for ticker, counters in ranked]
+
+        best: Dict[str, Tuple[int, str]] = {}
+        if rows and self.newest is not None:
+            wanted = {row['ticker'] for row in rows}
+            for bucket in self._buckets(horizon):
+                for ticker in wanted.intersection(bucket.top):
+                    candidate = bucket.top[ticker]
+                    if ticker not in best or candidate[0] > best[ticker][0]:
+                        best[ticker] = candidate
+        for row in rows:
+            row['top_post_id'] = best[row['ticker']][1] if row['ticker'] in best else None
+        return rows
+
+    # --- Persistence -------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        return {
+            'bucket_seconds': self.bucket_seconds,
+            'horizons': list(self.horizons),
+            'newest': self.newest,
+            'buckets': [
+                {
+                    'number': bucket.number,
+                    'tickers': {t: c.to_list() for t, c in bucket.tickers.items()},
+                    'posts': {post_id: [s, c, list(tickers)] for post_id, (s, c, tickers) in bucket.posts.items()},
+                    'top': bucket.top,
+                }
+                for bucket in self.ring if bucket is not None
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MentionWindow':
+        """Rebuild buckets; horizon totals are re-summed rather than stored"""
+        window = cls(data['bucket_seconds'], data['horizons'])
+        window.newest = data['newest']
+        for entry in data['buckets']:
+            bucket = Bucket(entry['number'])
+            bucket.tickers = {t: MentionCounters.from_list(v) for t, v in entry['tickers'].items()}
+            bucket.posts = {post_id: [s, c, tuple(tickers)] for post_id, (s, c, tickers) in entry['posts'].items()}
+            bucket.top = {t: tuple(v) for t, v in entry['top'].items()}
+            window.ring[bucket.number % window.slots] = bucket
+            window.post_buckets.update(dict.fromkeys(bucket.posts, bucket.number))
+            for horizon in window._covering(bucket.number):
+                totals = window.totals[horizon]
+                for ticker, counters in bucket.tickers.items():
+                    totals.setdefault(ticker, MentionCounters()).merge(counters)
+        return window
+
+    def save(self, path: Optional[Path] = None):
+        """Persist the window atomically (defaults to CACHE_DIR/mention_window.json)"""
+        path = Path(path or Path(config.CACHE_DIR) / STATE_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, bucket_seconds: int = 60,
+             horizons: Sequence[int] = DEFAULT_HORIZONS) -> 'MentionWindow':
+        """Saved window, or an empty one if there is none or its layout differs"""
+        path = Path(path or Path(config.CACHE_DIR) / STATE_FILE)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(bucket_seconds, horizons)
+        if data.get('bucket_seconds') != bucket_seconds or data.get('horizons') != sorted(horizons):
+            return cls(bucket_seconds, horizons)
+        return cls.from_dict(data)
+
+
+def _subtract(totals: Dict[str, MentionCounters], expired: Dict[str, MentionCounters]):
+    for ticker, counters in expired.items():
+        total = totals.get(ticker)
+        if total is None:
+            continue
+        total.merge(counters, -1)
+        if total.mentions <= 0:
+            del totals[ticker]
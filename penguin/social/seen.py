@@ -0,0 +1,281 @@
+"""
+Seen-post index
+Remembers every post already analyzed, keyed by Reddit fullname (a
+crosspost by its parent's), in an exact SQLite set fronted by a Bloom
+filter, so refreshes skip unchanged posts, update changed scores in place
+and extract tickers/sentiment once per post
+"""
+
+import hashlib
+import math
+import sqlite3
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from penguin.core.config import config
+from penguin.social.records import Post
+
+
+# magic, bits, hashes, keys added, rows of the table the filter covers
+BLOOM_HEADER = struct.Struct('>4sQIIQ')
+BLOOM_MAGIC = b'PBF2'
+LOOKUP_CHUNK = 500  # keys per IN (...) query, under SQLite's variable limit
+
+
+class BloomFilter:
+    """Bit array with k double-hashed probes (no false negatives)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0      # keys added since it was built (pruned keys still set bits)
+        self.covered = 0    # set by the owner when saving: rows of the backing table
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1, h2 = struct.unpack('>QQ', digest)
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        array = self.array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def save(self, path: Path):
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, self.bits, self.hashes, self.count, self.covered))
+            f.write(self.array)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['BloomFilter']:
+        try:
+            with open(path, 'rb') as f:
+                magic, bits, hashes, count, covered = BLOOM_HEADER.unpack(f.read(BLOOM_HEADER.size))
+                array = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+        if magic != BLOOM_MAGIC or len(array) != (bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.bits, bloom.hashes, bloom.array, bloom.count = bits, hashes, array, count
+        bloom.covered = covered
+        return bloom
+
+
+class SeenPost(NamedTuple):
+    """What a refresh needs from a post it has already analyzed"""
+    score: int
+    num_comments: int
+    created_utc: float
+    subreddit: str
+    tickers: Tuple[str, ...]
+    sentiment: int
+    polarity: float
+
+
+class RefreshStats:
+    """Counts for one refresh; `saved` is the share of posts not re-analyzed"""
+
+    __slots__ = ('records', 'new', 'changed', 'unchanged', 'duplicates')
+
+    def __init__(self):
+        self.records = self.new = self.changed = self.unchanged = self.duplicates = 0
+
+    def merge(self, other: 'RefreshStats'):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def saved(self) -> float:
+        return 1 - self.new / self.records if self.records else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.records} posts: {self.new} new, {self.changed} changed, "
+                f"{self.unchanged} unchanged, {self.duplicates} crossposts/repeats "
+                f"({self.saved:.0%} of text processing skipped)")
+
+
+class RefreshPlan(NamedTuple):
+    new: List[Dict]                         # records to analyze
+    changed: List[Tuple[Dict, SeenPost]]    # known posts whose score/comments moved
+    stats: RefreshStats
+
+
+def post_key(record: Dict) -> str:
+    """Reddit fullname of a raw post record (a crosspost maps to its parent)"""
+    parent = record.get('crosspost_parent')
+    if parent:
+        return parent
+    return record.get('name') or f"t3_{record['id']}"
+
+
+class SeenIndex:
+    """Exact on-disk set of analyzed posts with an in-memory Bloom filter in front"""
+
+    def __init__(self, path: Optional[Path] = None, capacity: Optional[int] = None,
+                 error_rate: float = 0.01):
+        """
+        path: SQLite file (defaults to CACHE_DIR/seen_posts.sqlite; the filter sits beside it)
+        capacity: keys the filter is sized for before it is rebuilt larger
+        """
+        self.path = Path(path or Path(config.CACHE_DIR) / 'seen_posts.sqlite')
+        self.bloom_path = self.path.with_suffix('.bloom')
+        self.capacity = capacity or config.SEEN_INDEX_CAPACITY
+        self.error_rate = error_rate
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        # WAL keeps the per-page commits cheap; a crash can only lose the latest
+        # refresh's inserts, which the next refresh simply analyzes again
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                key TEXT PRIMARY KEY,
+                score INTEGER NOT NULL,
+                num_comments INTEGER NOT NULL,
+                created_utc REAL NOT NULL,
+                subreddit TEXT NOT NULL,
+                tickers TEXT NOT NULL,          -- space-separated
+                sentiment INTEGER NOT NULL,
+                polarity REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_seen_posts_created ON seen_posts (created_utc);
+        """)
+        self.rows = len(self)
+        self.bloom = self._load_bloom()
+
+    # --- Bloom filter ------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT count(*) FROM seen_posts").fetchone()[0]
+
+    def _load_bloom(self) -> BloomFilter:
+        """
+        Saved filter if it was saved against the table as it is now (another
+        process may have added rows since), else rebuilt from the table
+        """
+        bloom = BloomFilter.load(self.bloom_path)
+        if bloom is not None and bloom.covered == self.rows:
+            return bloom
+        return self._rebuild_bloom(self.rows)
+
+    def _rebuild_bloom(self, stored: int) -> BloomFilter:
+        self.capacity = max(self.capacity, 2 * stored)
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for (key,) in self.conn.execute("SELECT key FROM seen_posts"):
+            bloom.add(key)
+        return bloom
+
+    # --- Lookups -----------------------------------------------------------
+
+    def lookup(self, keys: Iterable[str]) -> Dict[str, SeenPost]:
+        """Stored state for the keys already seen (only Bloom hits reach SQLite)"""
+        candidates = [key for key in dict.fromkeys(keys) if key in self.bloom]
+        found = {}
+        for start in range(0, len(candidates), LOOKUP_CHUNK):
+            chunk = candidates[start:start + LOOKUP_CHUNK]
+            rows = self.conn.execute(
+                "SELECT key, score, num_comments, created_utc, subreddit, tickers, sentiment, polarity "
+                f"FROM seen_posts WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for key, score, comments, created, subreddit, tickers, sentiment, polarity in rows:
+                found[key] = SeenPost(score, comments, created, subreddit,
+                                      tuple(tickers.split()), sentiment, polarity)
+        return found
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.bloom and bool(self.lookup([key]))
+
+    def plan(self, records: List[Dict]) -> RefreshPlan:
+        """
+        Split a page of raw records into posts to analyze and known posts whose
+        counts changed; unchanged posts, repeats and crossposts of known posts drop out
+        """
+        stats = RefreshStats()
+        stats.records = len(records)
+        keys = [post_key(record) for record in records]
+        seen = self.lookup(keys)
+
+        new, changed, planned = [], [], set()
+        for key, record in zip(keys, records):
+            stored = seen.get(key)
+            if key in planned or (stored is not None and record.get('crosspost_parent')):
+                stats.duplicates += 1
+            elif stored is None:
+                new.append(record)
+                stats.new += 1
+            elif (record['score'], record['num_comments']) == (stored.score, stored.num_comments):
+                stats.unchanged += 1
+            else:
+                changed.append((record, stored))
+                stats.changed += 1
+            planned.add(key)
+
+        return RefreshPlan(new, changed, stats)
+
+    # --- Updates -----------------------------------------------------------
+
+    def remember(self, posts: Iterable[Post]):
+        """Store analyzed posts (post_id = post_key) and their current counts"""
+        now = time.time()
+        rows = [(post.post_id, post.score, post.num_comments, post.created_utc, post.subreddit,
+                 ' '.join(post.tickers), post.sentiment, post.polarity, now) for post in posts]
+        with self.conn:
+            inserted = self.conn.executemany(
+                "INSERT INTO seen_posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO NOTHING",
+                rows
+            ).rowcount
+            if inserted < len(rows):
+                # A concurrent refresh analyzed some of them too: keep the newest counts
+                self.conn.executemany(
+                    "UPDATE seen_posts SET score = ?, num_comments = ?, updated_at = ? WHERE key = ?",
+                    [(row[1], row[2], now, row[0]) for row in rows]
+                )
+        self.rows += inserted
+        # Added even when the filter already (falsely) matches, so count never lags the table
+        for row in rows:
+            self.bloom.add(row[0])
+        if self.bloom.count > self.capacity:
+            self.bloom = self._rebuild_bloom(self.rows)
+
+    def update_counts(self, posts: Iterable[Post]):
+        """Record new score/comment counts for posts that are already stored"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE seen_posts SET score = ?, num_comments = ?, updated_at = ? WHERE key = ?",
+                [(post.score, post.num_comments, now, post.post_id) for post in posts]
+            )
+
+    def prune(self, retention_days: Optional[int] = None) -> int:
+        """Forget posts created before the retention window (they have left the listings)"""
+        days = config.SEEN_POST_RETENTION_DAYS if retention_days is None else retention_days
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM seen_posts WHERE created_utc < ?", (time.time() - days * 86400,)
+            ).rowcount
+        # Pruned keys stay set in the filter (a Bloom filter can't delete); they
+        # only cost a SQLite miss, and count > capacity triggers a rebuild anyway
+        self.rows -= removed
+        return removed
+
+    def save(self):
+        """Persist the Bloom filter (the SQLite set is committed as it changes)"""
+        self.bloom.covered = self.rows
+        self.bloom.save(self.bloom_path)
+
+    def close(self):
+        self.save()
+        self.conn.close()
@@ -0,0 +1,142 @@
+"""
+Lexicon sentiment scoring
+Compiles bullish/bearish phrase lists once and scores batches of posts with NumPy
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from penguin.social.tickers import build_trie_pattern
+
+
+BULLISH_WORDS = [
+    'moon', 'rocket', 'buy', 'calls', 'bullish', 'pump',
+    'rally', 'squeeze', 'tendies', 'gains', 'up', 'long',
+    'green', 'breakout', 'support', 'diamond hands', 'hodl',
+    'to the moon', 'undervalued', 'great buy'
+]
+
+BEARISH_WORDS = [
+    'crash', 'dump', 'puts', 'bearish', 'short', 'down',
+    'red', 'sell', 'drop', 'fall', 'tank', 'rekt',
+    'rug pull', 'bag holder', 'dead cat', 'overvalued'
+]
+
+# Sentiment label codes used in the score arrays
+NEUTRAL, BULLISH, BEARISH = 0, 1, 2
+LABELS = ('neutral', 'bullish', 'bearish')
+
+
+class SentimentScores(NamedTuple):
+    """Per-post sentiment arrays, one element per scored text"""
+    bullish_count: np.ndarray   # int32, distinct bullish phrases present
+    bearish_count: np.ndarray   # int32, distinct bearish phrases present
+    polarity: np.ndarray        # float32 in [-1, 1], weighted (bull - bear) / (bull + bear)
+    label: np.ndarray           # int8, NEUTRAL / BULLISH / BEARISH
+
+    def labels(self) -> List[str]:
+        """Label codes as 'bullish' / 'bearish' / 'neutral' strings"""
+        return [LABELS[code] for code in self.label.tolist()]
+
+
+class SentimentScorer:
+    """Whole-word lexicon scorer with a batch API"""
+
+    def __init__(self, bullish: Optional[Iterable[str]] = None,
+                 bearish: Optional[Iterable[str]] = None,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        bullish/bearish: phrase lists (defaults to BULLISH_WORDS / BEARISH_WORDS)
+        weights: optional per-phrase weight for polarity (default 1.0)
+        """
+        bullish = [w.lower() for w in (BULLISH_WORDS if bullish is None else bullish)]
+        bearish = [w.lower() for w in (BEARISH_WORDS if bearish is None else bearish)]
+        weights = {k.lower(): v for k, v in (weights or {}).items()}
+
+        # Phrase -> column index; bullish columns first, then bearish
+        self.phrases = list(dict.fromkeys(bullish + bearish))
+        self.index = {phrase: i for i, phrase in enumerate(self.phrases)}
+        bullish_set = set(bullish)
+
+        self.sign = np.array(
+            [1 if p in bullish_set else -1 for p in self.phrases], dtype=np.int8
+        )
+        self.weight = np.array(
+            [weights.get(p, 1.0) for p in self.phrases], dtype=np.float32
+        )
+
+        # One scan per text; word boundaries stop "up" from matching "support"
+        # and multi-word phrases tolerate any run of whitespace
+        alternation = build_trie_pattern(self.phrases).replace('\\ ', r'\s+')
+        self.pattern = re.compile(r'\b(?:%s)\b' % alternation)
+
+        # The scan reports the longest phrase at each position, so "to the moon"
+        # hides "moon"; phrases contained in a matched phrase still count, as
+        # they did with per-phrase substring checks
+        implies = np.eye(len(self.phrases), dtype=np.uint8)
+        for outer, phrase in enumerate(self.phrases):
+            for inner, part in enumerate(self.phrases):
+                if inner != outer and re.search(r'\b%s\b' % re.escape(part), phrase):
+                    implies[outer, inner] = 1
+        self.implies = implies if implies.sum() > len(self.phrases) else None
+
+    def match_matrix(self, texts: List[str]) -> np.ndarray:
+        """Boolean (texts x phrases) matrix of which phrases occur in each text"""
+        present = np.zeros((len(texts), len(self.phrases)), dtype=bool)
+        findall = self.pattern.findall
+        index = self.index
+
+        rows = []
+        cols = []
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            for phrase in findall(text.lower()):
+                column = index.get(phrase)
+                if column is None:
+                    column = index[' '.join(phrase.split())]
+                rows.append(row)
+                cols.append(column)
+
+        if rows:
+            present[rows, cols] = True
+            if self.implies is not None:
+                present = (present.astype(np.uint8) @ self.implies) > 0
+        return present
+
+    def score(self, texts: List[str]) -> SentimentScores:
+        """Score a batch of texts"""
+        present = self.match_matrix(texts)
+
+        bullish_mask = self.sign > 0
+        bullish_count = present[:, bullish_mask].sum(axis=1, dtype=np.int32)
+        bearish_count = present[:, ~bullish_mask].sum(axis=1, dtype=np.int32)
+
+        signed = present @ (self.weight * self.sign)
+        total = present @ self.weight
+        polarity = np.divide(
+            signed, total, out=np.zeros(len(texts), dtype=np.float32), where=total > 0
+        ).astype(np.float32)
+
+        label = np.full(len(texts), NEUTRAL, dtype=np.int8)
+        label[bullish_count > bearish_count] = BULLISH
+        label[bearish_count > bullish_count] = BEARISH
+
+        return SentimentScores(bullish_count, bearish_count, polarity, label)
+
+    def label(self, text: str) -> str:
+        """Sentiment label for a single text (bullish/bearish/neutral)"""
+        return LABELS[int(self.score([text]).label[0])]
+
+
+_default_scorer: Optional[SentimentScorer] = None
+
+
+def get_default_scorer() -> SentimentScorer:
+    """Shared scorer built from the default lexicons (compiled on first use)"""
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = SentimentScorer()
+    return _default_scorer
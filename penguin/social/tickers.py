@@ -0,0 +1,135 @@
+"""
+Ticker extraction engine
+Compiles the symbol universe and excluded words into one regex automaton
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from penguin.core.constants import EXCLUDED_WORDS
+
+
+# Bare tickers are 1-5 capital letters, cashtags may be written in any case
+MAX_TICKER_LENGTH = 5
+
+
+def build_trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation from a trie of words (shared prefixes factored out)"""
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict) -> str:
+        alternatives = []
+        leaves = []
+
+        for char in sorted(key for key in node if key):
+            child = node[char]
+            if set(child) == {''}:
+                leaves.append(re.escape(char))
+            else:
+                alternatives.append(re.escape(char) + render(child))
+
+        if len(leaves) == 1:
+            alternatives.append(leaves[0])
+        elif leaves:
+            alternatives.append('[' + ''.join(leaves) + ']')
+
+        if not alternatives:
+            return ''
+        if '' not in node:
+            return alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        if len(alternatives) == 1 and (len(alternatives[0]) == 1 or alternatives[0].startswith('[')):
+            return alternatives[0] + '?'
+        return '(?:' + '|'.join(alternatives) + ')?'
+
+    return render(trie)
+
+
+class TickerExtractor:
+    """Single-pass ticker extractor for post titles, selftext and comments"""
+
+    def __init__(self, universe: Optional[Iterable[str]] = None,
+                 excluded: Optional[Iterable[str]] = None):
+        """
+        universe: known symbols to accept (None accepts any 1-5 letter token)
+        excluded: false-positive words (defaults to EXCLUDED_WORDS)
+        """
+        self.excluded = frozenset(EXCLUDED_WORDS if excluded is None else excluded)
+        self.universe = frozenset(s.upper() for s in universe) if universe is not None else None
+
+        # Cashtags must not be glued to a preceding word ("x$AMC") or dollar sign
+        cashtag = r'\$(?<![\w$]\$)(?P<cash>[A-Za-z]{1,%d})' % MAX_TICKER_LENGTH
+
+        if self.universe is None:
+            # Any capitalised token that is not an excluded word
+            guard = r'(?!(?:%s)\b)' % build_trie_pattern(self.excluded) if self.excluded else ''
+            bare = r'\b%s(?P<bare>[A-Z]{1,%d})' % (guard, MAX_TICKER_LENGTH)
+        else:
+            # Only known symbols; excluded words are removed at compile time
+            accepted = [s for s in self.universe if s not in self.excluded and s.isalpha()]
+            if accepted:
+                bare = r'\b(?P<bare>%s)' % build_trie_pattern(accepted)
+            else:
+                bare = r'(?P<bare>(?!))'
+
+        # The leading lookahead lets the regex engine skip ahead to candidate
+        # characters instead of trying both branches at every position
+        self.pattern = re.compile(f'(?=[$A-Z])(?:{cashtag}|{bare})\\b')
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Yield (ticker, offset) pairs in order of appearance"""
+        if not text:
+            return
+
+        universe = self.universe
+        for match in self.pattern.finditer(text):
+            ticker = match.group('bare')
+            if ticker is not None:
+                yield ticker, match.start('bare')
+                continue
+
+            # Cashtags are explicit mentions, so they bypass the excluded words
+            ticker = match.group('cash').upper()
+            if universe is None or ticker in universe:
+                yield ticker, match.start('cash')
+
+    def extract(self, text: str) -> List[str]:
+        """Extract tickers from text (duplicates kept, in order)"""
+        if not text:
+            return []
+
+        # findall yields (cash, bare) tuples; exactly one of them is non-empty
+        matches = self.pattern.findall(text)
+        if self.universe is None:
+            return [bare or cash.upper() for cash, bare in matches]
+
+        universe = self.universe
+        return [
+            bare or cash.upper() for cash, bare in matches
+            if bare or cash.upper() in universe
+        ]
+
+    def extract_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """Extract tickers from many texts in one call"""
+        extract = self.extract
+        return [extract(text) for text in texts]
+
+    def extract_batch_with_offsets(self, texts: Iterable[str]) -> List[List[Tuple[str, int]]]:
+        """Extract (ticker, offset) pairs from many texts in one call"""
+        iter_matches = self.iter_matches
+        return [list(iter_matches(text)) if text else [] for text in texts]
+
+
+_default_extractor: Optional[TickerExtractor] = None
+
+
+def get_default_extractor() -> TickerExtractor:
+    """Shared extractor built from EXCLUDED_WORDS (compiled on first use)"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = TickerExtractor()
+    return _default_extractor
@@ -0,0 +1,201 @@
+"""
+Bounded-memory trending tickers
+Space-Saving heavy hitters over the mention stream: at most `capacity`
+tickers are monitored however many distinct tokens appear, each with a known
+overcount, so top-K by momentum comes with error bounds instead of an exact
+table of every one-off false positive
+"""
+
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Sequence, Set
+
+from penguin.social.records import Post
+from penguin.social.sentiment import BEARISH, BULLISH
+
+
+class TrendingEntry:
+    """
+    A monitored ticker; count overestimates its mentions by at most `error`
+    (the count it inherited from the ticker it evicted), while bullish,
+    bearish, score and subreddits are exact for the mentions since then
+    """
+
+    __slots__ = ('ticker', 'count', 'error', 'bullish', 'bearish', 'score', 'subreddits')
+
+    def __init__(self, ticker: str, error: int = 0):
+        self.ticker = ticker
+        self.count = error
+        self.error = error
+        self.bullish = 0
+        self.bearish = 0
+        self.score = 0
+        self.subreddits: Set[str] = set()
+
+    @property
+    def observed(self) -> int:
+        """Mentions counted since the ticker was (last) admitted"""
+        return self.count - self.error
+
+    def momentum_bounds(self, subreddit_total: int):
+        """(lower, estimate, upper) for mentions x bullish share x subreddits (= bullish x subreddits)"""
+        subreddits = len(self.subreddits)
+        lower = self.bullish * subreddits
+        if not self.error:
+            return lower, lower, lower
+        # Missed mentions could all have been bullish and from unseen subreddits
+        upper = (self.bullish + self.error) * min(subreddits + self.error, subreddit_total)
+        share = self.bullish / self.observed if self.observed else 0.0
+        estimate = self.count * share * subreddits
+        return lower, max(lower, min(estimate, upper)), upper
+
+
+class TrendingTracker:
+    """Space-Saving summary of ticker mentions with a lazily-invalidated min-heap"""
+
+    def __init__(self, capacity: int = 1000):
+        """capacity: monitored tickers; any ticker above total/capacity mentions is always kept"""
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.entries: Dict[str, TrendingEntry] = {}
+        self.total = 0
+        self.subreddits_seen: Set[str] = set()
+        # (count, seq, ticker); stale when the ticker's count has moved on
+        self._heap: List = []
+        self._seq = itertools.count()
+
+    def add(self, ticker: str, subreddit: str = '', sentiment: int = 0, score: int = 0):
+        """Count one mention"""
+        self.total += 1
+        if subreddit:
+            self.subreddits_seen.add(subreddit)
+
+        entry = self.entries.get(ticker)
+        if entry is None:
+            if len(self.entries) < self.capacity:
+                entry = TrendingEntry(ticker)
+            else:
+                # Replace the least-counted ticker; the newcomer inherits its count as error
+                evicted = self._pop_min()
+                del self.entries[evicted.ticker]
+                entry = TrendingEntry(ticker, evicted.count)
+            self.entries[ticker] = entry
+
+        entry.count += 1
+        if sentiment == BULLISH:
+            entry.bullish += 1
+        elif sentiment == BEARISH:
+            entry.bearish += 1
+        entry.score += score
+        if subreddit:
+            entry.subreddits.add(subreddit)
+
+        heapq.heappush(self._heap, (entry.count, next(self._seq), ticker))
+        if len(self._heap) > 4 * self.capacity:
+            self._compact()
+
+    def add_post(self, post: Post):
+        for ticker in post.tickers:
+            self.add(ticker, post.subreddit, post.sentiment, post.score)
+
+    def add_posts(self, posts: Iterable[Post]):
+        for post in posts:
+            self.add_post(post)
+
+    def _pop_min(self) -> TrendingEntry:
+        while True:
+            count, _, ticker = heapq.heappop(self._heap)
+            entry = self.entries.get(ticker)
+            if entry is not None and entry.count == count:
+                return entry
+
+    def _compact(self):
+        self._heap = [(entry.count, next(self._seq), ticker) for ticker, entry in self.entries.items()]
+        heapq.heapify(self._heap)
+
+    # --- Queries -----------------------------------------------------------
+
+    @property
+    def min_count(self) -> int:
+        """Upper bound on the mentions of any ticker that is not monitored"""
+        if len(self.entries) < self.capacity:
+            return 0
+        while True:
+            count, _, ticker = self._heap[0]
+            entry = self.entries.get(ticker)
+            if entry is not None and entry.count == count:
+                return count
+            heapq.heappop(self._heap)
+
+    @property
+    def error_bound(self) -> float:
+        """Worst-case mention overcount for any ticker (total / capacity)"""
+        return self.total / self.capacity
+
+    def mentions(self, ticker: str) -> int:
+        """Estimated mentions (an upper bound; min_count for unmonitored tickers)"""
+        entry = self.entries.get(ticker)
+        return entry.count if entry is not None else self.min_count
+
+    def top(self, k: int = 20, key: str = 'momentum_score') -> List[Dict]:
+        """
+        Top k by momentum_score (or mentions) with bounds; `guaranteed` marks
+        rows whose lower bound beats every ticker left out, monitored or not
+        """
+        if key not in ('momentum_score', 'mentions'):
+            raise ValueError(f"Unknown ranking key: {key} (momentum_score or mentions)")
+        subreddit_total = len(self.subreddits_seen)
+
+        rows = []
+        for entry in self.entries.values():
+            if key == 'mentions':
+                lower, estimate, upper = entry.observed, entry.count, entry.count
+            else:
+                lower, estimate, upper = entry.momentum_bounds(subreddit_total)
+            rows.append((estimate, lower, upper, entry))
+
+        ranked = heapq.nlargest(k, rows, key=lambda row: (row[0], row[3].count))
+        chosen = {row[3].ticker for row in ranked}
+
+        # Best any excluded ticker could truly be
+        outside = self.min_count
+        if key == 'momentum_score':
+            outside *= min(outside, subreddit_total)
+        outside = max([outside] + [upper for _, _, upper, entry in rows if entry.ticker not in chosen])
+
+        results = []
+        for estimate, lower, upper, entry in ranked:
+            observed = entry.observed
+            results.append({
+                'ticker': entry.ticker,
+                'mentions': entry.count,
+                'mentions_error': entry.error,
+                'bullish_pct': entry.bullish / observed * 100 if observed else 0.0,
+                'bearish_pct': entry.bearish / observed * 100 if observed else 0.0,
+                'avg_score': entry.score / observed if observed else 0.0,
+                'subreddit_count': len(entry.subreddits),
+                'subreddits': sorted(entry.subreddits),
+                'momentum_score': entry.momentum_bounds(subreddit_total)[1],
+                # Bounds on the ranking key
+                'bounds': (lower, upper),
+                'guaranteed': lower >= outside,
+            })
+        return results
+
+    def stats(self) -> Dict:
+        return {
+            'mentions': self.total,
+            'monitored': len(self.entries),
+            'capacity': self.capacity,
+            'min_count': self.min_count,
+            'error_bound': self.error_bound,
+        }
+
+
+def exact_top(posts: Sequence[Post], k: int = 20, key: str = 'momentum_score') -> List[Dict]:
+    """Exact counterpart of TrendingTracker.top (room for every ticker), for comparisons"""
+    distinct = {ticker for post in posts for ticker in post.tickers}
+    tracker = TrendingTracker(capacity=max(1, len(distinct)))
+    tracker.add_posts(posts)
+    return tracker.top(k, key)
@@ -0,0 +1,124 @@
+"""
+Benchmark: CLI startup import time
+Runs each `penguin` command under `python -X importtime` and fails when its
+import cost exceeds the command's budget or it loads a heavy dependency
+
+Usage: python scripts/bench_cli_startup.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# Command -> import-time budget in ms (interpreter startup excluded)
+BUDGETS = {
+    '--help': 100,
+    '--version': 100,
+    'collectors --help': 100,
+    'collectors list': 100,
+    'collect --help': 100,
+    'query --help': 100,
+    'status --help': 100,
+    'daemon --help': 100,
+}
+
+# Modules that must not be imported just to start the CLI or list collectors
+HEAVY_MODULES = [
+    'sqlalchemy', 'psycopg2', 'asyncpg', 'redis', 'praw', 'yfinance',
+    'pandas', 'numpy', 'aiohttp', 'requests', 'dotenv',
+]
+
+RUNNER = "import sys; from penguin.cli.main import cli; cli(sys.argv[1:], prog_name='penguin')"
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """`import time: self | cumulative | name` lines -> (name, self_us, cumulative_us)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        entries.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run_importtime(code: str, args: List[str]) -> Tuple[List[Tuple[str, int, int]], float, int]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code, *args],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    return parse_importtime(proc.stderr), elapsed, proc.returncode
+
+
+def top_level(entries: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Cumulative time of modules imported directly (not as a dependency of another)"""
+    return {name.strip(): cumulative for name, _, cumulative in entries
+            if not name.startswith('  ')}
+
+
+def measure(command: str, baseline: Dict[str, int]) -> Dict:
+    entries, elapsed, returncode = run_importtime(RUNNER, command.split())
+    imported = top_level(entries)
+    modules = {name.strip().split('.')[0] for name, _, _ in entries}
+    return {
+        'import_ms': sum(us for name, us in imported.items() if name not in baseline) / 1000,
+        'wall_ms': elapsed * 1000,
+        'heavy': sorted(set(HEAVY_MODULES) & modules),
+        'slowest': sorted(((us, name.strip()) for name, us, _ in entries), reverse=True)[:3],
+        'returncode': returncode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (median is reported)')
+    args = parser.parse_args()
+
+    # Modules the bare interpreter already imports (site, encodings, .pth hooks)
+    baseline_entries, baseline_wall, _ = run_importtime('pass', [])
+    baseline = top_level(baseline_entries)
+
+    print("=" * 70)
+    print(f"CLI STARTUP (median of {args.runs}; interpreter alone {baseline_wall * 1000:.0f} ms wall)")
+    print("=" * 70)
+    print(f"{'command':22s} {'imports ms':>11s} {'budget':>7s} {'wall ms':>8s}  status")
+
+    failures = []
+    for command, budget in BUDGETS.items():
+        runs = [measure(command, baseline) for _ in range(args.runs)]
+        import_ms = statistics.median(r['import_ms'] for r in runs)
+        wall_ms = statistics.median(r['wall_ms'] for r in runs)
+        heavy = runs[0]['heavy']
+
+        problems = []
+        if runs[0]['returncode'] != 0:
+            problems.append(f"exit code {runs[0]['returncode']}")
+        if import_ms > budget:
+            problems.append('over budget')
+        if heavy:
+            problems.append(f"imports {', '.join(heavy)}")
+
+        print(f"{command:22s} {import_ms:11.1f} {budget:7d} {wall_ms:8.0f}  "
+              f"{'; '.join(problems) or 'ok'}")
+        if problems:
+            slowest = ', '.join(f"{name} {us / 1000:.1f}ms" for us, name in runs[0]['slowest'])
+            print(f"{'':22s} slowest self times: {slowest}")
+            failures.append(command)
+
+    print()
+    if failures:
+        print(f"FAILED: {len(failures)} command(s) regressed: {', '.join(failures)}")
+        sys.exit(1)
+    print("All commands within budget")
+
+
+if __name__ == '__main__':
+    main()
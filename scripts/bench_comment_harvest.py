@@ -0,0 +1,200 @@
+"""
+Benchmark: comment harvesting
+Expands synthetic comment forests (nested top comments, 'more' and
+"continue this thread" stubs, simulated request latency) serially and with bounded concurrency, under a
+short time budget, and again after new comments arrive; checks every run
+together sees each comment exactly once and feeds them through build_posts
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'testing' / 'reddit_poc'))
+
+from penguin.social.comments import CommentHarvester, comment_id
+from penguin.social.reddit_async import AsyncRedditCollector
+from scripts.bench_post_records import SUBREDDITS
+from scripts.bench_seen_index import make_scraper
+from scripts.bench_ticker_extraction import make_corpus
+
+START = 1.7e9
+
+
+class FakeReddit(AsyncRedditCollector):
+    """Comment endpoints answered from in-memory threads after `latency` seconds"""
+
+    def __init__(self, threads: int, comments: int, visible: int, latency: float,
+                 depth: int = 4, seed: int = 42):
+        super().__init__('id', 'secret', 'bench')
+        self.rng = random.Random(seed)
+        self.texts = make_corpus(4096, seed)
+        self.visible = visible
+        self.depth = depth
+        self.latency = latency
+        self.next_id = 36 ** 5
+        # link_id -> {comment_id: (parent_id or None, body)}, IDs ascending with time
+        self.threads = {f"t3_{comment_id(36 ** 4 + n)}": {} for n in range(threads)}
+        self.subreddits = {link_id: SUBREDDITS[n % len(SUBREDDITS)]
+                           for n, link_id in enumerate(self.threads)}
+        self.add_comments(comments)
+
+    def add_comments(self, per_thread: int) -> int:
+        """Post new comments (a third of them replies to older ones); returns how many"""
+        for tree in self.threads.values():
+            for _ in range(self.rng.randint(per_thread // 2, per_thread * 3 // 2)):
+                new_id = comment_id(self.next_id)
+                self.next_id += 1
+                parent = self.rng.choice(list(tree)) if tree and self.rng.random() < 0.33 else None
+                body = self.rng.choice(self.texts) if self.rng.random() > 0.02 else '[deleted]'
+                tree[new_id] = (parent, body)
+        return sum(len(tree) for tree in self.threads.values())
+
+    def comment(self, link_id: str, comment_id: str, replies=''):
+        parent, body = self.threads[link_id][comment_id]
+        return {'kind': 't1', 'data': {
+            'id': comment_id, 'name': f"t1_{comment_id}", 'body': body, 'score': 1,
+            'created_utc': START + int(comment_id, 36) - 36 ** 5, 'replies': replies,
+            'parent_id': f"t1_{parent}" if parent else link_id,
+            'permalink': f"/comments/{link_id[3:]}/_/{comment_id}", 'stickied': False,
+        }}
+
+    async def fetch_thread(self, session, article, limit=500, sort='new', comment=None):
+        """
+        Oldest `visible` comments nested, replies past `depth` behind "continue
+        this thread" stubs and the rest behind one top-level 'more' stub; with
+        `comment`, that comment's subtree
+        """
+        await asyncio.sleep(self.latency)
+        link_id = f"t3_{article}"
+        tree = self.threads[link_id]
+        ids = list(tree)
+        shown, hidden = set(ids[:self.visible]), ids[self.visible:]
+
+        children = {comment_id: [] for comment_id in shown}
+        roots = []
+        for comment_id in ids[:self.visible]:
+            parent = tree[comment_id][0]
+            (children[parent] if parent in shown else roots).append(comment_id)
+
+        def node(comment_id, depth):
+            if not children[comment_id]:
+                replies = []
+            elif depth + 1 >= self.depth:
+                replies = [{'kind': 'more', 'data': {'count': len(children[comment_id]), 'children': [],
+                                                     'parent_id': f"t1_{comment_id}"}}]
+            else:
+                replies = [node(child, depth + 1) for child in children[comment_id]]
+            return self.comment(link_id, comment_id,
+                                {'kind': 'Listing', 'data': {'children': replies}} if replies else '')
+
+        if comment is not None:
+            return [node(comment, 0)]
+        items = [node(comment_id, 0) for comment_id in roots]
+        if hidden:
+            items.append({'kind': 'more', 'data': {'count': len(hidden), 'children': hidden}})
+        return items
+
+    async def fetch_more_children(self, session, link_id, children, sort='new'):
+        await asyncio.sleep(self.latency)
+        return [self.comment(link_id, comment_id) for comment_id in children]
+
+
+def run(reddit: FakeReddit, state: Path, concurrency: int, budget: float):
+    """(comment records by ID, stats)"""
+    harvester = CommentHarvester(reddit, state, concurrency=concurrency, budget_seconds=budget)
+    threads = [(reddit.subreddits[link_id], link_id) for link_id in reddit.threads]
+    grouped, stats = harvester.harvest(threads)
+    records = {record['id']: record for records in grouped.values() for record in records}
+    duplicates = sum(len(records) for records in grouped.values()) - len(records)
+    return records, stats, duplicates
+
+
+def live_ids(reddit: FakeReddit) -> set:
+    return {comment_id for tree in reddit.threads.values()
+            for comment_id, (_, body) in tree.items() if body != '[deleted]'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=25, help='Threads to harvest')
+    parser.add_argument('--comments', type=int, default=800, help='Typical comments per thread')
+    parser.add_argument('--visible', type=int, default=200, help='Comments in the first thread page')
+    parser.add_argument('--depth', type=int, default=4, help='Reply depth before "continue this thread"')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds per request')
+    parser.add_argument('--concurrency', type=int, default=8, help='Requests in flight')
+    args = parser.parse_args()
+
+    reddit = FakeReddit(args.threads, args.comments, args.visible, args.latency, args.depth)
+    expected = live_ids(reddit)
+    failed = False
+
+    print("=" * 70)
+    print(f"COMMENT HARVEST ({args.threads} threads, {sum(map(len, reddit.threads.values())):,} comments, "
+          f"{args.latency * 1000:.0f} ms per request)")
+    print("=" * 70)
+    print(f"{'run':28s} {'requests':>9s} {'comments':>9s} {'complete':>9s} {'time':>8s}")
+
+    def report(label, stats):
+        print(f"{label:28s} {stats.requests:9d} {stats.comments:9d} "
+              f"{stats.complete:5d}/{stats.threads:<3d} {stats.seconds:7.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Full expansion: serial vs bounded concurrency
+        serial, serial_stats, duplicates = run(reddit, Path(tmp) / 'serial.json', 1, 3600)
+        report('serial (replace_more-style)', serial_stats)
+        failed |= duplicates > 0
+
+        state = Path(tmp) / 'watermarks.json'
+        concurrent, concurrent_stats, duplicates = run(reddit, state, args.concurrency, 3600)
+        report(f'concurrency {args.concurrency}', concurrent_stats)
+        failed |= duplicates > 0 or set(serial) != expected or set(concurrent) != expected
+
+        # Budget: a third of the serial time, then a second run picks up the rest
+        budget = serial_stats.seconds / 3
+        state = Path(tmp) / 'budget.json'
+        first, budget_stats, _ = run(reddit, state, 1, budget)
+        report(f'serial, {budget:.1f}s budget', budget_stats)
+        rest, rest_stats, _ = run(reddit, state, 1, 3600)
+        report('  next run', rest_stats)
+        failed |= budget_stats.seconds > budget + 2 * args.latency
+        # Unfinished threads are fetched again, never skipped
+        failed |= set(first) | set(rest) != expected
+
+        # Incremental: new comments arrive, only they come back
+        before = set(expected)
+        reddit.add_comments(args.comments // 10)
+        expected = live_ids(reddit)
+        fresh, fresh_stats, duplicates = run(reddit, Path(tmp) / 'watermarks.json', args.concurrency, 3600)
+        report(f'incremental, concurrency {args.concurrency}', fresh_stats)
+        failed |= duplicates > 0 or set(fresh) != expected - before
+
+    # Same extraction/sentiment path as posts
+    scraper = make_scraper()
+    start = time.perf_counter()
+    posts = [post for subreddit in SUBREDDITS
+             for post in scraper.build_posts(subreddit, [r for r in concurrent.values()
+                                                         if reddit.subreddits[r['link_id']] == subreddit])]
+    analysis = time.perf_counter() - start
+
+    print("-" * 70)
+    print(f"Speedup from bounded concurrency: {serial_stats.seconds / concurrent_stats.seconds:.1f}x")
+    print(f"Continue-thread stubs followed: {concurrent_stats.truncated} in a full run")
+    print(f"Incremental run: {fresh_stats.requests} requests for {fresh_stats.comments} new comments "
+          f"({fresh_stats.skipped_old:,} already-seen IDs never fetched)")
+    print(f"build_posts: {len(concurrent):,} comments -> {len(posts):,} with tickers "
+          f"in {analysis * 1000:.0f} ms")
+
+    if failed:
+        print("FAILED: harvested comments differ from the threads (missed, repeated or over budget)")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: typed indicator snapshots
+Screens a universe for "bb_squeeze and rsi_14 < 30" by parsing JSON payloads
+versus indexed column predicates on indicator_snapshots, after migrating the
+JSON form, and compares stored payload sizes
+Runs against a throwaway SQLite file
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.data.storage.bulk import BulkWriter
+from penguin.data.storage.indicators import (
+    BOOL_COLUMNS, DOUBLE_COLUMNS, FLOAT_COLUMNS, LABEL_COLUMNS, TECHNICAL_DATA_TYPE,
+    indicator_snapshots, migrate_json, screen,
+)
+from penguin.data.storage.models import Base, DataPoint
+
+
+def make_payload(rng: random.Random) -> dict:
+    """~98-key technical_analysis metadata like the Yahoo collector's"""
+    payload = {name: rng.uniform(0, 100) for name in FLOAT_COLUMNS}
+    payload.update({name: float(rng.randint(10 ** 6, 10 ** 9)) for name in DOUBLE_COLUMNS})
+    payload.update({name: rng.random() < 0.1 for name in BOOL_COLUMNS})
+    payload.update({name: rng.choice(['bullish', 'bearish', 'neutral']) for name in LABEL_COLUMNS})
+    payload['timestamp'] = datetime.utcnow().isoformat()
+    return payload
+
+
+def make_points(symbols: int, runs: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    start = datetime.utcnow() - timedelta(days=runs)
+    return [
+        {
+            'timestamp': start + timedelta(days=run),
+            'symbol': f"S{index:04d}",
+            'source': 'yahoo_finance',
+            'category': 'market_data',
+            'data_type': TECHNICAL_DATA_TYPE,
+            'value': rng.uniform(1, 500),
+            'metadata': make_payload(rng),
+        }
+        for run in range(runs) for index in range(symbols)
+    ]
+
+
+def screen_json(engine) -> list:
+    """Latest payload per symbol, parsed and filtered in Python"""
+    table = DataPoint.__table__
+    latest = (
+        select(table.c.symbol, func.max(table.c.timestamp).label('latest'))
+        .where(table.c.data_type == TECHNICAL_DATA_TYPE)
+        .group_by(table.c.symbol)
+        .subquery()
+    )
+    query = select(table.c.symbol, table.c.extra_data).join(
+        latest, (table.c.symbol == latest.c.symbol) & (table.c.timestamp == latest.c.latest)
+    )
+    with engine.connect() as conn:
+        return sorted(
+            symbol for symbol, payload in conn.execute(query)
+            if payload.get('bb_squeeze') and payload.get('rsi_14', 100) < 30
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=2000, help='Universe size')
+    parser.add_argument('--runs', type=int, default=20, help='Snapshots per symbol')
+    args = parser.parse_args()
+
+    points = make_points(args.symbols, args.runs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/indicators.db")
+        Base.metadata.create_all(engine)
+
+        # Legacy layout: indicators stay in the JSON payload
+        BulkWriter(engine, split_indicators=False).write(points)
+
+        start = time.perf_counter()
+        stats = migrate_json(engine, DataPoint.__table__)
+        migrate_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        json_matches = screen_json(engine)
+        json_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        typed_matches = [row.symbol for row in screen(engine, ['bb_squeeze', 'rsi_14<30'])]
+        typed_seconds = time.perf_counter() - start
+
+        with engine.connect() as conn:
+            snapshots = conn.execute(select(func.count()).select_from(indicator_snapshots)).scalar()
+
+    json_bytes = sum(len(json.dumps(p['metadata'])) for p in points) / len(points)
+    typed_bytes = 4 * len(FLOAT_COLUMNS) + 8 * len(DOUBLE_COLUMNS) + len(BOOL_COLUMNS) \
+        + 8 * len(LABEL_COLUMNS)
+
+    print("=" * 70)
+    print(f"INDICATOR SNAPSHOTS ({args.symbols} symbols x {args.runs} runs = {len(points)} payloads)")
+    print("=" * 70)
+    print(f"Migration: {stats['migrated']} snapshots in {migrate_seconds:.2f}s "
+          f"({stats['migrated'] / migrate_seconds:,.0f}/s)")
+    print(f"Payload size: JSON ~{json_bytes:,.0f} bytes vs typed ~{typed_bytes} bytes per snapshot")
+    print(f"\nScreen bb_squeeze & rsi_14<30 across the universe:")
+    print(f"  JSON parse:  {json_seconds * 1000:8.1f} ms  ({len(json_matches)} matches)")
+    print(f"  Typed table: {typed_seconds * 1000:8.1f} ms  ({len(typed_matches)} matches)")
+    print(f"  Speedup:     {json_seconds / typed_seconds:8.1f}x")
+
+    if json_matches != typed_matches or snapshots != len(points):
+        print("FAILED: typed screen disagrees with the JSON screen")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: data point ingestion
+Compares row-by-row ORM inserts with the bulk COPY/multi-row path
+Runs against a throwaway SQLite file, or a scratch database given with --url
+(its data_points table is dropped and recreated)
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.data.storage.bulk import BulkWriter, prepare_rows
+from penguin.data.storage.models import Base, DataPoint
+
+
+SYMBOLS = ['GME', 'AMC', 'TSLA', 'NVDA', 'AAPL', 'PLTR', 'SOFI', 'AMD', 'MSFT', 'BB']
+
+
+def make_data_points(count: int, seed: int = 42, duplicate_rate: float = 0.05) -> list:
+    """Collector-style dicts, with a share of exact-key duplicates"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    points = []
+
+    for i in range(count):
+        if points and rng.random() < duplicate_rate:
+            points.append(dict(rng.choice(points)))
+            continue
+        points.append({
+            'timestamp': start + timedelta(seconds=i),
+            'symbol': rng.choice(SYMBOLS),
+            'source': 'reddit_wsb',
+            'category': 'social_sentiment',
+            'data_type': 'mention',
+            'value': 1.0,
+            'metadata': {'score': rng.randint(0, 5000), 'sentiment': rng.uniform(-1, 1)},
+        })
+
+    return points
+
+
+def count_rows(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(DataPoint.__table__)).scalar()
+
+
+def bench_orm(engine, points: list) -> float:
+    """One ORM object per data point (the store.save_data_points pattern)"""
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for row in prepare_rows(points):
+            session.add(DataPoint(**row))
+            session.flush()
+        session.commit()
+    return time.perf_counter() - start
+
+
+def bench_bulk(engine, points: list) -> float:
+    writer = BulkWriter(engine=engine)
+    start = time.perf_counter()
+    writer.write(points)
+    return time.perf_counter() - start
+
+
+def reset(engine):
+    Base.metadata.drop_all(engine, tables=[DataPoint.__table__])
+    Base.metadata.create_all(engine, tables=[DataPoint.__table__])
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help='Scratch database URL (default: temporary SQLite file)')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    url = args.url or f"sqlite:///{tmp_dir.name}/ingest.db"
+    engine = create_engine(url)
+
+    print("=" * 70)
+    print("Data Point Ingestion Benchmark")
+    print(f"Database: {engine.url.render_as_string(hide_password=True)}")
+    print("=" * 70)
+
+    for count in args.rows:
+        points = make_data_points(count)
+        unique = len(prepare_rows(points))
+        print(f"\n{count:,} data points ({unique:,} unique):")
+
+        reset(engine)
+        orm_time = bench_orm(engine, points)
+        print(f"  ORM row-by-row   {orm_time * 1000:9.1f} ms   {unique / orm_time:12,.0f} rows/sec")
+
+        reset(engine)
+        bulk_time = bench_bulk(engine, points)
+        print(f"  Bulk             {bulk_time * 1000:9.1f} ms   {unique / bulk_time:12,.0f} rows/sec")
+
+        # Re-ingesting the same batch must insert nothing
+        BulkWriter(engine=engine).write(points)
+        print(f"  Rows after re-ingest: {count_rows(engine):,} (expected {unique:,})")
+        print(f"  Speedup: {orm_time / bulk_time:.1f}x")
+
+    engine.dispose()
+    tmp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark: rolling-window mention aggregation
+Replays a day of scheduled refreshes, each re-fetching the newest posts (most
+already counted, with updated scores), and compares rebuilding the ticker
+table from every post in the window against applying the refresh to a
+MentionWindow; checks the 1h/6h/24h answers agree, across a save/load
+"""
+
+import argparse
+import bisect
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.social.records import Post
+from penguin.social.rolling import DEFAULT_HORIZONS, MentionCounters, MentionWindow
+from scripts.bench_post_records import SUBREDDITS
+
+START = 1.7e9
+
+
+def make_stream(posts_per_hour: int, hours: int, universe: int, seed: int = 42) -> list:
+    """(created_utc, post) in creation order, with a skewed ticker distribution"""
+    rng = random.Random(seed)
+    symbols = [f"T{index:04d}" for index in range(universe)]
+    weights = [1 / (rank + 1) for rank in range(universe)]
+    total = posts_per_hour * hours
+    stream = []
+    for index in range(total):
+        created = START + index * 3600 / posts_per_hour
+        stream.append(Post(
+            post_id=f"p{index}", subreddit=rng.choice(SUBREDDITS), title=f"post {index}",
+            score=rng.randint(0, 50), num_comments=rng.randint(0, 20), created_utc=created,
+            tickers=rng.choices(symbols, weights, k=rng.randint(1, 3)),
+            sentiment=rng.randint(0, 2), polarity=rng.uniform(-1, 1),
+        ))
+    return stream
+
+
+def fetch(stream: list, created: list, now: float, listing: int, rng: random.Random) -> list:
+    """What a refresh at `now` sees: the newest `listing` posts, scores still climbing"""
+    end = bisect.bisect_right(created, now)
+    visible = stream[max(0, end - listing):end]
+    fetched = []
+    for post in visible:
+        age_hours = (now - post.created_utc) / 3600
+        fetched.append(Post(
+            post.post_id, post.subreddit, post.title,
+            score=post.score + int(age_hours * rng.randint(0, 30)),
+            num_comments=post.num_comments + int(age_hours * 5),
+            created_utc=post.created_utc, tickers=post.tickers,
+            sentiment=post.sentiment, polarity=post.polarity,
+        ))
+    rng.shuffle(fetched)
+    return fetched
+
+
+def rebuild(latest: dict, now: float, horizon: int, bucket_seconds: int, n: int) -> list:
+    """Full recount over every stored post inside the window (the old refresh)"""
+    newest = int(now // bucket_seconds)
+    oldest = newest - horizon // bucket_seconds
+    totals = {}
+    for post in latest.values():
+        if oldest < int(post.created_utc // bucket_seconds) <= newest:
+            for ticker in post.tickers:
+                totals.setdefault(ticker, MentionCounters()).add_post(post)
+    rows = [counters.summary(ticker) for ticker, counters in totals.items()]
+    rows.sort(key=lambda row: row['momentum_score'], reverse=True)
+    return rows[:n]
+
+
+def same_rows(expected: list, actual: list) -> bool:
+    if len(expected) != len(actual):
+        return False
+    by_ticker = {row['ticker']: row for row in actual}
+    for row in expected:
+        other = by_ticker.get(row['ticker'])
+        if other is None or set(row['subreddits']) != set(other['subreddits']):
+            # Ties at the cut-off can legitimately swap tickers
+            if other is None and any(math.isclose(row['momentum_score'], o['momentum_score'])
+                                     for o in actual):
+                continue
+            return False
+        for key in ('mentions', 'total_comments', 'subreddit_count'):
+            if row[key] != other[key]:
+                return False
+        for key in ('avg_score', 'bullish_pct', 'avg_polarity', 'momentum_score'):
+            if not math.isclose(row[key], other[key], rel_tol=1e-9, abs_tol=1e-9):
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts-per-hour', type=int, default=2000, help='New posts per hour')
+    parser.add_argument('--hours', type=int, default=30, help='Hours of stream to replay')
+    parser.add_argument('--refresh-minutes', type=int, default=10, help='Minutes between refreshes')
+    parser.add_argument('--listing', type=int, default=1000, help='Posts fetched per refresh')
+    parser.add_argument('--universe', type=int, default=2000, help='Distinct tickers')
+    args = parser.parse_args()
+
+    stream = make_stream(args.posts_per_hour, args.hours, args.universe)
+    created = [post.created_utc for post in stream]
+    rng = random.Random(7)
+    window = MentionWindow()
+    latest = {}
+    rebuild_seconds = window_seconds = 0.0
+    refreshes = mismatches = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / 'mention_window.json'
+        now = START
+        while now <= START + args.hours * 3600:
+            now += args.refresh_minutes * 60
+            fetched = fetch(stream, created, now, args.listing, rng)
+            refreshes += 1
+
+            # Old path: keep every post, recount the whole window
+            start = time.perf_counter()
+            for post in fetched:
+                latest[post.post_id] = post
+            expected = {h: rebuild(latest, now, h, window.bucket_seconds, 20) for h in DEFAULT_HORIZONS}
+            rebuild_seconds += time.perf_counter() - start
+
+            # Incremental path: apply the refresh, answer from running totals
+            start = time.perf_counter()
+            window.add_many(fetched)
+            actual = {h: window.top(h, 20, now=now) for h in DEFAULT_HORIZONS}
+            window_seconds += time.perf_counter() - start
+
+            mismatches += sum(not same_rows(expected[h], actual[h]) for h in DEFAULT_HORIZONS)
+
+            # Simulate a process restart every few hours
+            if refreshes % 18 == 0:
+                window.save(state_path)
+                window = MentionWindow.load(state_path)
+        state_bytes = state_path.stat().st_size
+
+    print("=" * 70)
+    print(f"MENTION WINDOW ({args.hours}h at {args.posts_per_hour:,} posts/h, "
+          f"refresh every {args.refresh_minutes} min x {args.listing} posts)")
+    print("=" * 70)
+    print(f"Refreshes: {refreshes}, posts held by the rebuild: {len(latest):,}, "
+          f"window state: {state_bytes / 1024:,.0f} KB")
+    print(f"  Rebuild top-20 x 3 horizons: {rebuild_seconds / refreshes * 1000:8.1f} ms/refresh")
+    print(f"  Rolling window:              {window_seconds / refreshes * 1000:8.1f} ms/refresh")
+    print(f"  Speedup:                     {rebuild_seconds / window_seconds:8.1f}x")
+    print(f"Horizon answers compared: {refreshes * len(DEFAULT_HORIZONS)}, mismatches: {mismatches}")
+
+    if mismatches:
+        print("FAILED: rolling window disagrees with a full recount")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
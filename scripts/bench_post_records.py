@@ -0,0 +1,166 @@
+"""
+Benchmark: compact post and mention records
+Builds 100k synthetic posts and their per-ticker mention aggregates the old
+way (a dict per post plus a copied title/score/sentiment dict per mention)
+and with slotted Post records in a PostStore, whose aggregates hold post
+indices, and compares traced memory and build time
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.social.records import Post, PostStore, analyze_mentions
+from penguin.social.sentiment import LABELS
+
+SUBREDDITS = ['wallstreetbets', 'pennystocks', 'stocks', 'investing', 'options',
+              'Daytrading', 'SecurityAnalysis', 'ValueInvesting', 'Dividends', 'StockMarket']
+
+
+def make_raw_posts(count: int, universe: int, seed: int = 42) -> list:
+    """Reddit-like source fields; titles are allocated up front, outside the measurement"""
+    rng = random.Random(seed)
+    symbols = [''.join(rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(rng.randint(2, 5)))
+               for _ in range(universe)]
+    # Mentions are heavily skewed towards a few popular tickers
+    weights = [1 / (rank + 1) for rank in range(universe)]
+    return [
+        {
+            'id': f"t3_{index:07x}",
+            'subreddit': rng.choice(SUBREDDITS),
+            'title': f"{' '.join(rng.choices(symbols, k=2))} to the moon? post {index} " + 'x' * rng.randint(10, 80),
+            'author': f"user{rng.randint(0, count // 10)}",
+            'score': rng.randint(0, 5000),
+            'upvote_ratio': rng.random(),
+            'num_comments': rng.randint(0, 800),
+            'created_utc': 1.7e9 + index,
+            'url': f"https://reddit.com/r/x/comments/{index:07x}",
+            'tickers': rng.choices(symbols, weights, k=rng.randint(1, 4)),
+            'sentiment': rng.randint(0, 2),
+            'polarity': rng.uniform(-1, 1),
+            'awards': rng.randint(0, 3),
+        }
+        for index in range(count)
+    ]
+
+
+def fresh(strings: list) -> list:
+    """New string objects, as the ticker regex hands back for every post"""
+    return [(s + ' ')[:-1] for s in strings]
+
+
+def build_dicts(raw: list):
+    """Previous pipeline: dict per post, copied post dict per ticker mention"""
+    posts = []
+    for r in raw:
+        posts.append({
+            'subreddit': (r['subreddit'] + ' ')[:-1],
+            'title': r['title'],
+            'author': (r['author'] + ' ')[:-1],
+            'score': r['score'],
+            'upvote_ratio': r['upvote_ratio'],
+            'num_comments': r['num_comments'],
+            'created_utc': r['created_utc'],
+            'url': r['url'],
+            'tickers': fresh(r['tickers']),
+            'sentiment': LABELS[r['sentiment']],
+            'polarity': r['polarity'],
+            'awards': r['awards'],
+        })
+
+    ticker_data = {}
+    for post in posts:
+        for ticker in post['tickers']:
+            if ticker not in ticker_data:
+                ticker_data[ticker] = {'mention_count': 0, 'total_score': 0, 'total_comments': 0,
+                                       'bullish_count': 0, 'bearish_count': 0, 'neutral_count': 0,
+                                       'posts': []}
+            data = ticker_data[ticker]
+            data['mention_count'] += 1
+            data['total_score'] += post['score']
+            data['total_comments'] += post['num_comments']
+            data[post['sentiment'] + '_count'] += 1
+            data['posts'].append({'title': post['title'], 'score': post['score'],
+                                  'sentiment': post['sentiment']})
+    return posts, ticker_data
+
+
+def build_records(raw: list):
+    """Slotted records interned by post ID; aggregates reference posts by index"""
+    store = PostStore()
+    for r in raw:
+        store.add(Post(
+            post_id=r['id'],
+            subreddit=(r['subreddit'] + ' ')[:-1],
+            title=r['title'],
+            author=(r['author'] + ' ')[:-1],
+            score=r['score'],
+            upvote_ratio=r['upvote_ratio'],
+            num_comments=r['num_comments'],
+            created_utc=r['created_utc'],
+            url=r['url'],
+            tickers=fresh(r['tickers']),
+            sentiment=r['sentiment'],
+            polarity=r['polarity'],
+            awards=r['awards'],
+        ))
+    return store, analyze_mentions(store)
+
+
+def measure(build, raw: list):
+    """(result, bytes still allocated after the build, peak bytes, seconds)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(raw)
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts', type=int, default=100_000, help='Synthetic posts')
+    parser.add_argument('--universe', type=int, default=3000, help='Distinct tickers')
+    args = parser.parse_args()
+
+    raw = make_raw_posts(args.posts, args.universe)
+    mentions = sum(len(r['tickers']) for r in raw)
+
+    (posts, ticker_data), dict_bytes, dict_peak, dict_seconds = measure(build_dicts, raw)
+    (store, aggregates), record_bytes, record_peak, record_seconds = measure(build_records, raw)
+
+    print("=" * 70)
+    print(f"POST RECORDS ({args.posts:,} posts, {mentions:,} mentions, {len(aggregates):,} tickers)")
+    print("=" * 70)
+    print(f"{'':22s} {'retained':>12s} {'peak':>12s} {'per post':>10s} {'build':>9s}")
+    for label, retained, peak, seconds in [('dicts + copies', dict_bytes, dict_peak, dict_seconds),
+                                           ('slotted records', record_bytes, record_peak, record_seconds)]:
+        print(f"{label:22s} {retained / 2 ** 20:9.1f} MB {peak / 2 ** 20:9.1f} MB "
+              f"{retained / args.posts:8.0f} B {seconds:8.2f}s")
+    print(f"\nMemory reduced {dict_bytes / record_bytes:.1f}x "
+          f"(titles and URLs are shared by both and excluded)")
+
+    # Same aggregates and top posts either way
+    mismatches = 0
+    for ticker, data in ticker_data.items():
+        aggregate = aggregates[ticker]
+        top = max(data['posts'], key=lambda post: post['score'])
+        if (data['mention_count'], data['total_score'], data['bullish_count'], data['bearish_count']) != \
+                (aggregate.mention_count, aggregate.total_score, aggregate.bullish_count,
+                 aggregate.bearish_count) or top['score'] != aggregate.top_post(store).score:
+            mismatches += 1
+
+    if mismatches or len(ticker_data) != len(aggregates) or len(posts) != len(store):
+        print(f"FAILED: {mismatches} tickers disagree between the two builds")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: sequential vs concurrent Reddit collection
+Runs the 10 subreddit x 100 post refresh both ways and reports wall-clock time
+Requires REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET in .env
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'testing' / 'reddit_poc'))
+
+from penguin.core.config import config
+from multi_subreddit_scraper import MultiSubredditScraper
+
+
+def main():
+    """Run both collection paths"""
+    print("=" * 70)
+    print("Reddit Collection Benchmark (10 subreddits x 100 posts)")
+    print("=" * 70)
+
+    if not config.validate():
+        sys.exit(1)
+
+    # Without the seen index, so the second run re-analyzes every post like the first
+    scraper = MultiSubredditScraper(use_seen_index=False)
+    timings = {}
+
+    for label, run in [('sequential', scraper.scrape_all_subreddits),
+                       ('concurrent', scraper.scrape_all_subreddits_async)]:
+        start = time.perf_counter()
+        posts = run(posts_per_sub=100)
+        timings[label] = (time.perf_counter() - start, len(posts))
+
+    print("=" * 70)
+    for label, (elapsed, count) in timings.items():
+        print(f"  {label:12s} {elapsed:8.1f}s   {count:5d} posts with mentions")
+
+    sequential = timings['sequential'][0]
+    concurrent = timings['concurrent'][0]
+    if concurrent:
+        print(f"  Speedup: {sequential / concurrent:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark: offline Reddit pipeline
+Replays Reddit fixtures (synthetic corpora of 10k/100k/1M posts, or a
+recorded capture) through MultiSubredditScraper's praw path, ticker
+extraction, sentiment, aggregate_stock_data and ranking, one process per
+corpus so peak RSS is per run; reports posts/sec per stage and a digest of
+the top-20 so runs are comparable across changes
+
+  python scripts/bench_reddit_pipeline.py                        # synthetic corpora
+  python scripts/bench_reddit_pipeline.py --fixture capture.jsonl.gz
+  python scripts/bench_reddit_pipeline.py --record capture.jsonl.gz  # live, needs .env credentials
+"""
+
+import argparse
+import hashlib
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'testing' / 'reddit_poc'))
+
+from penguin.core.config import config
+from penguin.social.records import PostStore
+from penguin.social.replay import FixtureWriter, RecordingReddit, ReplayReddit, SyntheticCorpus
+
+FIXTURE_DIR = Path(config.CACHE_DIR) / 'fixtures'
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def synthetic_fixture(posts: int, seed: int) -> Path:
+    """Generated once per (size, seed) and reused"""
+    path = FIXTURE_DIR / f"synthetic-{posts}-{seed}.jsonl.gz"
+    if not path.exists():
+        print(f"  generating {posts:,}-post corpus -> {path}")
+        start = time.perf_counter()
+        SyntheticCorpus(seed).write(path, posts)
+        print(f"  ({time.perf_counter() - start:.1f}s, {path.stat().st_size / 2 ** 20:.1f} MB)")
+    return path
+
+
+def run_pipeline(fixture: Path) -> dict:
+    """Replay -> extract/sentiment -> aggregate -> rank in this process"""
+    from multi_subreddit_scraper import MultiSubredditScraper
+
+    baseline_rss = peak_rss_mb()
+    scraper = MultiSubredditScraper(use_seen_index=False)
+    scraper.reddit = ReplayReddit(fixture)
+    subreddits = scraper.reddit.subreddits()
+
+    # Time build_posts (extraction + sentiment) apart from fixture decoding
+    analysis = {'seconds': 0.0, 'records': 0}
+    build_posts = scraper.build_posts
+
+    def timed_build_posts(subreddit, records):
+        start = time.perf_counter()
+        posts = build_posts(subreddit, records)
+        analysis['seconds'] += time.perf_counter() - start
+        analysis['records'] += len(records)
+        return posts
+
+    scraper.build_posts = timed_build_posts
+
+    start = time.perf_counter()
+    posts = PostStore()
+    for subreddit in subreddits:
+        posts.extend(scraper.scrape_subreddit(subreddit, limit=None))
+    collect_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top_stocks = scraper.aggregate_stock_data(posts)
+    aggregate_seconds = time.perf_counter() - start
+
+    # The bounded-memory ranking main() uses, against the exact top-20
+    start = time.perf_counter()
+    trending = scraper.rank_trending(posts, top_n=20)
+    trending_seconds = time.perf_counter() - start
+    exact_top = {row['ticker'] for row in top_stocks[:20]}
+    exact_rows = {row['ticker']: row for row in top_stocks}
+
+    top = [(row['ticker'], row['mentions'], round(row['momentum_score'], 6)) for row in top_stocks[:20]]
+    return {
+        'records': analysis['records'],
+        'posts': len(posts),
+        'tickers': len(top_stocks),
+        'collect_seconds': collect_seconds,
+        'analysis_seconds': analysis['seconds'],
+        'aggregate_seconds': aggregate_seconds,
+        'trending_seconds': trending_seconds,
+        'trending_recall': len({row['ticker'] for row in trending} & exact_top) / max(1, len(exact_top)),
+        'trending_guaranteed': sum(row['guaranteed'] for row in trending),
+        # Chosen rows are aggregated exactly, so they must equal the exact path's rows
+        'trending_exact_rows': all(row['momentum_score'] == exact_rows[row['ticker']]['momentum_score']
+                                   and row['mentions'] == exact_rows[row['ticker']]['mentions']
+                                   for row in trending),
+        'baseline_rss_mb': baseline_rss,
+        'peak_rss_mb': peak_rss_mb(),
+        'top': [ticker for ticker, _, _ in top[:5]],
+        'digest': hashlib.sha1(json.dumps(top).encode()).hexdigest()[:12],
+    }
+
+
+def run_child(fixture: Path) -> dict:
+    proc = subprocess.run([sys.executable, __file__, '--child', str(fixture)],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(proc.stdout + proc.stderr)
+        print(f"FAILED: pipeline run on {fixture} exited with {proc.returncode}")
+        sys.exit(1)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def record(path: Path, posts_per_sub: int):
+    """Run the live sequential scrape once, capturing every listing to `path`"""
+    from multi_subreddit_scraper import MultiSubredditScraper
+
+    if not config.validate():
+        sys.exit(1)
+    scraper = MultiSubredditScraper(use_seen_index=False)
+    with FixtureWriter(path) as writer:
+        scraper.reddit = RecordingReddit(scraper.reddit, writer)
+        scraper.scrape_all_subreddits(posts_per_sub=posts_per_sub)
+    print(f"✓ Recorded {writer.count} submissions to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='Synthetic corpus sizes (posts)')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic corpus seed')
+    parser.add_argument('--fixture', type=Path, help='Replay this fixture instead of synthetic corpora')
+    parser.add_argument('--record', type=Path, help='Capture live listings to this fixture and exit')
+    parser.add_argument('--posts-per-sub', type=int, default=100, help='Listing size when recording')
+    parser.add_argument('--child', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_pipeline(args.child)))
+        return
+    if args.record:
+        record(args.record, args.posts_per_sub)
+        return
+
+    print("=" * 70)
+    print("OFFLINE REDDIT PIPELINE (replay -> extract/sentiment -> aggregate -> rank)")
+    print("=" * 70)
+    fixtures = [args.fixture] if args.fixture else [synthetic_fixture(size, args.seed) for size in args.sizes]
+
+    results = []
+    for fixture in fixtures:
+        results.append((fixture, run_child(fixture)))
+
+    print(f"{'records':>9s} {'mentions':>9s} {'end-to-end':>12s} {'analysis':>12s} "
+          f"{'aggregate':>10s} {'peak RSS':>9s}  top-20 digest")
+    failed = False
+    for fixture, result in results:
+        total = result['collect_seconds'] + result['aggregate_seconds']
+        records = result['records']
+        print(f"{records:9,d} {result['posts']:9,d} {records / total:8,.0f}/s "
+              f"{records / result['analysis_seconds']:8,.0f}/s "
+              f"{result['aggregate_seconds'] * 1000:7.0f} ms "
+              f"{result['peak_rss_mb']:6.0f} MB  {result['digest']}")
+        failed |= not records or not result['posts']
+
+    print("-" * 70)
+    for fixture, result in results:
+        print(f"{fixture.name}: top {', '.join(result['top'])}; "
+              f"{result['tickers']:,} tickers, {result['baseline_rss_mb']:.0f} MB RSS before the run")
+        print(f"  rank_trending: {result['trending_seconds'] * 1000:.0f} ms, "
+              f"top-20 recall {result['trending_recall']:.2f} vs exact, "
+              f"{result['trending_guaranteed']}/20 guaranteed")
+        failed |= not result['trending_exact_rows']
+    print("\nend-to-end/analysis are submissions per second (analysis = build_posts only); "
+          "mentions = posts with tickers;\nrank_trending recall counts a tie at the top-20 cut "
+          "resolved the other way as a miss")
+
+    if failed:
+        print("FAILED: a fixture replayed no posts, or a rank_trending row differs from the exact one")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
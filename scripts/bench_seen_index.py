@@ -0,0 +1,166 @@
+"""
+Benchmark: seen-post index
+Replays scheduled refreshes of 10 hot listings that slide a few posts per
+run, with climbing scores and crossposts, through build_posts with and
+without the seen index; reports per-refresh work saved, analysis time and
+how many mentions re-reads would have double counted
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'testing' / 'reddit_poc'))
+
+from penguin.social.seen import RefreshStats, SeenIndex
+from penguin.social.sentiment import SentimentScorer
+from penguin.social.tickers import TickerExtractor
+from scripts.bench_post_records import SUBREDDITS
+from scripts.bench_ticker_extraction import make_corpus
+from multi_subreddit_scraper import MultiSubredditScraper
+
+START = 1.7e9
+
+
+class Listings:
+    """Hot listings that slide `churn` posts per refresh; scores keep climbing"""
+
+    def __init__(self, listing: int, churn: int, crosspost_rate: float, refreshes: int,
+                 body_words: int, seed: int = 42):
+        self.rng = random.Random(seed)
+        self.listing = listing
+        self.churn = churn
+        per_sub = listing + churn * refreshes
+        texts = make_corpus(per_sub * len(SUBREDDITS), seed)
+        # Self-text of roughly `body_words` words (link posts have none)
+        corpus = texts * max(1, body_words // 45)
+        self.rng.shuffle(corpus)
+
+        def body() -> str:
+            if self.rng.random() < 0.3:
+                return ''
+            start = self.rng.randrange(len(corpus))
+            return ' '.join(corpus[start:start + self.rng.randint(1, 2 * body_words // 45 + 1)])
+
+        self.posts = {
+            subreddit: [
+                {'id': f"{n:02d}{index:06x}", 'title': texts[n * per_sub + index][:80],
+                 'selftext': body(), 'score': self.rng.randint(1, 100),
+                 'num_comments': self.rng.randint(0, 30), 'created_utc': START + index * 60,
+                 'permalink': f"/r/{subreddit}/comments/{n:02d}{index:06x}", 'stickied': False}
+                for index in range(per_sub)
+            ]
+            for n, subreddit in enumerate(SUBREDDITS)
+        }
+        # Some posts in the smaller subreddits are crossposts of r/wallstreetbets posts
+        source = self.posts[SUBREDDITS[0]]
+        for subreddit in SUBREDDITS[1:]:
+            for index, post in enumerate(self.posts[subreddit]):
+                if self.rng.random() < crosspost_rate:
+                    parent = source[min(index, len(source) - 1)]
+                    post.update(title=parent['title'], selftext=parent['selftext'],
+                                crosspost_parent=f"t3_{parent['id']}")
+
+    def refresh(self, number: int) -> dict:
+        """subreddit -> page of raw records for refresh `number`"""
+        pages = {}
+        for subreddit, posts in self.posts.items():
+            page = posts[number * self.churn:number * self.churn + self.listing]
+            for post in page:
+                if self.rng.random() < 0.5:
+                    post['score'] += self.rng.randint(1, 50)
+                    post['num_comments'] += self.rng.randint(0, 5)
+            pages[subreddit] = [dict(post) for post in page]
+        return pages
+
+
+def make_scraper(seen_index=None) -> MultiSubredditScraper:
+    """build_posts without the Reddit client"""
+    scraper = MultiSubredditScraper.__new__(MultiSubredditScraper)
+    scraper.ticker_extractor = TickerExtractor()
+    scraper.sentiment_scorer = SentimentScorer()
+    scraper.seen_index = seen_index
+    scraper.refresh_stats = RefreshStats()
+    return scraper
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--refreshes', type=int, default=12, help='Scheduled runs to replay')
+    parser.add_argument('--listing', type=int, default=100, help='Posts per hot listing')
+    parser.add_argument('--churn', type=int, default=10, help='New posts per listing per refresh')
+    parser.add_argument('--crossposts', type=float, default=0.05, help='Crosspost share outside r/wsb')
+    parser.add_argument('--body-words', type=int, default=250, help='Typical self-text length')
+    args = parser.parse_args()
+
+    listings = Listings(args.listing, args.churn, args.crossposts, args.refreshes, args.body_words)
+    baseline = make_scraper()
+
+    print("=" * 70)
+    print(f"SEEN INDEX ({args.refreshes} refreshes x {len(SUBREDDITS)} listings of {args.listing}, "
+          f"{args.churn} new per listing per run)")
+    print("=" * 70)
+    print(f"{'run':>4s} {'posts':>6s} {'new':>5s} {'changed':>8s} {'skipped':>8s} {'saved':>6s} "
+          f"{'full ms':>8s} {'index ms':>9s} {'mentions full/index':>20s}")
+
+    mismatches = 0
+    full_total = index_total = 0.0
+    full_mentions = index_mentions = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = Path(tmp) / 'seen_posts.sqlite'
+        indexed = make_scraper(SeenIndex(index_path, capacity=10_000))
+
+        for number in range(args.refreshes):
+            pages = listings.refresh(number)
+
+            start = time.perf_counter()
+            full = [post for subreddit, page in pages.items() for post in baseline.build_posts(subreddit, page)]
+            full_seconds = time.perf_counter() - start
+
+            # Each run is a fresh process: reopen the index from disk
+            indexed.seen_index = SeenIndex(index_path, capacity=10_000)
+            indexed.refresh_stats = RefreshStats()
+            start = time.perf_counter()
+            incremental = [post for subreddit, page in pages.items()
+                           for post in indexed.build_posts(subreddit, page)]
+            indexed.seen_index.close()
+            index_seconds = time.perf_counter() - start
+
+            # Reused analysis must match a fresh one, and nothing is analyzed twice
+            fresh_tickers = {post.post_id: post.tickers for post in full}
+            mismatches += sum(fresh_tickers.get(post.post_id) != post.tickers for post in incremental)
+            stats = indexed.refresh_stats
+
+            full_total += full_seconds
+            index_total += index_seconds
+            full_mentions += sum(len(post.tickers) for post in full)
+            index_mentions += sum(len(post.tickers) for post in incremental)
+            print(f"{number + 1:4d} {stats.records:6d} {stats.new:5d} {stats.changed:8d} "
+                  f"{stats.unchanged + stats.duplicates:8d} {stats.saved:6.0%} "
+                  f"{full_seconds * 1000:8.1f} {index_seconds * 1000:9.1f} "
+                  f"{sum(len(p.tickers) for p in full):9d}/{sum(len(p.tickers) for p in incremental):<9d}")
+
+        check = SeenIndex(index_path)
+        unique = len(check)
+        check.close()
+
+    print("-" * 70)
+    print(f"Analysis time: {full_total * 1000:.0f} ms re-analyzing everything vs "
+          f"{index_total * 1000:.0f} ms with the index ({full_total / index_total:.1f}x)")
+    print(f"Mentions handed to aggregation: {full_mentions:,} vs {index_mentions:,} "
+          f"(unchanged re-reads and crossposts dropped); {unique:,} distinct posts analyzed once")
+    print(f"Reused analyses that differ from a fresh one: {mismatches}")
+
+    if mismatches:
+        print("FAILED: stored analysis disagrees with re-analysis")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
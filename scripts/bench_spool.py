@@ -0,0 +1,93 @@
+"""
+Benchmark: write-ahead spool
+Compares how long a collector waits per batch when writing straight to the
+database versus appending to the spool, with simulated database latency, then
+drains the spool and checks every point landed exactly once
+Runs against a throwaway SQLite file and spool directory
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.bench_ingestion import count_rows, make_data_points
+from penguin.data.storage.bulk import BulkWriter
+from penguin.data.storage.models import Base
+from penguin.data.storage.spool import Spool, SpoolFlusher
+
+
+def make_engine(path: Path, latency: float):
+    """SQLite engine whose commits sleep `latency` seconds (a remote database stand-in)"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+
+    @event.listens_for(engine, 'commit')
+    def slow_commit(conn):
+        time.sleep(latency)
+
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batches', type=int, default=200, help='Collector batches')
+    parser.add_argument('--batch-size', type=int, default=100, help='Points per batch')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to each commit')
+    args = parser.parse_args()
+
+    points = make_data_points(args.batches * args.batch_size, duplicate_rate=0)
+    batches = [points[i:i + args.batch_size] for i in range(0, len(points), args.batch_size)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        direct = BulkWriter(make_engine(tmp / 'direct.db', args.latency))
+        start = time.perf_counter()
+        for batch in batches:
+            direct.write(batch)
+        direct_seconds = time.perf_counter() - start
+
+        spooled_engine = make_engine(tmp / 'spooled.db', args.latency)
+        spool = Spool(tmp / 'spool')
+        start = time.perf_counter()
+        for batch in batches:
+            spool.append(batch)
+        append_seconds = time.perf_counter() - start
+
+        flusher = SpoolFlusher(spool, BulkWriter(spooled_engine))
+        start = time.perf_counter()
+        result = flusher.flush()
+        flush_seconds = time.perf_counter() - start
+        again = flusher.flush()
+
+        rows = count_rows(spooled_engine)
+
+    total = len(points)
+    print("=" * 70)
+    print(f"SPOOL BENCHMARK ({args.batches} batches x {args.batch_size} points, "
+          f"{args.latency * 1000:.0f} ms commit latency)")
+    print("=" * 70)
+    print(f"Direct bulk writes:  {direct_seconds:7.2f}s  "
+          f"{direct_seconds / args.batches * 1000:7.2f} ms/batch  {total / direct_seconds:10,.0f} points/s")
+    print(f"Spool appends:       {append_seconds:7.2f}s  "
+          f"{append_seconds / args.batches * 1000:7.2f} ms/batch  {total / append_seconds:10,.0f} points/s")
+    print(f"Spool flush:         {flush_seconds:7.2f}s  {result.batches} batches in "
+          f"{-(-total // flusher.batch_rows)} transactions")
+    print(f"\nCollector wait reduced {direct_seconds / append_seconds:.1f}x")
+    print(f"Rows in database: {rows} (expected {total}); "
+          f"second flush ingested {again.batches} batches")
+
+    if rows != total or again.batches:
+        print("FAILED: spool did not deliver every point exactly once")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
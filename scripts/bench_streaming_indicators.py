@@ -0,0 +1,94 @@
+"""
+Benchmark: streaming indicators
+Checks that incremental state (including a save/load round-trip) agrees with
+the batch engine, and compares per-tick update cost with a full recompute
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.indicators.engine import IndicatorEngine
+from penguin.indicators.streaming import SymbolIndicators, load_state, save_state
+from scripts.bench_indicator_engine import make_prices
+
+
+def check_agreement(n_symbols: int = 50, n_days: int = 252, restart_at: int = 150) -> int:
+    """Stream every bar, restarting from disk midway; returns mismatch count"""
+    prices = make_prices(n_symbols, n_days)
+    batch = IndicatorEngine().compute(prices, latest_only=True)
+
+    states = {symbol: SymbolIndicators() for symbol in prices.symbols}
+    for col, symbol in enumerate(prices.symbols):
+        states[symbol].warm(prices.close[:restart_at, col])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'indicator_state.json'
+        save_state(path, states)
+        states = load_state(path)
+
+    mismatches = 0
+    for col, symbol in enumerate(prices.symbols):
+        values = states[symbol].warm(prices.close[restart_at:, col])
+        for name, value in values.items():
+            if not np.isclose(value, batch[name][col], rtol=1e-9, atol=1e-9):
+                print(f"  ✗ {name} differs for {symbol}: {value} vs {batch[name][col]}")
+                mismatches += 1
+
+    print(f"  Indicators checked: {len(values)} x {n_symbols} symbols, mismatches: {mismatches}")
+    return mismatches
+
+
+def bench_ticks(n_symbols: int = 500, n_days: int = 63, ticks: int = 20):
+    """Per-tick cost: incremental update vs recomputing the 3-month window"""
+    prices = make_prices(n_symbols, n_days + ticks)
+    engine = IndicatorEngine()
+
+    states = [SymbolIndicators() for _ in prices.symbols]
+    for col, state in enumerate(states):
+        state.warm(prices.close[:n_days, col])
+
+    start = time.perf_counter()
+    for t in range(n_days, n_days + ticks):
+        for col, state in enumerate(states):
+            state.update(float(prices.close[t, col]))
+    incremental = (time.perf_counter() - start) / ticks
+
+    start = time.perf_counter()
+    for t in range(n_days, n_days + ticks):
+        window = prices._replace(**{
+            field: getattr(prices, field)[t - n_days + 1:t + 1]
+            for field in ('open', 'high', 'low', 'close', 'volume')
+        })
+        engine.compute(window, latest_only=True)
+    recompute = (time.perf_counter() - start) / ticks
+
+    print(f"  {n_symbols} symbols, {n_days}-bar window:")
+    print(f"    incremental update   {incremental * 1000:8.2f} ms/tick "
+          f"({incremental / n_symbols * 1e6:6.2f} µs/symbol)")
+    print(f"    batch recompute      {recompute * 1000:8.2f} ms/tick")
+
+
+def main():
+    """Run the agreement check and benchmark"""
+    print("=" * 70)
+    print("Streaming Indicator Benchmark")
+    print("=" * 70)
+
+    print("\nAgreement with batch engine (save/load at bar 150):")
+    mismatches = check_agreement()
+
+    print("\nPer-tick cost:")
+    bench_ticks()
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Microbenchmark: ticker extraction
+Compares the legacy regex + set filter path against TickerExtractor, with no
+universe (the scrapers' path), a 10-symbol universe and a listing-sized one
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.core.constants import EXCLUDED_WORDS
+from penguin.social.tickers import TickerExtractor
+
+
+SYMBOLS = ['GME', 'AMC', 'TSLA', 'NVDA', 'AAPL', 'PLTR', 'SOFI', 'AMD', 'MSFT', 'BB']
+FILLER = (
+    "the market is going to the moon today and I think we all know what happens "
+    "next when the shorts have to cover their positions before earnings"
+).split()
+
+
+def make_corpus(size: int, seed: int = 42) -> list:
+    """Generate WSB-style texts with tickers, cashtags and false positives"""
+    rng = random.Random(seed)
+    noise = sorted(EXCLUDED_WORDS)
+    texts = []
+
+    for _ in range(size):
+        words = rng.choices(FILLER, k=rng.randint(10, 80))
+        for _ in range(rng.randint(0, 6)):
+            pick = rng.random()
+            if pick < 0.5:
+                token = rng.choice(SYMBOLS)
+            elif pick < 0.7:
+                token = '$' + rng.choice(SYMBOLS)
+            else:
+                token = rng.choice(noise)
+            words.insert(rng.randrange(len(words) + 1), token)
+        texts.append(' '.join(words))
+
+    return texts
+
+
+def legacy_extract(pattern, excluded, text: str) -> list:
+    """The per-call regex + set filter used by the PoC scrapers"""
+    if not text:
+        return []
+    return [ticker for ticker in pattern.findall(text) if ticker not in excluded]
+
+
+def bench(label: str, func, texts: list, repeat: int = 3) -> float:
+    """Best-of-N wall time for one pass over the corpus"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(texts)
+        best = min(best, time.perf_counter() - start)
+
+    rate = len(texts) / best if best else float('inf')
+    print(f"  {label:32s} {best * 1000:9.1f} ms   {rate:12,.0f} texts/sec")
+    return best
+
+
+def main():
+    """Run the benchmark"""
+    print("=" * 70)
+    print("Ticker Extraction Microbenchmark")
+    print("=" * 70)
+
+    pattern = re.compile(r'\b[A-Z]{1,5}\b')
+    excluded = set(EXCLUDED_WORDS)
+    extractor = TickerExtractor()
+    universe_extractor = TickerExtractor(universe=SYMBOLS)
+    # About the size of the NASDAQ Trader listings SymbolUniverse loads
+    rng = random.Random(7)
+    listing = set(SYMBOLS) | {''.join(rng.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=rng.randint(1, 5)))
+                              for _ in range(11_000)}
+    listing_extractor = TickerExtractor(universe=listing)
+
+    for size in (10_000, 100_000):
+        texts = make_corpus(size)
+        print(f"\n{size:,} texts:")
+
+        legacy = bench("regex + set filter",
+                       lambda batch: [legacy_extract(pattern, excluded, t) for t in batch], texts)
+        compiled = bench("TickerExtractor.extract_batch", extractor.extract_batch, texts)
+        bench("TickerExtractor (10 symbols)", universe_extractor.extract_batch, texts)
+        bench(f"TickerExtractor ({len(listing):,} symbols)", listing_extractor.extract_batch, texts)
+        # Swings between ~0.95x and ~1.3x run to run; the automaton buys cashtags
+        # and offsets rather than a dependable CPU win, and a listing-sized
+        # universe is no faster than the default path
+        print(f"  Legacy / TickerExtractor: {legacy / compiled:.2f}x")
+
+        # Bare tickers must agree; the new path additionally picks up excluded cashtags
+        mismatches = sum(
+            1 for text in texts
+            if legacy_extract(pattern, excluded, text.replace('$', ''))
+            != extractor.extract(text.replace('$', ''))
+        )
+        print(f"  Parity mismatches (cashtags stripped): {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: bounded-memory trending tickers
+Replays a mention corpus with a Zipf-distributed ticker set plus a long tail
+of one-off false-positive tokens, and compares the Space-Saving tracker at
+several capacities with exact counting: top-20 recall, guaranteed rows,
+observed mention error against the bound, memory and time
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from penguin.social.records import Post
+from penguin.social.trending import TrendingTracker
+from scripts.bench_post_records import SUBREDDITS
+
+
+def make_corpus(posts: int, universe: int, noise: float, seed: int = 42) -> list:
+    """Posts whose tickers are Zipf-popular symbols or, with probability `noise`, a one-off token"""
+    rng = random.Random(seed)
+    symbols = [f"T{index:04d}" for index in range(universe)]
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(universe)]
+    # Popular tickers skew bullish, so momentum and mention rankings differ
+    bullish_bias = {symbol: rng.random() for symbol in symbols}
+
+    corpus = []
+    for index in range(posts):
+        tickers = []
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < noise:
+                tickers.append(f"X{rng.getrandbits(40):x}")
+            else:
+                tickers.append(rng.choices(symbols, weights)[0])
+        lead = tickers[0]
+        sentiment = 1 if rng.random() < bullish_bias.get(lead, 0.3) else rng.choice((0, 2))
+        corpus.append(Post(f"p{index}", rng.choice(SUBREDDITS), '', score=rng.randint(0, 100),
+                           tickers=tickers, sentiment=sentiment))
+    return corpus
+
+
+def run(corpus: list, capacity: int):
+    """(tracker, seconds, traced bytes)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    tracker = TrendingTracker(capacity)
+    tracker.add_posts(corpus)
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tracker, seconds, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--posts', type=int, default=200_000, help='Posts in the corpus')
+    parser.add_argument('--universe', type=int, default=3000, help='Real tickers')
+    parser.add_argument('--noise', type=float, default=0.3, help='Share of mentions that are one-off tokens')
+    parser.add_argument('--k', type=int, default=20, help='Top-K to compare')
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.posts, args.universe, args.noise)
+    distinct = len({ticker for post in corpus for ticker in post.tickers})
+
+    exact, exact_seconds, exact_bytes = run(corpus, distinct)
+    exact_top = {key: [row['ticker'] for row in exact.top(args.k, key)]
+                 for key in ('mentions', 'momentum_score')}
+    true_counts = {ticker: entry.count for ticker, entry in exact.entries.items()}
+
+    print("=" * 70)
+    print(f"TRENDING TOP-{args.k} ({args.posts:,} posts, {exact.total:,} mentions, "
+          f"{distinct:,} distinct tokens)")
+    print("=" * 70)
+    print(f"{'capacity':>9s} {'memory':>9s} {'time':>7s} {'recall@k':>17s} "
+          f"{'guaranteed':>11s} {'max err':>8s} {'bound':>8s}")
+    print(f"{'exact':>9s} {exact_bytes / 2 ** 20:6.1f} MB {exact_seconds:6.2f}s "
+          f"{'1.00 / 1.00':>17s} {'':>11s} {0:8d} {0:8.0f}")
+
+    failed = False
+    for capacity in (100, 250, 500, 1000):
+        tracker, seconds, traced = run(corpus, capacity)
+        recalls, guaranteed = [], 0
+        for key in ('mentions', 'momentum_score'):
+            top = tracker.top(args.k, key)
+            recalls.append(len({row['ticker'] for row in top} & set(exact_top[key])) / args.k)
+            if key == 'momentum_score':
+                guaranteed = sum(row['guaranteed'] for row in top)
+                # A guaranteed row must really be in the exact top-K
+                failed |= any(row['guaranteed'] and row['ticker'] not in exact_top[key] for row in top)
+
+        errors = [entry.count - true_counts[ticker] for ticker, entry in tracker.entries.items()]
+        max_error = max(errors)
+        # Space-Saving never undercounts and never overcounts by more than its bound
+        failed |= min(errors) < 0 or max_error > tracker.error_bound
+        failed |= any(entry.count - entry.error > true_counts[t] for t, entry in tracker.entries.items())
+
+        print(f"{capacity:9d} {traced / 2 ** 20:6.1f} MB {seconds:6.2f}s "
+              f"{recalls[0]:8.2f} / {recalls[1]:4.2f} {guaranteed:7d}/{args.k:<3d} "
+              f"{max_error:8d} {tracker.error_bound:8.0f}")
+
+    print("\nrecall@k is for mentions / momentum; bound = mentions / capacity")
+    if failed:
+        print("FAILED: a Space-Saving guarantee was violated")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,18 +3,33 @@ Multi-Subreddit Stock Scraper
 Aggregates stock mentions across top investment subreddits
 """
 
+import asyncio
 import praw
-import re
+import sys
 import time
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, List, Optional, Sequence
 from collections import defaultdict
+import numpy as np
 from dotenv import load_dotenv
 import os
 
 # Load environment variables
 load_dotenv()
 
+# Make the penguin package importable when run from this directory
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from penguin.core.config import config
+from penguin.social.comments import CommentHarvester
+from penguin.social.reddit_async import AsyncRedditCollector
+from penguin.social.records import Post, PostStore
+from penguin.social.rolling import DEFAULT_HORIZONS, MentionWindow
+from penguin.social.seen import RefreshStats, SeenIndex, post_key
+from penguin.social.sentiment import SentimentScorer, BULLISH, BEARISH, NEUTRAL
+from penguin.social.tickers import TickerExtractor
+from penguin.social.trending import TrendingTracker
+
 REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', 'your_client_id_here')
 REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET', 'your_client_secret_here')
 REDDIT_USER_AGENT = 'PENGUIN Stock Tracker v0.2 - Multi-Subreddit'
@@ -23,8 +38,11 @@ REDDIT_USER_AGENT = 'PENGUIN Stock Tracker v0.2 - Multi-Subreddit'
 class MultiSubredditScraper:
     """Scrape multiple investment subreddits for stock mentions"""
 
-    def __init__(self):
-        """Initialize Reddit API connection"""
+    def __init__(self, use_seen_index: bool = True):
+        """
+        Initialize Reddit API connection
+        use_seen_index: skip posts analyzed by earlier runs (persisted in CACHE_DIR)
+        """
         self.reddit = praw.Reddit(
             client_id=REDDIT_CLIENT_ID,
             client_secret=REDDIT_CLIENT_SECRET,
@@ -45,9 +63,6 @@ class MultiSubredditScraper:
             'StockMarket'
         ]
 
-        # Common stock ticker pattern (1-5 capital letters)
-        self.ticker_pattern = re.compile(r'\b[A-Z]{1,5}\b')
-
         # Words to exclude (common false positives)
         self.exclude_words = {
             # Single letters
@@ -86,86 +101,136 @@ class MultiSubredditScraper:
             'UP'
         }
 
-    def extract_tickers(self, text: str) -> List[str]:
-        """Extract potential stock tickers from text"""
-        if not text:
-            return []
+        # Single-pass extractor compiled from the excluded words above
+        self.ticker_extractor = TickerExtractor(excluded=self.exclude_words)
 
-        potential_tickers = self.ticker_pattern.findall(text)
-        tickers = [
-            ticker for ticker in potential_tickers
-            if ticker not in self.exclude_words
-        ]
-        return tickers
+        # Bullish/bearish lexicons compiled once for batch scoring
+        self.sentiment_scorer = SentimentScorer()
 
-    def analyze_sentiment(self, text: str) -> str:
-        """Basic sentiment analysis (bullish/bearish/neutral)"""
-        if not text:
-            return 'neutral'
+        # Posts already analyzed, across runs and crossposts
+        self.seen_index = SeenIndex() if use_seen_index else None
+        self.refresh_stats = RefreshStats()
 
-        text_lower = text.lower()
+        # (num_comments, subreddit, fullname) of every thread listed this run,
+        # stickied daily discussions included, for comment harvesting
+        self.threads: List = []
 
-        bullish_words = [
-            'moon', 'rocket', 'buy', 'calls', 'bullish', 'pump',
-            'rally', 'squeeze', 'tendies', 'gains', 'up', 'long',
-            'green', 'breakout', 'support', 'diamond hands', 'hodl',
-            'to the moon', 'undervalued', 'great buy'
-        ]
+        # Space-Saving tracker behind rank_trending (None until it has run)
+        self.trending: Optional[TrendingTracker] = None
 
-        bearish_words = [
-            'crash', 'dump', 'puts', 'bearish', 'short', 'down',
-            'red', 'sell', 'drop', 'fall', 'tank', 'rekt',
-            'rug pull', 'bag holder', 'dead cat', 'overvalued'
-        ]
+    def extract_tickers(self, text: str) -> List[str]:
+        """Extract potential stock tickers from text"""
+        return self.ticker_extractor.extract(text)
 
-        bullish_count = sum(1 for word in bullish_words if word in text_lower)
-        bearish_count = sum(1 for word in bearish_words if word in text_lower)
+    def analyze_sentiment(self, text: str) -> str:
+        """Basic sentiment analysis (bullish/bearish/neutral)"""
+        return self.sentiment_scorer.label(text)
+
+    def build_posts(self, subreddit_name: str, records: List[Dict]) -> List[Post]:
+        """
+        Turn raw post records (Reddit JSON fields) into analyzed posts with stock mentions
+        With the seen index, only unseen posts are analyzed; known posts whose
+        score or comments moved come back with their stored analysis
+        """
+        # Skip stickied posts
+        records = [r for r in records if not r.get('stickied')]
+        if self.seen_index is None:
+            return [post for post in self.analyze_records(subreddit_name, records) if post.tickers]
+
+        plan = self.seen_index.plan(records)
+        self.refresh_stats.merge(plan.stats)
+
+        fresh = self.analyze_records(subreddit_name, plan.new)
+        self.seen_index.remember(fresh)
+
+        changed = [Post(
+            post_id=post_key(record),
+            subreddit=stored.subreddit,
+            title=record['title'],
+            score=record['score'],
+            num_comments=record['num_comments'],
+            created_utc=stored.created_utc,
+            tickers=stored.tickers,
+            sentiment=stored.sentiment,
+            polarity=stored.polarity,
+            url=f"https://reddit.com{record['permalink']}"
+        ) for record, stored in plan.changed]
+        self.seen_index.update_counts(changed)
+
+        return [post for post in fresh + changed if post.tickers]
+
+    def analyze_records(self, subreddit_name: str, records: List[Dict]) -> List[Post]:
+        """Extract tickers and score sentiment for every record (posts without tickers stay neutral)"""
+        post_texts = [f"{r['title']} {r.get('selftext', '')}" for r in records]
+        ticker_lists = self.ticker_extractor.extract_batch(post_texts)
+
+        # Only score posts with stock mentions, all in one batch
+        hits = [i for i, tickers in enumerate(ticker_lists) if tickers]
+        scores = self.sentiment_scorer.score([post_texts[i] for i in hits])
+        labels = scores.label.tolist()
+        polarities = scores.polarity.tolist()
+
+        sentiment = dict(zip(hits, zip(labels, polarities)))
 
-        if bullish_count > bearish_count:
-            return 'bullish'
-        elif bearish_count > bullish_count:
-            return 'bearish'
-        else:
-            return 'neutral'
+        posts = []
+        for i, record in enumerate(records):
+            label, polarity = sentiment.get(i, (NEUTRAL, 0.0))
+            posts.append(Post(
+                post_id=post_key(record),
+                subreddit=subreddit_name,
+                title=record['title'],
+                score=record['score'],
+                num_comments=record['num_comments'],
+                created_utc=record['created_utc'],
+                tickers=ticker_lists[i],
+                sentiment=label,
+                polarity=polarity,
+                url=f"https://reddit.com{record['permalink']}"
+            ))
 
-    def scrape_subreddit(self, subreddit_name: str, limit: int = 100) -> List[Dict]:
+        return posts
+
+    def scrape_subreddit(self, subreddit_name: str, limit: int = 100) -> List[Post]:
         """Scrape posts from a single subreddit"""
         posts = []
 
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
 
-            for submission in subreddit.hot(limit=limit):
-                # Skip stickied posts
-                if submission.stickied:
-                    continue
-
-                post_text = f"{submission.title} {submission.selftext}"
-                tickers = self.extract_tickers(post_text)
-
-                if tickers:  # Only store posts with stock mentions
-                    posts.append({
-                        'subreddit': subreddit_name,
-                        'title': submission.title,
-                        'score': submission.score,
-                        'num_comments': submission.num_comments,
-                        'created_utc': submission.created_utc,
-                        'tickers': tickers,
-                        'sentiment': self.analyze_sentiment(post_text),
-                        'url': f"https://reddit.com{submission.permalink}"
-                    })
+            records = [{
+                'id': submission.id,
+                'name': submission.name,
+                'crosspost_parent': getattr(submission, 'crosspost_parent', None),
+                'title': submission.title,
+                'selftext': submission.selftext,
+                'score': submission.score,
+                'num_comments': submission.num_comments,
+                'created_utc': submission.created_utc,
+                'permalink': submission.permalink,
+                'stickied': submission.stickied
+            } for submission in subreddit.hot(limit=limit)]
+
+            self.remember_threads(subreddit_name, records)
+            posts = self.build_posts(subreddit_name, records)
 
         except Exception as e:
             print(f"  ⚠️  Error scraping r/{subreddit_name}: {e}")
 
         return posts
 
-    def scrape_all_subreddits(self, posts_per_sub: int = 100) -> Dict:
-        """Scrape all configured subreddits"""
+    def scrape_all_subreddits(self, posts_per_sub: int = 100) -> PostStore:
+        """
+        Scrape all configured subreddits
+        Posts are keyed by post_key, so a crosspost shares its parent's entry:
+        with the seen index the later copy is skipped, without it the last
+        copy analyzed replaces the earlier one (its subreddit and score)
+        """
         print(f"🔍 Scraping {len(self.subreddits)} subreddits ({posts_per_sub} posts each)...")
         print("=" * 70)
 
-        all_posts = []
+        all_posts = PostStore()
+        self.start_refresh()
+        start = time.perf_counter()
 
         for idx, subreddit in enumerate(self.subreddits, 1):
             print(f"[{idx}/{len(self.subreddits)}] Scraping r/{subreddit}...", end=" ")
@@ -180,76 +245,151 @@ class MultiSubredditScraper:
                 time.sleep(3)  # 3 second delay between subreddits (safe for API limits)
 
         print()
-        print(f"✓ Total posts collected: {len(all_posts)}")
+        print(f"✓ Total posts collected: {len(all_posts)} in {time.perf_counter() - start:.1f}s (sequential)")
+        self.finish_refresh()
         print("=" * 70)
         print()
 
         return all_posts
 
-    def aggregate_stock_data(self, posts: List[Dict]) -> List[Dict]:
-        """Aggregate all mentions of each stock across subreddits"""
-        stock_data = defaultdict(lambda: {
-            'mentions': 0,
-            'total_score': 0,
-            'total_comments': 0,
-            'bullish_count': 0,
-            'bearish_count': 0,
-            'neutral_count': 0,
-            'subreddits': set(),
-            'top_post': None,
-            'top_post_score': 0
-        })
-
-        # Aggregate data
-        for post in posts:
-            for ticker in post['tickers']:
-                data = stock_data[ticker]
-                data['mentions'] += 1
-                data['total_score'] += post['score']
-                data['total_comments'] += post['num_comments']
-                data['subreddits'].add(post['subreddit'])
-
-                # Track sentiment
-                if post['sentiment'] == 'bullish':
-                    data['bullish_count'] += 1
-                elif post['sentiment'] == 'bearish':
-                    data['bearish_count'] += 1
-                else:
-                    data['neutral_count'] += 1
-
-                # Track top post
-                if post['score'] > data['top_post_score']:
-                    data['top_post_score'] = post['score']
-                    data['top_post'] = {
-                        'title': post['title'],
-                        'score': post['score'],
-                        'subreddit': post['subreddit'],
-                        'url': post['url']
-                    }
-
-        # Calculate derived metrics
-        results = []
-        for ticker, data in stock_data.items():
-            total_sentiment = data['bullish_count'] + data['bearish_count'] + data['neutral_count']
+    def scrape_all_subreddits_async(self, posts_per_sub: int = 100) -> PostStore:
+        """Scrape all configured subreddits concurrently, analyzing pages as they arrive"""
+        print(f"🔍 Scraping {len(self.subreddits)} subreddits concurrently ({posts_per_sub} posts each)...")
+        print("=" * 70)
+
+        collector = AsyncRedditCollector(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT)
+
+        async def run() -> PostStore:
+            collected = PostStore()
+            async for subreddit, page in collector.stream_posts(self.subreddits, limit=posts_per_sub):
+                self.remember_threads(subreddit, page)
+                posts = self.build_posts(subreddit, page)
+                collected.extend(posts)
+                print(f"  r/{subreddit}: +{len(posts)} posts with stock mentions")
+            return collected
 
-            bullish_pct = (data['bullish_count'] / total_sentiment * 100) if total_sentiment > 0 else 0
-            bearish_pct = (data['bearish_count'] / total_sentiment * 100) if total_sentiment > 0 else 0
+        self.start_refresh()
+        start = time.perf_counter()
+        all_posts = asyncio.run(run())
 
-            # Momentum score: mentions × bullish% × subreddit diversity
-            subreddit_multiplier = len(data['subreddits'])
-            momentum_score = data['mentions'] * (bullish_pct / 100) * subreddit_multiplier
+        print()
+        print(f"✓ Total posts collected: {len(all_posts)} in {time.perf_counter() - start:.1f}s (concurrent)")
+        self.finish_refresh()
+        print("=" * 70)
+        print()
 
+        return all_posts
+
+    def remember_threads(self, subreddit_name: str, records: List[Dict]):
+        self.threads.extend((r['num_comments'], subreddit_name, r.get('name') or f"t3_{r['id']}")
+                            for r in records)
+
+    def harvest_comments(self, top_threads: int = config.REDDIT_COMMENT_THREADS) -> List[Post]:
+        """
+        Expand the comment forests of the busiest threads listed this run and
+        analyze the comments newer than last run's like posts (seen index included)
+        """
+        busiest = sorted(set(self.threads), reverse=True)[:top_threads]
+        if not busiest:
+            return []
+
+        print(f"💬 Harvesting comments from the {len(busiest)} busiest threads...")
+        harvester = CommentHarvester(
+            AsyncRedditCollector(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT)
+        )
+        grouped, stats = harvester.harvest([(subreddit, link_id) for _, subreddit, link_id in busiest])
+
+        comments = []
+        for subreddit, records in grouped.items():
+            comments.extend(self.build_posts(subreddit, records))
+        if self.seen_index is not None:
+            self.seen_index.save()
+
+        print(f"✓ {stats}")
+        print(f"✓ {len(comments)} comments with stock mentions")
+        print("=" * 70)
+        print()
+        return comments
+
+    def start_refresh(self):
+        """Reset per-refresh counters and forget posts that have aged out of the listings"""
+        self.refresh_stats = RefreshStats()
+        self.threads = []
+        if self.seen_index is not None:
+            self.seen_index.prune()
+
+    def finish_refresh(self):
+        """Persist the seen index and report how much analysis it saved"""
+        if self.seen_index is not None:
+            self.seen_index.save()
+            print(f"✓ Seen index: {self.refresh_stats}")
+
+    def aggregate_stock_data(self, posts: Sequence[Post]) -> List[Dict]:
+        """Aggregate all mentions of each stock across subreddits"""
+        if not posts:
+            return []
+
+        # Flatten posts into one row per (ticker, post) mention
+        ticker_ids = {}
+        mention_ticker = np.array([
+            ticker_ids.setdefault(ticker, len(ticker_ids))
+            for post in posts for ticker in post.tickers
+        ], dtype=np.int64)
+        mention_post = np.repeat(
+            np.arange(len(posts)), [len(post.tickers) for post in posts]
+        )
+        n_tickers = len(ticker_ids)
+
+        # Per-post columns, gathered onto mentions
+        post_score = np.array([post.score for post in posts], dtype=np.int64)
+        post_comments = np.array([post.num_comments for post in posts], dtype=np.int64)
+        post_polarity = np.array([post.polarity for post in posts], dtype=np.float64)
+        post_label = np.array([post.sentiment for post in posts], dtype=np.int8)[mention_post]
+
+        # Per-ticker counters in one reduction each
+        mentions = np.bincount(mention_ticker, minlength=n_tickers)
+        total_score = np.bincount(mention_ticker, weights=post_score[mention_post], minlength=n_tickers)
+        total_comments = np.bincount(mention_ticker, weights=post_comments[mention_post], minlength=n_tickers)
+        polarity_sum = np.bincount(mention_ticker, weights=post_polarity[mention_post], minlength=n_tickers)
+        bullish_count = np.bincount(mention_ticker[post_label == BULLISH], minlength=n_tickers)
+        bearish_count = np.bincount(mention_ticker[post_label == BEARISH], minlength=n_tickers)
+
+        # Every mention carries a sentiment, so the total is the mention count
+        bullish_pct = bullish_count / mentions * 100
+        bearish_pct = bearish_count / mentions * 100
+
+        # Subreddit sets are not numeric, so they stay per mention; top posts
+        # are tracked by index and only materialized for the results
+        subreddits = [set() for _ in range(n_tickers)]
+        top_post = [-1] * n_tickers
+        top_post_score = [0] * n_tickers
+        for ticker_id, post_idx in zip(mention_ticker.tolist(), mention_post.tolist()):
+            post = posts[post_idx]
+            subreddits[ticker_id].add(post.subreddit)
+
+            # Track top post
+            if post.score > top_post_score[ticker_id]:
+                top_post_score[ticker_id] = post.score
+                top_post[ticker_id] = post_idx
+
+        # Momentum score: mentions × bullish% × subreddit diversity
+        subreddit_count = np.array([len(s) for s in subreddits], dtype=np.int64)
+        momentum_score = mentions * (bullish_pct / 100) * subreddit_count
+
+        results = []
+        for ticker, ticker_id in ticker_ids.items():
             results.append({
                 'ticker': ticker,
-                'mentions': data['mentions'],
-                'avg_score': data['total_score'] / data['mentions'],
-                'total_comments': data['total_comments'],
-                'bullish_pct': bullish_pct,
-                'bearish_pct': bearish_pct,
-                'subreddit_count': len(data['subreddits']),
-                'subreddits': list(data['subreddits']),
-                'momentum_score': momentum_score,
-                'top_post': data['top_post']
+                'mentions': int(mentions[ticker_id]),
+                'avg_score': total_score[ticker_id] / mentions[ticker_id],
+                'total_comments': int(total_comments[ticker_id]),
+                'bullish_pct': float(bullish_pct[ticker_id]),
+                'bearish_pct': float(bearish_pct[ticker_id]),
+                'avg_polarity': polarity_sum[ticker_id] / mentions[ticker_id],
+                'subreddit_count': int(subreddit_count[ticker_id]),
+                'subreddits': list(subreddits[ticker_id]),
+                'momentum_score': float(momentum_score[ticker_id]),
+                'top_post': self._top_post_summary(posts, top_post[ticker_id])
             })
 
         # Sort by momentum score
@@ -257,6 +397,56 @@ class MultiSubredditScraper:
 
         return results
 
+    def rank_trending(self, posts: Sequence[Post], top_n: int = 20,
+                      capacity: Optional[int] = None) -> List[Dict]:
+        """
+        Top stocks by momentum in bounded memory: a Space-Saving tracker over
+        the mention stream picks the top_n tickers, then only the posts that
+        mention them are aggregated exactly; aggregate_stock_data stays the
+        exact path over every ticker, for comparison
+        """
+        self.trending = TrendingTracker(capacity or config.TRENDING_CAPACITY)
+        self.trending.add_posts(posts)
+        candidates = {row['ticker']: row for row in self.trending.top(top_n)}
+
+        relevant = [post for post in posts if any(ticker in candidates for ticker in post.tickers)]
+        rows = [row for row in self.aggregate_stock_data(relevant) if row['ticker'] in candidates]
+        for row in rows:
+            # True when the tracker's error bounds can't change the selection
+            row['guaranteed'] = candidates[row['ticker']]['guaranteed']
+        return rows
+
+    @staticmethod
+    def _top_post_summary(posts: Sequence[Post], index: int) -> Optional[Dict]:
+        if index < 0:
+            return None
+        post = posts[index]
+        return {
+            'title': post.title,
+            'score': post.score,
+            'subreddit': post.subreddit,
+            'url': post.url
+        }
+
+    def update_mention_window(self, posts: Sequence[Post]) -> MentionWindow:
+        """Apply only the posts not counted by earlier runs to the saved rolling window"""
+        window = MentionWindow.load()
+        added = window.add_many(posts)
+        window.save()
+        print(f"✓ Rolling window: {added} new posts, {len(posts) - added} already counted")
+        return window
+
+    def print_window_report(self, window: MentionWindow, top_n: int = 5):
+        """Top momentum per horizon, answered from the window's running totals"""
+        print("-" * 70)
+        print("ROLLING MOMENTUM")
+        print("-" * 70)
+        for horizon in DEFAULT_HORIZONS:
+            top = window.top(horizon, top_n)
+            tickers = ', '.join(f"${row['ticker']} ({row['momentum_score']:.0f})" for row in top)
+            print(f"   Last {horizon // 3600}h: {tickers or 'no mentions'}")
+        print()
+
     def get_sentiment_emoji(self, bullish_pct: float, bearish_pct: float) -> str:
         """Get emoji based on sentiment"""
         if bullish_pct >= 60:
@@ -273,7 +463,12 @@ class MultiSubredditScraper:
         print("=" * 70)
         print(f"Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Subreddits Analyzed: {len(self.subreddits)}")
-        print(f"Unique Stocks Found: {len(top_stocks)}")
+        if self.trending is not None:
+            stats = self.trending.stats()
+            print(f"Tickers Monitored: {stats['monitored']:,} of {stats['capacity']:,} "
+                  f"(mention counts within ±{stats['error_bound']:.0f})")
+        else:
+            print(f"Unique Stocks Found: {len(top_stocks)}")
         print()
         print("-" * 70)
         print(f"TOP {top_n} STOCKS BY MOMENTUM")
@@ -301,7 +496,7 @@ class MultiSubredditScraper:
         print("✓ Analysis complete!")
         print()
 
-    def print_summary_metrics(self, all_posts: List[Dict], top_stocks: List[Dict]):
+    def print_summary_metrics(self, all_posts: Sequence[Post], top_stocks: List[Dict]):
         """Print summary metrics about the scraping session"""
         print("=" * 70)
         print("📊 SUMMARY METRICS")
@@ -311,14 +506,16 @@ class MultiSubredditScraper:
         # Calculate metrics
         total_posts = len(all_posts)
         total_stocks = len(top_stocks)
-        total_mentions = sum(stock['mentions'] for stock in top_stocks)
-        total_upvotes = sum(post['score'] for post in all_posts)
-        total_comments = sum(post['num_comments'] for post in all_posts)
+        # With rank_trending, top_stocks is only the top; the tracker saw every mention
+        total_mentions = (self.trending.total if self.trending is not None
+                          else sum(stock['mentions'] for stock in top_stocks))
+        total_upvotes = sum(post.score for post in all_posts)
+        total_comments = sum(post.num_comments for post in all_posts)
 
         # Sentiment breakdown
-        bullish_posts = sum(1 for post in all_posts if post['sentiment'] == 'bullish')
-        bearish_posts = sum(1 for post in all_posts if post['sentiment'] == 'bearish')
-        neutral_posts = sum(1 for post in all_posts if post['sentiment'] == 'neutral')
+        bullish_posts = sum(1 for post in all_posts if post.sentiment == BULLISH)
+        bearish_posts = sum(1 for post in all_posts if post.sentiment == BEARISH)
+        neutral_posts = total_posts - bullish_posts - bearish_posts
 
         # Stocks by sentiment
         highly_bullish = [s for s in top_stocks if s['bullish_pct'] >= 70]
@@ -327,7 +524,7 @@ class MultiSubredditScraper:
         # Subreddit distribution
         subreddit_post_counts = defaultdict(int)
         for post in all_posts:
-            subreddit_post_counts[post['subreddit']] += 1
+            subreddit_post_counts[post.subreddit] += 1
 
         # Top mentioned stocks
         top_5_stocks = top_stocks[:5]
@@ -338,7 +535,10 @@ class MultiSubredditScraper:
         print("📈 DATA COLLECTION:")
         print(f"   Total Posts Scraped: {total_posts:,}")
         print(f"   Total Stock Mentions: {total_mentions:,}")
-        print(f"   Unique Stocks Found: {total_stocks:,}")
+        if self.trending is not None:
+            print(f"   Tickers Monitored: {len(self.trending.entries):,} (top {total_stocks} ranked)")
+        else:
+            print(f"   Unique Stocks Found: {total_stocks:,}")
         print(f"   Total Upvotes: {total_upvotes:,}")
         print(f"   Total Comments: {total_comments:,}")
         print()
@@ -390,18 +590,26 @@ def main():
     # Initialize scraper
     scraper = MultiSubredditScraper()
 
-    # Scrape all subreddits
-    all_posts = scraper.scrape_all_subreddits(posts_per_sub=100)
+    # Scrape all subreddits (concurrently; scrape_all_subreddits is the sequential path)
+    all_posts = scraper.scrape_all_subreddits_async(posts_per_sub=100)
+
+    # Most ticker chatter is in the comments of the busiest threads
+    all_posts.extend(scraper.harvest_comments())
 
-    # Aggregate stock data
-    print("📊 Aggregating stock mentions across all subreddits...")
-    top_stocks = scraper.aggregate_stock_data(all_posts)
-    print(f"✓ Aggregated data for {len(top_stocks)} unique stocks")
+    # Rank trending stocks (aggregate_stock_data is the exact, every-ticker path)
+    print("📊 Ranking stock mentions across all subreddits...")
+    top_stocks = scraper.rank_trending(all_posts, top_n=20)
+    guaranteed = sum(stock['guaranteed'] for stock in top_stocks)
+    print(f"✓ Ranked the top {len(top_stocks)} stocks ({guaranteed} certain to be top {len(top_stocks)})")
     print()
 
     # Print report
     scraper.print_report(top_stocks, top_n=10)
 
+    # Fold this run into the rolling window kept across scheduled runs
+    window = scraper.update_mention_window(all_posts)
+    scraper.print_window_report(window)
+
     # Print summary metrics
     scraper.print_summary_metrics(all_posts, top_stocks)
 
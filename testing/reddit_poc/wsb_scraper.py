@@ -4,16 +4,24 @@ Combs through top posts to extract stock mentions and sentiment
 combs thru 100 posts, lists top 20 stocks and their momentum
 """
 
+import heapq
 import praw
-import re
+import sys
 from datetime import datetime
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Make the penguin package importable when run from this directory
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from penguin.social.records import MentionAggregate, Post, PostStore, analyze_mentions
+from penguin.social.sentiment import SentimentScorer
+from penguin.social.tickers import TickerExtractor
+
 # Reddit API credentials (you'll need to create these)
 # Visit https://www.reddit.com/prefs/apps to create an app
 REDDIT_CLIENT_ID = os.getenv('REDDIT_CLIENT_ID', 'your_client_id_here')
@@ -32,9 +40,6 @@ class WSBScraper:
             user_agent=REDDIT_USER_AGENT
         )
 
-        # Common stock ticker pattern (1-5 capital letters)
-        self.ticker_pattern = re.compile(r'\b[A-Z]{1,5}\b')
-
         # Words to exclude (common false positives)
         self.exclude_words = {
             'A', 'I', 'DD', 'YOLO', 'WSB', 'CEO', 'CFO', 'IPO', 'ETF',
@@ -44,149 +49,88 @@ class WSBScraper:
             'EDIT', 'TLDR', 'TL', 'DR', 'OR', 'AND', 'THE', 'FOR'
         }
 
+        # Single-pass extractor compiled from the excluded words above
+        self.ticker_extractor = TickerExtractor(excluded=self.exclude_words)
+
+        # Sentiment lexicons, compiled once into a whole-word scorer
+        self.sentiment_scorer = SentimentScorer(
+            bullish=[
+                'moon', 'rocket', 'buy', 'calls', 'bullish', 'pump',
+                'rally', 'squeeze', 'tendies', 'gains', 'up', 'long',
+                'green', 'breakout', 'support', 'diamond hands'
+            ],
+            bearish=[
+                'crash', 'dump', 'puts', 'bearish', 'short', 'down',
+                'red', 'sell', 'drop', 'fall', 'tank', 'rekt',
+                'rug pull', 'bag holder', 'dead cat'
+            ]
+        )
+
     def extract_tickers(self, text: str) -> List[str]:
         """Extract potential stock tickers from text"""
-        if not text:
-            return []
-
-        # Find all potential tickers
-        potential_tickers = self.ticker_pattern.findall(text)
-
-        # Filter out excluded words and duplicates
-        tickers = [
-            ticker for ticker in potential_tickers
-            if ticker not in self.exclude_words
-        ]
-
-        return tickers
+        return self.ticker_extractor.extract(text)
 
     def analyze_sentiment(self, text: str) -> str:
         """Basic sentiment analysis (bullish/bearish/neutral)"""
-        if not text:
-            return 'neutral'
+        return self.sentiment_scorer.label(text)
 
-        text_lower = text.lower()
-
-        # Bullish indicators
-        bullish_words = [
-            'moon', 'rocket', 'buy', 'calls', 'bullish', 'pump',
-            'rally', 'squeeze', 'tendies', 'gains', 'up', 'long',
-            'green', 'breakout', 'support', 'diamond hands'
-        ]
-
-        # Bearish indicators
-        bearish_words = [
-            'crash', 'dump', 'puts', 'bearish', 'short', 'down',
-            'red', 'sell', 'drop', 'fall', 'tank', 'rekt',
-            'rug pull', 'bag holder', 'dead cat'
-        ]
-
-        bullish_count = sum(1 for word in bullish_words if word in text_lower)
-        bearish_count = sum(1 for word in bearish_words if word in text_lower)
-
-        if bullish_count > bearish_count:
-            return 'bullish'
-        elif bearish_count > bullish_count:
-            return 'bearish'
-        else:
-            return 'neutral'
-
-    def scrape_hot_posts(self, limit: int = 50) -> List[Dict]:
+    def scrape_hot_posts(self, limit: int = 50) -> PostStore:
         """Scrape hot posts from r/wallstreetbets"""
         print(f"Fetching top {limit} hot posts from r/wallstreetbets...")
 
         subreddit = self.reddit.subreddit('wallstreetbets')
-        posts = []
+        posts = PostStore()
 
-        for submission in subreddit.hot(limit=limit):
-            # Skip stickied posts
-            if submission.stickied:
-                continue
+        # Skip stickied posts
+        submissions = [s for s in subreddit.hot(limit=limit) if not s.stickied]
 
+        # Sentiment analysis for the whole batch in one call
+        combined_texts = [f"{s.title} {s.selftext}" for s in submissions]
+        sentiments = self.sentiment_scorer.score(combined_texts).label.tolist()
+
+        for submission, sentiment in zip(submissions, sentiments):
             # Extract tickers from title and selftext
             title_tickers = self.extract_tickers(submission.title)
             body_tickers = self.extract_tickers(submission.selftext)
-            all_tickers = title_tickers + body_tickers
-
-            # Sentiment analysis
-            combined_text = f"{submission.title} {submission.selftext}"
-            sentiment = self.analyze_sentiment(combined_text)
-
-            post_data = {
-                'title': submission.title,
-                'author': str(submission.author),
-                'score': submission.score,
-                'upvote_ratio': submission.upvote_ratio,
-                'num_comments': submission.num_comments,
-                'created_utc': datetime.fromtimestamp(submission.created_utc),
-                'url': submission.url,
-                'tickers': all_tickers,
-                'sentiment': sentiment,
-                'awards': submission.total_awards_received
-            }
-
-            posts.append(post_data)
+
+            posts.add(Post(
+                post_id=submission.id,
+                subreddit='wallstreetbets',
+                title=submission.title,
+                author=str(submission.author),
+                score=submission.score,
+                upvote_ratio=submission.upvote_ratio,
+                num_comments=submission.num_comments,
+                created_utc=submission.created_utc,
+                url=submission.url,
+                tickers=title_tickers + body_tickers,
+                sentiment=sentiment,
+                awards=submission.total_awards_received
+            ))
 
         print(f"✓ Scraped {len(posts)} posts")
         return posts
 
-    def analyze_mentions(self, posts: List[Dict]) -> Dict[str, Dict]:
-        """Analyze ticker mentions across all posts"""
-        ticker_data = {}
-
-        for post in posts:
-            for ticker in post['tickers']:
-                if ticker not in ticker_data:
-                    ticker_data[ticker] = {
-                        'mention_count': 0,
-                        'total_score': 0,
-                        'total_comments': 0,
-                        'bullish_count': 0,
-                        'bearish_count': 0,
-                        'neutral_count': 0,
-                        'posts': []
-                    }
-
-                ticker_data[ticker]['mention_count'] += 1
-                ticker_data[ticker]['total_score'] += post['score']
-                ticker_data[ticker]['total_comments'] += post['num_comments']
-
-                # Track sentiment
-                if post['sentiment'] == 'bullish':
-                    ticker_data[ticker]['bullish_count'] += 1
-                elif post['sentiment'] == 'bearish':
-                    ticker_data[ticker]['bearish_count'] += 1
-                else:
-                    ticker_data[ticker]['neutral_count'] += 1
-
-                # Store reference to post
-                ticker_data[ticker]['posts'].append({
-                    'title': post['title'],
-                    'score': post['score'],
-                    'sentiment': post['sentiment']
-                })
-
-        return ticker_data
-
-    def get_trending_stocks(self, ticker_data: Dict, min_mentions: int = 3) -> List[Tuple[str, Dict]]:
-        """Get trending stocks sorted by mention count"""
+    def analyze_mentions(self, posts: PostStore) -> Dict[str, MentionAggregate]:
+        """Analyze ticker mentions across all posts (aggregates reference posts by index)"""
+        return analyze_mentions(posts)
+
+    def get_trending_stocks(self, ticker_data: Dict[str, MentionAggregate], min_mentions: int = 3,
+                            limit: Optional[int] = None) -> List[Tuple[str, MentionAggregate]]:
+        """Get trending stocks sorted by mention count (only the top `limit` are ranked)"""
         # Filter by minimum mentions
-        filtered = {
-            ticker: data
+        filtered = (
+            (ticker, data)
             for ticker, data in ticker_data.items()
-            if data['mention_count'] >= min_mentions
-        }
-
-        # Sort by mention count (descending)
-        sorted_tickers = sorted(
-            filtered.items(),
-            key=lambda x: x[1]['mention_count'],
-            reverse=True
+            if data.mention_count >= min_mentions
         )
 
-        return sorted_tickers
+        # Sort by mention count (descending); a bounded heap when only the top is wanted
+        if limit is not None:
+            return heapq.nlargest(limit, filtered, key=lambda x: x[1].mention_count)
+        return sorted(filtered, key=lambda x: x[1].mention_count, reverse=True)
 
-    def print_report(self, posts: List[Dict], ticker_data: Dict):
+    def print_report(self, posts: PostStore, ticker_data: Dict[str, MentionAggregate]):
         """Print analysis report"""
         print("\n" + "="*70)
         print("r/WALLSTREETBETS ANALYSIS REPORT")
@@ -196,7 +140,7 @@ class WSBScraper:
         print(f"Unique Tickers Found: {len(ticker_data)}")
 
         # Get trending stocks
-        trending = self.get_trending_stocks(ticker_data, min_mentions=3)
+        trending = self.get_trending_stocks(ticker_data, min_mentions=3, limit=20)
 
         print("\n" + "-"*70)
         print("TOP TRENDING STOCKS (Min 3 mentions)")
@@ -204,9 +148,9 @@ class WSBScraper:
 
         for i, (ticker, data) in enumerate(trending[:20], 1):
             # Calculate sentiment ratio
-            total_sentiment = data['bullish_count'] + data['bearish_count'] + data['neutral_count']
-            bullish_pct = (data['bullish_count'] / total_sentiment * 100) if total_sentiment > 0 else 0
-            bearish_pct = (data['bearish_count'] / total_sentiment * 100) if total_sentiment > 0 else 0
+            total_sentiment = data.bullish_count + data.bearish_count + data.neutral_count
+            bullish_pct = (data.bullish_count / total_sentiment * 100) if total_sentiment > 0 else 0
+            bearish_pct = (data.bearish_count / total_sentiment * 100) if total_sentiment > 0 else 0
 
             # Determine overall sentiment
             if bullish_pct > bearish_pct + 20:
@@ -216,17 +160,17 @@ class WSBScraper:
             else:
                 sentiment_indicator = "⚖️  NEUTRAL"
 
-            avg_score = data['total_score'] / data['mention_count']
+            avg_score = data.total_score / data.mention_count
 
             print(f"\n{i}. ${ticker}")
-            print(f"   Mentions: {data['mention_count']}")
+            print(f"   Mentions: {data.mention_count}")
             print(f"   Avg Score: {avg_score:.1f} upvotes")
             print(f"   Sentiment: {sentiment_indicator} ({bullish_pct:.0f}% bull / {bearish_pct:.0f}% bear)")
-            print(f"   Total Comments: {data['total_comments']}")
+            print(f"   Total Comments: {data.total_comments}")
 
             # Show top post for this ticker
-            top_post = max(data['posts'], key=lambda x: x['score'])
-            print(f"   Top Post: \"{top_post['title'][:60]}...\" ({top_post['score']} upvotes)")
+            top_post = data.top_post(posts)
+            print(f"   Top Post: \"{top_post.title[:60]}...\" ({top_post.score} upvotes)")
 
         print("\n" + "="*70)
 
@@ -235,13 +179,13 @@ class WSBScraper:
         print("-"*70)
         high_momentum = [
             (ticker, data) for ticker, data in trending
-            if data['mention_count'] >= 5
+            if data.mention_count >= 5
         ]
 
         for ticker, data in high_momentum[:10]:
-            bullish_pct = (data['bullish_count'] / data['mention_count'] * 100)
-            momentum_score = data['mention_count'] * (1 + bullish_pct/100)
-            print(f"${ticker}: {data['mention_count']} mentions, "
+            bullish_pct = (data.bullish_count / data.mention_count * 100)
+            momentum_score = data.mention_count * (1 + bullish_pct/100)
+            print(f"${ticker}: {data.mention_count} mentions, "
                   f"{bullish_pct:.0f}% bullish, "
                   f"Momentum Score: {momentum_score:.1f}")
 
@@ -7,11 +7,12 @@ import sys
 import os
 import time
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Add parent directories to path to import from other PoCs
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'reddit_poc'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'yahoo_poc'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 # Import Reddit scraper
 from multi_subreddit_scraper import MultiSubredditScraper
@@ -20,6 +21,11 @@ from multi_subreddit_scraper import MultiSubredditScraper
 import yfinance as yf
 import pandas as pd
 
+from penguin.core.cache import get_cache
+from penguin.market.history import history_for
+from penguin.market.ohlcv_cache import OHLCVCache
+from penguin.market.universe import SymbolUniverse, UNKNOWN, VALID
+
 
 class CombinedRedditYahooScraper:
     """Combine Reddit sentiment with Yahoo Finance fundamentals"""
@@ -28,18 +34,39 @@ class CombinedRedditYahooScraper:
         """Initialize both scrapers"""
         self.reddit_scraper = MultiSubredditScraper()
 
-    def verify_ticker(self, ticker: str) -> bool:
-        """Verify if a ticker is valid via Yahoo Finance (quick check)"""
+        # Local listing snapshot + cached checks, so known symbols skip Yahoo
+        self.universe = SymbolUniverse().load()
+
+        # On-disk OHLCV bars; repeated runs only fetch the missing tail
+        self.price_cache = OHLCVCache()
+
+        # Read-through cache for Ticker.info (shared with verify_ticker)
+        self.info_cache = get_cache()
+
+    def fetch_info(self, ticker: str, delay: float = 1.0) -> Dict:
+        """Ticker.info, served from cache within the yahoo_info TTL"""
+        def fetch():
+            time.sleep(delay)  # Rate limit only actual requests
+            return yf.Ticker(ticker).info
+
+        return self.info_cache.get_or_fetch('yahoo_info', fetch, symbol=ticker)
+
+    def verify_ticker(self, ticker: str) -> Optional[bool]:
+        """
+        Verify if a ticker is valid via Yahoo Finance (quick check)
+        Returns None when the check itself failed, so it is not cached as invalid
+        """
         try:
-            time.sleep(1)  # Brief rate limit
-            stock = yf.Ticker(ticker)
-            # Try to get current price - if it fails, ticker is invalid
-            info = stock.info
-            if info.get('regularMarketPrice') or info.get('currentPrice'):
-                return True
-            return False
-        except:
-            return False
+            info = self.fetch_info(ticker)
+        except Exception as e:
+            # Yahoo answers unknown symbols with a 404; anything else is transient
+            if '404' in str(e) or 'not found' in str(e).lower():
+                return False
+            print(f"(lookup failed: {e})", end=" ")
+            return None
+
+        # Try to get current price - if there is none, ticker is invalid
+        return bool(info.get('regularMarketPrice') or info.get('currentPrice'))
 
     def get_reddit_top_stocks(self, limit: int = 10) -> List[Dict]:
         """Get top stocks from Reddit analysis with ticker verification"""
@@ -63,6 +90,7 @@ class CombinedRedditYahooScraper:
         verified_stocks = []
         idx = 0
         checked = 0
+        network_checks = 0
 
         while len(verified_stocks) < limit and idx < len(top_stocks):
             stock = top_stocks[idx]
@@ -71,31 +99,53 @@ class CombinedRedditYahooScraper:
 
             print(f"  [{checked}] Checking ${ticker}...", end=" ")
 
-            if self.verify_ticker(ticker):
+            # Only symbols the universe has never seen cost a Yahoo request
+            status = self.universe.status(ticker)
+            if status == UNKNOWN:
+                is_valid = self.verify_ticker(ticker)
+                if is_valid is not None:
+                    self.universe.record(ticker, is_valid)
+                network_checks += 1
+            else:
+                is_valid = status == VALID
+
+            if is_valid:
                 verified_stocks.append(stock)
                 print(f"✓ Valid (#{len(verified_stocks)} in top {limit})")
+            elif is_valid is None:
+                print("? Could not verify, skipping this run")
             else:
                 print(f"✗ Invalid ticker, skipping")
 
             idx += 1
 
+        if network_checks:
+            self.universe.save_checks()
+
         print()
-        print(f"✓ Verified {len(verified_stocks)} valid tickers out of {checked} checked")
+        print(f"✓ Verified {len(verified_stocks)} valid tickers out of {checked} checked "
+              f"({network_checks} needed a Yahoo lookup)")
         print()
 
         return verified_stocks
 
-    def get_yahoo_data(self, ticker: str) -> Dict:
-        """Get comprehensive Yahoo Finance data including mean reversion indicators"""
+    def get_yahoo_data(self, ticker: str, hist: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Get comprehensive Yahoo Finance data including mean reversion indicators
+        Pass `hist` (from a bulk download) to skip the per-ticker history request
+        """
         try:
-            # Rate limiting: 2 seconds between Yahoo requests
-            time.sleep(2)
+            if hist is None:
+                # Rate limiting: 2 seconds between Yahoo requests
+                time.sleep(2)
+                hist = yf.Ticker(ticker).history(period='3mo')  # Get 3 months for better analysis
+            else:
+                hist = hist.copy()
 
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period='3mo')  # Get 3 months for better analysis
+            # Only the (cached) info request remains per ticker
+            info = self.fetch_info(ticker)
 
-            if hist.empty:
+            if hist is None or hist.empty:
                 return None
 
             # Basic price metrics
@@ -197,7 +247,16 @@ class CombinedRedditYahooScraper:
         print("=" * 70)
         print()
         print(f"Fetching Yahoo Finance data for top {len(reddit_stocks)} stocks...")
-        print("(2-second delay between requests to respect rate limits)")
+
+        # One multi-ticker request for all price history
+        tickers = [stock['ticker'] for stock in reddit_stocks]
+        try:
+            history = self.price_cache.get(tickers, period='3mo')
+        except Exception as e:
+            print(f"  ⚠️  Bulk history download failed, falling back per ticker: {str(e)[:50]}")
+            history = None
+
+        print("(1-second delay between info requests to respect rate limits)")
         print()
 
         combined_data = []
@@ -206,7 +265,8 @@ class CombinedRedditYahooScraper:
             ticker = reddit_stock['ticker']
             print(f"[{idx}/{len(reddit_stocks)}] Fetching ${ticker}...", end=" ")
 
-            yahoo_data = self.get_yahoo_data(ticker)
+            hist = history_for(history, ticker) if history is not None else None
+            yahoo_data = self.get_yahoo_data(ticker, hist=hist)
 
             if yahoo_data:
                 # Combine Reddit and Yahoo data
@@ -6,9 +6,18 @@ Demonstrates fetching real-time stock data and basic analysis
 
 import yfinance as yf
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
 import pandas as pd
 import time
+import sys
+import os
+
+# Make the penguin package importable when run from this directory
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from penguin.core.cache import get_cache
+from penguin.market.history import history_for
+from penguin.market.ohlcv_cache import OHLCVCache
 
 
 class YahooFinanceScraper:
@@ -16,14 +25,24 @@ class YahooFinanceScraper:
 
     def __init__(self):
         """Initialize scraper"""
-        self.data_cache = {}
+        # On-disk OHLCV bars; repeated runs only fetch the missing tail
+        self.data_cache = OHLCVCache()
+
+        # Read-through cache for quote/info lookups (Redis or in-process)
+        self.info_cache = get_cache()
+
+    def fetch_info(self, ticker: str) -> Dict:
+        """Ticker.info, served from cache within the yahoo_info TTL"""
+        def fetch():
+            time.sleep(1)  # Rate limiting: 1 second between requests
+            return yf.Ticker(ticker).info
+
+        return self.info_cache.get_or_fetch('yahoo_info', fetch, symbol=ticker)
 
     def get_stock_info(self, ticker: str) -> Dict:
         """Get comprehensive stock information"""
         try:
-            time.sleep(1)  # Rate limiting: 1 second between requests
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self.fetch_info(ticker)
 
             return {
                 'symbol': ticker,
@@ -54,17 +73,27 @@ class YahooFinanceScraper:
         period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
         """
         try:
-            time.sleep(1)  # Rate limiting: 1 second between requests
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
-            return hist
+            return self.data_cache.history(ticker, period=period)
         except Exception as e:
             print(f"Error fetching historical data for {ticker}: {e}")
             return None
 
-    def calculate_momentum(self, ticker: str, days: int = 30) -> Dict:
-        """Calculate momentum indicators"""
-        hist = self.get_historical_data(ticker, period=f'{days}d')
+    def get_historical_data_batch(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        """
+        Get historical price data for many tickers in one multi-ticker request
+        Returns a frame with (field, symbol) columns, e.g. frame['Close'][ticker]
+        """
+        try:
+            return self.data_cache.get(tickers, period=period)
+        except Exception as e:
+            print(f"Error fetching historical data for {len(tickers)} tickers: {e}")
+            return None
+
+    def calculate_momentum(self, ticker: str, days: int = 30,
+                           hist: Optional[pd.DataFrame] = None) -> Dict:
+        """Calculate momentum indicators (pass `hist` to reuse a bulk download)"""
+        if hist is None:
+            hist = self.get_historical_data(ticker, period=f'{days}d')
 
         if hist is None or hist.empty:
             return None
@@ -94,23 +123,46 @@ class YahooFinanceScraper:
             'days_analyzed': len(hist)
         }
 
-    def analyze_multiple_stocks(self, tickers: List[str]) -> pd.DataFrame:
-        """Analyze multiple stocks and compare"""
-        results = []
+    def analyze_multiple_stocks(self, tickers: List[str], days: int = 30) -> pd.DataFrame:
+        """Analyze multiple stocks and compare (one bulk download, column-wise math)"""
+        print(f"Fetching {days}-day history for {len(tickers)} tickers...")
+        frame = self.get_historical_data_batch(tickers, period=f'{days}d')
 
-        for ticker in tickers:
-            print(f"Analyzing {ticker}...")
-            momentum = self.calculate_momentum(ticker)
+        if frame is None or frame.empty:
+            return pd.DataFrame()
+
+        close = frame['Close']
+        volume = frame['Volume']
 
-            if momentum:
-                results.append(momentum)
+        # Each column is one symbol; NaNs mark days a symbol did not trade
+        current_price = close.ffill().iloc[-1]
+        start_price = close.bfill().iloc[0]
+        total_return = ((current_price - start_price) / start_price) * 100
 
-        df = pd.DataFrame(results)
-        return df.sort_values('30d_return', ascending=False)
+        avg_volume = volume.mean()
+        recent_volume = volume.iloc[-5:].mean()
+        volume_change = ((recent_volume - avg_volume) / avg_volume) * 100
 
-    def detect_signals(self, ticker: str) -> Dict:
+        volatility = close.pct_change(fill_method=None).std() * 100
+
+        df = pd.DataFrame({
+            'ticker': close.columns,
+            'current_price': current_price.values,
+            f'{days}d_return': total_return.values,
+            'avg_volume': avg_volume.reindex(close.columns).values,
+            'recent_volume': recent_volume.reindex(close.columns).values,
+            'volume_change_pct': volume_change.reindex(close.columns).values,
+            'volatility': volatility.values,
+            'days_analyzed': close.notna().sum().values
+        })
+        return df.sort_values(f'{days}d_return', ascending=False)
+
+    def detect_signals(self, ticker: str, hist: Optional[pd.DataFrame] = None) -> Dict:
         """Detect trading signals based on simple technical analysis"""
-        hist = self.get_historical_data(ticker, period='3mo')
+        if hist is None:
+            hist = self.get_historical_data(ticker, period='3mo')
+        else:
+            hist = hist.copy()
 
         if hist is None or hist.empty:
             return None
@@ -161,6 +213,18 @@ class YahooFinanceScraper:
             'signals': signals
         }
 
+    def detect_signals_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Detect signals for many tickers from one bulk 3-month download"""
+        frame = self.get_historical_data_batch(tickers, period='3mo')
+        results = {}
+
+        for ticker in tickers:
+            hist = history_for(frame, ticker)
+            if hist is not None:
+                results[ticker] = self.detect_signals(ticker, hist=hist)
+
+        return results
+
 
 def main():
     """Main execution - Demo analysis"""
@@ -204,9 +268,10 @@ def main():
     print("TECHNICAL SIGNALS")
     print("=" * 70)
 
-    for ticker in tickers[:1]:
-        print(f"Analyzing signals for {ticker}...")
-        signals_data = scraper.detect_signals(ticker)
+    print(f"Analyzing signals for {', '.join(tickers)}...")
+    all_signals = scraper.detect_signals_batch(tickers)
+
+    for ticker, signals_data in all_signals.items():
         if signals_data:
             print(f"\n${ticker} - ${signals_data['current_price']:.2f}")
             print(f"  RSI: {signals_data['rsi']:.1f}")